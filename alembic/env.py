@@ -18,9 +18,9 @@ from app.core.database import Base
 # 모든 모델 import (Alembic이 테이블을 인식하도록)
 from app.models import (
     User, RefreshToken,
-    Book, BookView,
+    Book, BookView, BookViewCount, BookRatingStats, BookTrendingScore, BookTrendingState,
     Review, ReviewLike, ReviewLikeCount,
-    Comment, CommentLike,
+    Comment, CommentLike, CommentLikeCount,
     Cart, Favorite,
     Order, OrderItem,
     Coupon, UserCoupon
@@ -0,0 +1,46 @@
+"""Add book_view_counts aggregate table
+
+Revision ID: 3c1a7e9d2b40
+Revises: ff6b273e67dc
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1a7e9d2b40'
+down_revision: Union[str, None] = 'ff6b273e67dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('book_view_counts',
+    sa.Column('book_id', sa.Integer(), nullable=False, comment='도서 ID'),
+    sa.Column('view_count', sa.Integer(), nullable=False, comment='누적 조회수'),
+    sa.Column('rolled_up_count', sa.Integer(), nullable=False, comment='books_view에서 압축(삭제)되어 집계에만 남은 조회수'),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False, comment='마지막 업데이트 일시'),
+    sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('book_id')
+    )
+    op.create_index(op.f('ix_book_view_counts_view_count'), 'book_view_counts', ['view_count'], unique=False)
+
+    # 기존 조회 기록으로 집계 테이블 채우기
+    op.execute(
+        """
+        INSERT INTO book_view_counts (book_id, view_count, rolled_up_count, updated_at)
+        SELECT b.id, COUNT(v.id), 0, CURRENT_TIMESTAMP
+        FROM books b
+        LEFT JOIN books_view v ON v.book_id = b.id
+        GROUP BY b.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_book_view_counts_view_count'), table_name='book_view_counts')
+    op.drop_table('book_view_counts')
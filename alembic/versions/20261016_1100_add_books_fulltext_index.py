@@ -0,0 +1,34 @@
+"""Add ngram fulltext index for book keyword search
+
+Revision ID: 8f2d4b6a1c93
+Revises: 3c1a7e9d2b40
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2d4b6a1c93'
+down_revision: Union[str, None] = '3c1a7e9d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 한글 검색을 위해 ngram 파서 사용 (MySQL 전용)
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.create_index(
+        'ft_books_search', 'books', ['title', 'author', 'publisher'],
+        unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.drop_index('ft_books_search', table_name='books')
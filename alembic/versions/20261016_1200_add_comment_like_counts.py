@@ -0,0 +1,43 @@
+"""Add comment_like_counts aggregate table
+
+Revision ID: 5b7e2c9f4a18
+Revises: 8f2d4b6a1c93
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2c9f4a18'
+down_revision: Union[str, None] = '8f2d4b6a1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('comment_like_counts',
+    sa.Column('comment_id', sa.Integer(), nullable=False, comment='댓글 ID'),
+    sa.Column('like_count', sa.Integer(), nullable=False, comment='좋아요 수 캐시'),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False, comment='마지막 업데이트 일시'),
+    sa.ForeignKeyConstraint(['comment_id'], ['comments.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('comment_id')
+    )
+
+    # 기존 댓글 좋아요로 집계 테이블 채우기
+    op.execute(
+        """
+        INSERT INTO comment_like_counts (comment_id, like_count, updated_at)
+        SELECT c.id, COUNT(l.id), CURRENT_TIMESTAMP
+        FROM comments c
+        LEFT JOIN comment_likes l ON l.comment_id = c.id
+        GROUP BY c.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('comment_like_counts')
@@ -0,0 +1,32 @@
+"""Add users.token_version for access token revocation
+
+Revision ID: 9d3f7a2c6e51
+Revises: 5b7e2c9f4a18
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f7a2c6e51'
+down_revision: Union[str, None] = '5b7e2c9f4a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column(
+        'token_version',
+        sa.Integer(),
+        server_default='0',
+        nullable=False,
+        comment='토큰 버전 (역할 변경 시 증가, 이전 버전의 액세스 토큰 무효화)'
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,62 @@
+"""Add book_rating_stats aggregate table
+
+Revision ID: 2e8b5d1f7c36
+Revises: 9d3f7a2c6e51
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e8b5d1f7c36'
+down_revision: Union[str, None] = '9d3f7a2c6e51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('book_rating_stats',
+    sa.Column('book_id', sa.Integer(), nullable=False, comment='도서 ID'),
+    sa.Column('review_count', sa.Integer(), nullable=False, comment='리뷰 수'),
+    sa.Column('rating_sum', sa.Integer(), nullable=False, comment='평점 합계'),
+    sa.Column('avg_rating', sa.DECIMAL(precision=3, scale=2), nullable=False, comment='평균 평점 (리뷰가 없으면 0)'),
+    sa.Column('rating_1', sa.Integer(), nullable=False, comment='1점 리뷰 수'),
+    sa.Column('rating_2', sa.Integer(), nullable=False, comment='2점 리뷰 수'),
+    sa.Column('rating_3', sa.Integer(), nullable=False, comment='3점 리뷰 수'),
+    sa.Column('rating_4', sa.Integer(), nullable=False, comment='4점 리뷰 수'),
+    sa.Column('rating_5', sa.Integer(), nullable=False, comment='5점 리뷰 수'),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False, comment='마지막 업데이트 일시'),
+    sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('book_id')
+    )
+    op.create_index(op.f('ix_book_rating_stats_avg_rating'), 'book_rating_stats', ['avg_rating'], unique=False)
+
+    # 기존 리뷰로 집계 테이블 채우기
+    op.execute(
+        """
+        INSERT INTO book_rating_stats (
+            book_id, review_count, rating_sum, avg_rating,
+            rating_1, rating_2, rating_3, rating_4, rating_5, updated_at
+        )
+        SELECT b.id, COUNT(r.id), COALESCE(SUM(r.rating), 0),
+               CASE WHEN COUNT(r.id) > 0 THEN ROUND(SUM(r.rating) * 1.0 / COUNT(r.id), 2) ELSE 0 END,
+               COALESCE(SUM(CASE WHEN r.rating = 1 THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN r.rating = 2 THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN r.rating = 3 THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN r.rating = 4 THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN r.rating = 5 THEN 1 ELSE 0 END), 0),
+               CURRENT_TIMESTAMP
+        FROM books b
+        LEFT JOIN reviews r ON r.book_id = b.id
+        GROUP BY b.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_book_rating_stats_avg_rating'), table_name='book_rating_stats')
+    op.drop_table('book_rating_stats')
@@ -0,0 +1,49 @@
+"""Add book_trending_scores and book_trending_state tables
+
+Revision ID: 7b4e1c9a5d28
+Revises: 2e8b5d1f7c36
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b4e1c9a5d28'
+down_revision: Union[str, None] = '2e8b5d1f7c36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 점수는 백그라운드 작업이 최초 실행 시 최근 이벤트로 채움
+    op.create_table('book_trending_scores',
+    sa.Column('book_id', sa.Integer(), nullable=False, comment='도서 ID'),
+    sa.Column('period', sa.String(length=8), nullable=False, comment='집계 기간 (1h, 24h, 7d: 점수 반감기)'),
+    sa.Column('score', sa.Float(), nullable=False, comment='시간 감쇠 점수 (book_trending_state.epoch 기준, Σ 가중치 × 2^((발생 시각 - epoch) / 반감기))'),
+    sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('book_id', 'period')
+    )
+    op.create_index('ix_book_trending_scores_period_score', 'book_trending_scores', ['period', 'score'], unique=False)
+
+    op.create_table('book_trending_state',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False, comment='상태 ID (항상 1)'),
+    sa.Column('last_view_id', sa.Integer(), nullable=False, comment='마지막으로 반영한 books_view ID'),
+    sa.Column('last_favorite_id', sa.Integer(), nullable=False, comment='마지막으로 반영한 favorites ID'),
+    sa.Column('last_order_item_id', sa.Integer(), nullable=False, comment='마지막으로 반영한 order_items ID'),
+    sa.Column('pending_view_ids', sa.JSON(), nullable=False, comment='재확인할 books_view 빈 ID ([ID, 처음 발견 일시])'),
+    sa.Column('pending_favorite_ids', sa.JSON(), nullable=False, comment='재확인할 favorites 빈 ID ([ID, 처음 발견 일시])'),
+    sa.Column('pending_order_item_ids', sa.JSON(), nullable=False, comment='재확인할 order_items 빈 ID ([ID, 처음 발견 일시])'),
+    sa.Column('epoch', sa.DateTime(), nullable=False, comment='점수 기준 시각 (float 범위 유지를 위해 주기적으로 이동)'),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False, comment='마지막 갱신 일시'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('book_trending_state')
+    op.drop_index('ix_book_trending_scores_period_score', table_name='book_trending_scores')
+    op.drop_table('book_trending_scores')
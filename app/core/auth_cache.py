@@ -0,0 +1,200 @@
+"""
+Auth Cache
+액세스 토큰 디코딩 결과 및 사용자 Principal 캐시
+"""
+import hashlib
+import logging
+import math
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import decode_token, verify_token_type
+from app.models import User, UserRole
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # redis 미설치 환경 (memory:// 저장소만 사용)
+    RedisError = ConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+class RedisTokenVersionCache:
+    """
+    Redis 프로토콜 서버에 사용자별 토큰 버전을 저장하는 공유 캐시 (TTLCache와 같은 get/set/delete/clear)
+
+    한 워커에서 무효화(DEL)하면 다른 워커도 다음 요청부터 DB의 새 버전을 사용합니다.
+    Redis 명령은 GET / SET EX / DEL / SCAN만 사용하며, 장애 시 조회는 캐시 miss(DB 조회)로 처리합니다.
+
+    URI: redis://host:port/db (client 인자로 클라이언트 객체를 직접 전달 가능)
+    """
+
+    KEY_PREFIX = "authcache:tv:"
+    ERRORS = (RedisError, ConnectionError, TimeoutError, OSError)
+
+    def __init__(self, uri: Optional[str] = None, ttl: float = 5.0, client: Any = None):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(uri, socket_timeout=0.5)
+        self.client = client
+        self.ttl = ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            raw = self.client.get(f"{self.KEY_PREFIX}{key}")
+        except self.ERRORS:
+            logger.warning("Token version cache unavailable", exc_info=True)
+            return default
+        return default if raw is None else int(raw)
+
+    def set(self, key: Hashable, value: int, ttl: Optional[float] = None) -> None:
+        try:
+            self.client.set(f"{self.KEY_PREFIX}{key}", value, ex=max(math.ceil(self.ttl if ttl is None else ttl), 1))
+        except self.ERRORS:
+            logger.warning("Token version cache unavailable", exc_info=True)
+
+    def delete(self, key: Hashable) -> None:
+        try:
+            self.client.delete(f"{self.KEY_PREFIX}{key}")
+        except self.ERRORS:
+            # 무효화 실패 시 다른 워커는 TTL 만료까지 이전 버전 사용
+            logger.warning("Token version invalidation failed: user %s", key, exc_info=True)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.KEY_PREFIX + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_token_version_cache(uri: str, ttl: float, max_size: int):
+    """
+    URI로 토큰 버전 캐시 생성 (memory://: 프로세스별 TTLCache, redis://: 워커 간 공유)
+
+    Raises:
+        ValueError: 지원하지 않는 스킴
+    """
+    scheme = uri.split("://", 1)[0]
+    if scheme == "memory":
+        return TTLCache(ttl=ttl, max_size=max_size)
+    if scheme in ("redis", "rediss"):
+        return RedisTokenVersionCache(uri, ttl=ttl)
+    raise ValueError(f"Unsupported token version cache: {uri}")
+
+
+# 토큰 해시 → 검증된 payload (토큰 만료 시각을 넘겨 유지하지 않음)
+token_cache = TTLCache(ttl=settings.AUTH_CACHE_TTL_SECONDS, max_size=settings.AUTH_CACHE_MAX_SIZE)
+# 사용자 ID → Principal (역할/프로필 변경, 계정 삭제 시 무효화, 프로세스별)
+principal_cache = TTLCache(ttl=settings.AUTH_CACHE_TTL_SECONDS, max_size=settings.AUTH_CACHE_MAX_SIZE)
+# 사용자 ID → 현재 토큰 버전 (폐기 여부 확인용)
+# - memory://: 무효화는 현재 프로세스에만 적용되어 다른 워커는 최대 AUTH_TOKEN_VERSION_TTL_SECONDS 동안 이전 버전 사용
+# - redis://: 무효화가 모든 워커에 즉시 적용 (변경 커밋과 동시에 진행된 조회가 이전 버전을 저장하면 TTL 동안 유지될 수 있음)
+token_version_cache = create_token_version_cache(
+    settings.AUTH_TOKEN_VERSION_CACHE_URI,
+    ttl=settings.AUTH_TOKEN_VERSION_TTL_SECONDS,
+    max_size=settings.AUTH_CACHE_MAX_SIZE
+)
+
+
+class Principal:
+    """
+    인증된 사용자의 최소 정보 (id, role, name, token_version)
+
+    라우터와 권한 검사에서 사용하는 필드만 가지므로 User 행 전체를 조회하지 않아도 됩니다.
+    """
+
+    __slots__ = ("id", "role", "name", "token_version")
+
+    def __init__(self, id: int, role: UserRole, name: Optional[str], token_version: int = 0):
+        self.id = id
+        self.role = role
+        self.name = name
+        self.token_version = token_version
+
+    @classmethod
+    def from_claims(cls, payload: Dict[str, Any]) -> "Principal":
+        """
+        검증된 액세스 토큰 claim으로 생성 (DB 조회 없음)
+
+        Raises:
+            ValueError: role claim이 유효하지 않음
+        """
+        return cls(
+            id=payload["user_id"],
+            role=UserRole(payload["role"]),
+            name=payload.get("name"),
+            token_version=payload.get("tv", 0)
+        )
+
+    def __repr__(self) -> str:
+        return f"Principal(id={self.id}, role={self.role.value})"
+
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    액세스 토큰 디코딩 및 타입 검증 (검증된 payload는 토큰 해시 기준으로 캐시)
+
+    Raises:
+        TokenExpiredException: 토큰 만료
+        UnauthorizedException: 유효하지 않은 토큰 또는 액세스 토큰이 아님
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = token_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = decode_token(token)
+    verify_token_type(payload, "access")
+
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        token_cache.set(key, payload, ttl=min(token_cache.ttl, remaining))
+    return payload
+
+
+def get_principal(db: Session, user_id: int) -> Optional[Principal]:
+    """
+    사용자 Principal 조회 (캐시에 없으면 필요한 컬럼만 조회, 사용자가 없으면 None)
+    """
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    row = db.query(User.id, User.role, User.name, User.token_version).filter(User.id == user_id).first()
+    if row is None:
+        return None
+
+    principal = Principal(id=row.id, role=row.role, name=row.name, token_version=row.token_version)
+    principal_cache.set(user_id, principal)
+    # 같은 행에서 읽은 토큰 버전도 저장 (직후 get_token_version이 DB를 다시 조회하지 않도록)
+    token_version_cache.set(user_id, row.token_version)
+    return principal
+
+
+def get_token_version(db: Session, user_id: int) -> Optional[int]:
+    """
+    사용자의 현재 토큰 버전 (캐시에 없으면 token_version 컬럼만 조회, 사용자가 없으면 None)
+    """
+    version = token_version_cache.get(user_id)
+    if version is not None:
+        return version
+
+    version = db.query(User.token_version).filter(User.id == user_id).scalar()
+    if version is not None:
+        token_version_cache.set(user_id, version)
+    return version
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    사용자 정보 변경/삭제 시 Principal 및 토큰 버전 캐시 무효화
+
+    Principal 캐시는 현재 프로세스에만 적용됩니다. 다른 워커는 토큰 버전 비교로 역할 변경/폐기를 감지하고
+    (get_current_user가 버전이 다른 Principal을 다시 조회), 이름 등 프로필 변경은 AUTH_CACHE_TTL_SECONDS 이내에 반영됩니다.
+    """
+    principal_cache.delete(user_id)
+    token_version_cache.delete(user_id)
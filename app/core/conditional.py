@@ -0,0 +1,138 @@
+"""
+Conditional Requests
+상세 조회 응답의 ETag/Last-Modified 생성 및 조건부 요청(304 Not Modified) 처리
+"""
+import functools
+import hashlib
+import inspect
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+
+class ResourceVersion:
+    """
+    리소스 버전 (응답 본문을 만들지 않고 가벼운 조회로 계산)
+
+    ETag는 버전 구성 요소(updated_at, 카운터, 사용자별 상태 등)의 해시이므로 weak ETag(W/)로 표시합니다.
+    """
+
+    __slots__ = ("etag", "last_modified")
+
+    def __init__(self, *parts: Any, last_modified: Optional[datetime] = None):
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+        self.etag = f'W/"{digest}"'
+        self.last_modified = http_date(last_modified) if last_modified else None
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        return headers
+
+
+def http_date(value: datetime) -> str:
+    """DB 시각(UTC, naive)을 HTTP-date 문자열로 변환"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def latest(*values: Optional[datetime]) -> Optional[datetime]:
+    """None을 제외한 가장 늦은 시각"""
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 값이 ETag와 일치하는지 확인 (여러 값, *, weak 비교)"""
+    etag = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str] = None) -> bool:
+    """
+    조건부 요청 평가 (If-None-Match가 있으면 If-Modified-Since는 무시)
+
+    Args:
+        etag: 현재 ETag
+        last_modified: 현재 Last-Modified (HTTP-date)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+def conditional_response(
+    version: Callable[[Session, dict], Optional[ResourceVersion]],
+    on_not_modified: Optional[Callable[[Session, dict], None]] = None
+):
+    """
+    상세 조회 엔드포인트에 ETag/Last-Modified를 붙이고 조건부 요청을 처리하는 데코레이터
+
+    엔드포인트 실행 전에 version으로 현재 버전만 조회하고, If-None-Match/If-Modified-Since와 일치하면
+    서비스 조회(좋아요 여부, 작성자, 주문 항목 등)와 직렬화 없이 304를 반환합니다.
+    version이 None을 반환하면(없는 리소스, 권한 없음) 엔드포인트를 그대로 실행해 기존 오류 응답을 유지합니다.
+    엔드포인트에 request, db(Session 또는 AsyncSession) 인자가 필요합니다.
+
+    Args:
+        version: (동기 세션, 엔드포인트 인자) → 현재 버전 또는 None
+        on_not_modified: 304 응답 시 실행할 부수 효과 (예: 조회수 기록, 같은 세션에서 실행)
+    """
+    def check(db: Session, kwargs: dict) -> tuple[Optional[ResourceVersion], bool]:
+        current = version(db, kwargs)
+        if current is None or not is_not_modified(kwargs["request"], current.etag, current.last_modified):
+            return current, False
+        if on_not_modified is not None:
+            on_not_modified(db, kwargs)
+        return current, True
+
+    def finish(current: Optional[ResourceVersion], result: Any) -> Any:
+        if current is None or isinstance(result, Response):
+            return result
+        return Response(
+            content=JSONResponse(jsonable_encoder(result)).body,
+            media_type="application/json",
+            headers=current.headers()
+        )
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                current, not_modified = await kwargs["db"].run_sync(check, kwargs)
+                if not_modified:
+                    return not_modified_response(current.headers())
+                return finish(current, await func(*args, **kwargs))
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            current, not_modified = check(kwargs["db"], kwargs)
+            if not_modified:
+                return not_modified_response(current.headers())
+            return finish(current, func(*args, **kwargs))
+        return sync_wrapper
+
+    return decorator
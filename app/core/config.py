@@ -23,6 +23,12 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_NAME: str = "bookstore"
     DATABASE_URL: Optional[str] = None
+    # 비동기 엔진 URL (미지정 시 DATABASE_URL의 드라이버를 aiomysql/aiosqlite로 변환)
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # 읽기 전용 복제본 URL 목록 (JSON 배열, 조회 전용 세션이 라운드로빈으로 사용)
+    DATABASE_REPLICA_URLS: List[str] = []
+    # 쓰기 요청 후 같은 클라이언트의 조회를 primary로 보내는 시간 (초, 복제 지연 대비)
+    REPLICA_STICKY_SECONDS: float = 5.0
 
     @model_validator(mode="before")
     def assemble_db_connection(cls, v: Any) -> Any:
@@ -33,6 +39,14 @@ class Settings(BaseSettings):
             )
         return v
 
+    # Connection Pool Settings (SQLite 외 DB에 적용, 비동기 엔진도 동일 설정 사용)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    # MySQL wait_timeout보다 짧게 설정하여 서버가 끊은 커넥션 재사용 방지
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
     # JWT Settings
     JWT_SECRET_KEY: str = "your-secret-key-here-change-in-production"
     JWT_ALGORITHM: str = "HS256"
@@ -46,8 +60,60 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 10
     MAX_PAGE_SIZE: int = 100
 
+    # List Count Cache Settings (count=estimate)
+    COUNT_CACHE_TTL_SECONDS: float = 60.0
+    COUNT_CACHE_MAX_SIZE: int = 10000
+
+    # Cart Snapshot Cache Settings
+    CART_CACHE_TTL_SECONDS: float = 30.0
+    CART_CACHE_MAX_SIZE: int = 10000
+
+    # Auth Cache Settings (디코딩된 토큰 및 사용자 Principal, 프로세스별 캐시)
+    AUTH_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_CACHE_MAX_SIZE: int = 10000
+    # 토큰 버전 캐시 (역할 변경/탈퇴 시 토큰 폐기 확인)
+    # memory://(프로세스별, 다른 워커에는 TTL 이내 반영), redis://host:6379/0(워커 간 공유, 즉시 반영)
+    AUTH_TOKEN_VERSION_CACHE_URI: str = "memory://"
+    AUTH_TOKEN_VERSION_TTL_SECONDS: float = 5.0
+
+    # Response Cache Settings (비로그인 카탈로그 조회 응답)
+    # memory://(프로세스별 LRU), redis://host:6379/1(워커 간 공유)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_URI: str = "memory://"
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_SIZE: int = 5000
+
+    # Rate Limit Storage Settings
+    # memory://(프로세스별), shared+redis://host:6379/0(워커 간 공유), batched+redis://host:6379/0(공유 + 로컬 예약)
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    # batched+redis 사용 시 한 번에 예약하는 요청 수
+    RATE_LIMIT_BATCH_SIZE: int = 10
+
     # Bcrypt Settings
     BCRYPT_ROUNDS: int = 12
+    # 해싱/검증 전용 프로세스 수 (0이면 호출 스레드에서 실행)
+    PASSWORD_HASH_WORKERS: int = 2
+    # 동시에 처리/대기할 수 있는 해싱 요청 수 (초과 시 503)
+    PASSWORD_HASH_MAX_PENDING: int = 16
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10.0
+
+    # Book View Buffer Settings (조회 기록 write-behind)
+    VIEW_BUFFER_ENABLED: bool = True
+    VIEW_BUFFER_FLUSH_SIZE: int = 500
+    VIEW_BUFFER_FLUSH_INTERVAL_SECONDS: float = 5.0
+    VIEW_BUFFER_MAX_PENDING: int = 10000
+
+    # Like Count Reconciliation Settings (0이면 비활성화)
+    LIKE_RECONCILE_INTERVAL_SECONDS: float = 3600.0
+
+    # Book Search Settings (like | fulltext | inverted)
+    SEARCH_BACKEND: str = "fulltext"
+    SEARCH_INDEX_REFRESH_SECONDS: float = 300.0
+
+    # Book Trending Settings (인기 점수 갱신 주기, 0이면 비활성화)
+    TRENDING_REFRESH_INTERVAL_SECONDS: float = 60.0
+    # 기간별로 메모리에 보관하는 인기 도서 수 (조회 가능한 최대 size)
+    TRENDING_SNAPSHOT_SIZE: int = 50
 
 
 settings = Settings()
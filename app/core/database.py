@@ -2,23 +2,148 @@
 Database Configuration
 SQLAlchemy 데이터베이스 연결 및 세션 관리
 """
-from sqlalchemy import create_engine, Engine
+import itertools
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import create_engine, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.sql.dml import UpdateBase
 from app.core.config import settings
+from app.core.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+
+# 동기 드라이버 → 비동기 드라이버 매핑
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """동기 DB URL을 같은 DB를 가리키는 비동기 드라이버 URL로 변환"""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def get_pool_options(url: str, pool_class: type) -> dict:
+    """
+    create_engine 풀 옵션
+
+    SQLite(개발/테스트)는 SQLAlchemy 기본 풀을 그대로 사용하고,
+    그 외 DB는 설정값과 대기 시간 계측 풀을 사용합니다.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 
 # 데이터베이스 URL
 DATABASE_URL = settings.DATABASE_URL
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(DATABASE_URL)
 
 # SQLAlchemy 엔진 생성
 engine: Engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-    echo=False  # SQL 로그 출력 (개발 시 True)
+    pool_logging_name="primary",
+    echo=False,  # SQL 로그 출력 (개발 시 True)
+    **get_pool_options(DATABASE_URL, InstrumentedQueuePool)
 )
 
-# 세션 팩토리
+# 읽기 전용 복제본(replica) 엔진 (미설정 시 모든 조회가 primary 사용)
+replica_engines: list[Engine] = [
+    create_engine(
+        url,
+        connect_args={"check_same_thread": False} if "sqlite" in url else {},
+        pool_logging_name=f"replica-{i}",
+        echo=False,
+        **get_pool_options(url, InstrumentedQueuePool)
+    )
+    for i, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+
+# 요청 단위 primary 고정 여부 (쓰기 요청 및 쓰기 직후 요청에서 설정)
+_use_primary: ContextVar[bool] = ContextVar("use_primary", default=False)
+
+
+def use_primary() -> None:
+    """현재 요청(컨텍스트)의 이후 조회를 primary로 고정"""
+    _use_primary.set(True)
+
+
+def is_primary_forced() -> bool:
+    return _use_primary.get()
+
+
+class RoutingSession(Session):
+    """
+    조회는 replica, 쓰기는 primary로 보내는 세션
+
+    - replica는 세션 생성 시 라운드로빈으로 하나를 선택하여 세션 동안 유지
+    - flush/INSERT/UPDATE/DELETE/SELECT FOR UPDATE는 primary에서 실행하고,
+      이후 같은 세션의 조회도 primary 사용 (read-after-write, text() 쓰기 문은 감지하지 않음)
+    - use_primary()가 호출된 컨텍스트이거나 replica가 없으면 항상 primary 사용
+    """
+
+    def __init__(self, *args, primary: Engine, replicas: Optional[itertools.cycle] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replica: Optional[Engine] = next(replicas) if replicas is not None else None
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase) or getattr(clause, "_for_update_arg", None) is not None:
+            self.wrote = True
+        if self.replica is None or self.wrote or _use_primary.get():
+            return self.primary
+        return self.replica
+
+
+# 세션 팩토리 (SessionLocal: primary 전용, ReadSessionLocal: 조회 전용 라우팅)
 SessionLocal: type[sessionmaker] = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal: type[sessionmaker] = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    primary=engine,
+    replicas=itertools.cycle(replica_engines) if replica_engines else None
+)
+
+# 비동기 엔진 및 세션 팩토리 (async def 엔드포인트용, 동기 엔진과 함께 사용)
+async_engine: AsyncEngine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_logging_name="async",
+    echo=False,
+    **get_pool_options(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool)
+)
+async_replica_engines: list[AsyncEngine] = [
+    create_async_engine(
+        get_async_database_url(url),
+        pool_logging_name=f"async-replica-{i}",
+        echo=False,
+        **get_pool_options(url, InstrumentedAsyncQueuePool)
+    )
+    for i, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    primary=async_engine.sync_engine,
+    replicas=itertools.cycle([e.sync_engine for e in async_replica_engines]) if async_replica_engines else None
+)
 
 # Base 클래스
 Base = declarative_base()
@@ -34,3 +159,25 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    조회 전용 데이터베이스 세션 의존성
+    replica가 설정되어 있으면 조회를 replica로 보냄 (쓰기 발생 시 primary로 전환)
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션 의존성
+    async def 엔드포인트에서 사용 (DB 대기 중 스레드풀 워커를 점유하지 않음, 조회는 get_read_db와 같이 replica 사용)
+    *_async 서비스 메서드는 AsyncSession.run_sync로 동기 조회 코드를 실행하므로 ORM 처리는 이벤트 루프에서 동기로 수행됨
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
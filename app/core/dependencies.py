@@ -7,8 +7,8 @@ from fastapi import Depends, HTTPException, status, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.models import User, UserRole
-from app.core.security import decode_token, verify_token_type
+from app.models import UserRole
+from app.core.auth_cache import Principal, decode_access_token, get_principal, get_token_version, principal_cache
 from app.core.exceptions import (
     UnauthorizedException,
     ForbiddenException,
@@ -22,45 +22,104 @@ security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
 
+def _token_user_id(payload: dict) -> int:
+    user_id: Optional[int] = payload.get("user_id")
+    if user_id is None:
+        raise UnauthorizedException(
+            error_code=ErrorCode.INVALID_TOKEN,
+            message="토큰에 사용자 정보가 없습니다."
+        )
+    return user_id
+
+
+def _check_token_version(payload: dict, current_version: int) -> None:
+    # tv claim이 없는 토큰(도입 이전 발급)은 버전 0으로 취급
+    if payload.get("tv", 0) != current_version:
+        raise UnauthorizedException(error_code=ErrorCode.TOKEN_REVOKED)
+
+
+def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    토큰 claim으로 현재 사용자 Principal 생성 (stateless)
+
+    사용자 행을 조회하지 않고 검증된 claim(user_id, role, name)을 그대로 사용합니다.
+    역할 변경/탈퇴 시 폐기를 위해 tv(토큰 버전) claim만 캐시된 현재 버전과 비교합니다.
+    id/role만 필요한 엔드포인트와 권한 검사(require_*)에서 사용합니다.
+
+    Args:
+        credentials: HTTP Authorization Bearer 토큰
+        db: 데이터베이스 세션 (토큰 버전 캐시 miss 시에만 사용)
+
+    Returns:
+        현재 사용자 Principal
+
+    Raises:
+        UnauthorizedException: 토큰 없음, 유효하지 않음 또는 폐기됨
+        UserNotFoundException: 사용자를 찾을 수 없음
+    """
+    payload = decode_access_token(credentials.credentials)
+    user_id = _token_user_id(payload)
+
+    current_version = get_token_version(db, user_id)
+    if current_version is None:
+        raise UserNotFoundException(
+            message="사용자를 찾을 수 없습니다.",
+            details={"user_id": user_id}
+        )
+    _check_token_version(payload, current_version)
+
+    try:
+        return Principal.from_claims(payload)
+    except (KeyError, ValueError):
+        raise UnauthorizedException(error_code=ErrorCode.INVALID_TOKEN)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     """
     현재 로그인한 사용자 가져오기
 
+    토큰 디코딩 결과와 사용자 Principal은 캐시되어, 같은 토큰의 반복 요청은 DB를 조회하지 않습니다.
+    claim이 아닌 사용자 테이블 기준의 최신 이름/역할이 필요한 경우 사용합니다.
+
     Args:
         credentials: HTTP Authorization Bearer 토큰
         db: 데이터베이스 세션
 
     Returns:
-        현재 사용자 객체
+        현재 사용자 Principal (id, role, name)
 
     Raises:
-        UnauthorizedException: 토큰 없음 또는 유효하지 않음
+        UnauthorizedException: 토큰 없음, 유효하지 않음 또는 폐기됨
         UserNotFoundException: 사용자를 찾을 수 없음
     """
     token = credentials.credentials
 
     # 토큰 디코딩 및 검증
-    payload = decode_token(token)
-    verify_token_type(payload, "access")
+    payload = decode_access_token(token)
 
     # 사용자 ID 추출
-    user_id: Optional[int] = payload.get("user_id")
-    if user_id is None:
-        raise UnauthorizedException(
-            error_code=ErrorCode.INVALID_TOKEN,
-            message="토큰에 사용자 정보가 없습니다."
-        )
-
-    # 데이터베이스에서 사용자 조회
-    user = db.query(User).filter(User.id == user_id).first()
+    user_id = _token_user_id(payload)
+
+    # 사용자 조회 (캐시 우선)
+    user = get_principal(db, user_id)
+    current_version = get_token_version(db, user_id) if user else None
+    if user and current_version != user.token_version:
+        # 다른 워커에서 역할 변경/폐기된 경우 (Principal 캐시는 프로세스별이므로 공유 토큰 버전으로 감지)
+        principal_cache.delete(user_id)
+        user = get_principal(db, user_id)
+        current_version = user.token_version if user else None
     if not user:
         raise UserNotFoundException(
             message="사용자를 찾을 수 없습니다.",
             details={"user_id": user_id}
         )
+    _check_token_version(payload, current_version)
 
     return user
 
@@ -68,7 +127,7 @@ def get_current_user(
 def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[Principal]:
     """
     선택적 인증 (로그인하지 않아도 되는 경우)
 
@@ -77,13 +136,13 @@ def get_optional_user(
         db: 데이터베이스 세션
 
     Returns:
-        현재 사용자 객체 또는 None
+        현재 사용자 Principal 또는 None
     """
     if not credentials:
         return None
 
     try:
-        return get_current_user(credentials, db)
+        return get_current_principal(credentials, db)
     except Exception:
         return None
 
@@ -101,7 +160,7 @@ def require_role(allowed_roles: List[UserRole]):
     Example:
         @router.get("/admin/users", dependencies=[Depends(require_role([UserRole.ADMIN]))])
     """
-    def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    def role_checker(current_user: Principal = Depends(get_current_principal)) -> Principal:
         if current_user.role not in allowed_roles:
             raise InsufficientPermissionsException(
                 message=f"이 작업은 {', '.join([role.value for role in allowed_roles])} 권한이 필요합니다.",
@@ -115,7 +174,7 @@ def require_role(allowed_roles: List[UserRole]):
     return role_checker
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
+def require_admin(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """
     관리자 권한 필요
 
@@ -136,7 +195,7 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-def require_seller(current_user: User = Depends(get_current_user)) -> User:
+def require_seller(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """
     판매자 권한 필요 (판매자 또는 관리자)
 
@@ -157,7 +216,7 @@ def require_seller(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-def verify_resource_owner(resource_user_id: int, current_user: User) -> None:
+def verify_resource_owner(resource_user_id: int, current_user: Principal) -> None:
     """
     리소스 소유자 검증 (본인 또는 관리자만 접근 가능)
 
@@ -13,6 +13,8 @@ class ErrorCode(str, Enum):
     VALIDATION_FAILED = "VALIDATION_FAILED"
     INVALID_QUERY_PARAM = "INVALID_QUERY_PARAM"
     INVALID_DATE_RANGE = "INVALID_DATE_RANGE"
+    INVALID_CURSOR = "INVALID_CURSOR"
+    CART_EMPTY = "CART_EMPTY"
 
     # 401 Unauthorized
     UNAUTHORIZED = "UNAUTHORIZED"
@@ -20,6 +22,7 @@ class ErrorCode(str, Enum):
     INVALID_TOKEN = "INVALID_TOKEN"
     INVALID_CREDENTIALS = "INVALID_CREDENTIALS"
     TOKEN_MISSING = "TOKEN_MISSING"
+    TOKEN_REVOKED = "TOKEN_REVOKED"
 
     # 403 Forbidden
     FORBIDDEN = "FORBIDDEN"
@@ -66,6 +69,9 @@ class ErrorCode(str, Enum):
     UNKNOWN_ERROR = "UNKNOWN_ERROR"
     EXTERNAL_SERVICE_ERROR = "EXTERNAL_SERVICE_ERROR"
 
+    # 503 Service Unavailable
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
+
 
 # 에러 메시지 매핑
 ERROR_MESSAGES = {
@@ -74,6 +80,8 @@ ERROR_MESSAGES = {
     ErrorCode.VALIDATION_FAILED: "입력값 검증에 실패했습니다.",
     ErrorCode.INVALID_QUERY_PARAM: "잘못된 쿼리 파라미터입니다.",
     ErrorCode.INVALID_DATE_RANGE: "잘못된 날짜 범위입니다.",
+    ErrorCode.INVALID_CURSOR: "유효하지 않은 페이지 커서입니다.",
+    ErrorCode.CART_EMPTY: "장바구니가 비어 있습니다.",
 
     # 401
     ErrorCode.UNAUTHORIZED: "인증이 필요합니다.",
@@ -81,6 +89,7 @@ ERROR_MESSAGES = {
     ErrorCode.INVALID_TOKEN: "유효하지 않은 토큰입니다.",
     ErrorCode.INVALID_CREDENTIALS: "이메일 또는 비밀번호가 올바르지 않습니다.",
     ErrorCode.TOKEN_MISSING: "인증 토큰이 없습니다.",
+    ErrorCode.TOKEN_REVOKED: "권한이 변경되어 더 이상 사용할 수 없는 토큰입니다. 다시 로그인해주세요.",
 
     # 403
     ErrorCode.FORBIDDEN: "접근 권한이 없습니다.",
@@ -126,4 +135,7 @@ ERROR_MESSAGES = {
     ErrorCode.DATABASE_ERROR: "데이터베이스 오류가 발생했습니다.",
     ErrorCode.UNKNOWN_ERROR: "알 수 없는 오류가 발생했습니다.",
     ErrorCode.EXTERNAL_SERVICE_ERROR: "외부 서비스 오류가 발생했습니다.",
+
+    # 503
+    ErrorCode.SERVICE_UNAVAILABLE: "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
 }
@@ -197,3 +197,14 @@ class DatabaseException(BaseAPIException):
         details: Optional[Dict[str, Any]] = None,
     ):
         super().__init__(500, ErrorCode.DATABASE_ERROR, message, details)
+
+
+# 503 Service Unavailable
+class ServiceUnavailableException(BaseAPIException):
+    def __init__(
+        self,
+        error_code: ErrorCode = ErrorCode.SERVICE_UNAVAILABLE,
+        message: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(503, error_code, message, details)
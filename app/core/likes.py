@@ -0,0 +1,116 @@
+"""
+Like Counters
+좋아요 토글 및 좋아요 수 집계 테이블 유지 (리뷰/댓글 공통)
+"""
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+def insert_ignore(db: Session, model, values: dict, unique_columns: list[str]) -> bool:
+    """
+    중복(유니크 제약 위반)이면 무시하는 INSERT
+
+    Returns:
+        bool: 행이 추가되었는지 여부
+    """
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        # ON DUPLICATE KEY UPDATE는 FOUND_ROWS 플래그로 중복 시에도 1을 반환하므로 INSERT IGNORE 사용
+        # (외래키 오류도 무시되지만 호출 전에 대상 존재를 확인하며, 무시된 경우 추가되지 않은 것으로 처리)
+        stmt = insert(model).values(**values).prefix_with("IGNORE", dialect="mysql")
+        return db.execute(stmt).rowcount == 1
+
+    if dialect in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = dialect_insert(model).values(**values).on_conflict_do_nothing(index_elements=unique_columns)
+        return db.execute(stmt).rowcount == 1
+
+    try:
+        with db.begin_nested():
+            db.execute(insert(model).values(**values))
+        return True
+    except IntegrityError:
+        return False
+
+
+def toggle_like(db: Session, like_model, count_model, key: str, target_id: int, user_id: int) -> tuple[bool, int]:
+    """
+    좋아요 토글 (커밋은 호출자가 수행)
+
+    DELETE의 영향 행 수로 기존 좋아요 여부를 판단하고, 없으면 중복 무시 INSERT로 추가한 뒤
+    집계 테이블을 like_count ± 1로 갱신합니다. 조회 후 쓰기(select-then-write) 단계가 없어
+    동시 요청에서도 유니크 제약 오류나 갱신 손실이 발생하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        like_model: 좋아요 모델 (ReviewLike, CommentLike)
+        count_model: 좋아요 수 집계 모델 (ReviewLikeCount, CommentLikeCount)
+        key: 대상 ID 컬럼 이름 (review_id, comment_id)
+        target_id: 대상 ID
+        user_id: 사용자 ID
+
+    Returns:
+        tuple: (좋아요 상태, 총 좋아요 수)
+    """
+    like_key = getattr(like_model, key)
+    count_key = getattr(count_model, key)
+
+    deleted = db.query(like_model).filter(
+        like_key == target_id,
+        like_model.user_id == user_id
+    ).delete(synchronize_session=False)
+
+    if deleted:
+        is_liked, delta = False, -1
+    else:
+        is_liked = True
+        # 동시에 같은 사용자의 좋아요가 먼저 추가된 경우 집계는 그 요청이 반영
+        inserted = insert_ignore(db, like_model, {key: target_id, "user_id": user_id}, [key, "user_id"])
+        delta = 1 if inserted else 0
+
+    if delta:
+        updated = db.query(count_model).filter(count_key == target_id).update(
+            {count_model.like_count: count_model.like_count + delta},
+            synchronize_session=False
+        )
+        if not updated:
+            # 집계 행이 없으면 좋아요 테이블 기준으로 생성 (방금 변경분 포함)
+            current_count = db.query(func.count(like_model.id)).filter(like_key == target_id).scalar()
+            insert_ignore(db, count_model, {key: target_id, "like_count": current_count or 0}, [key])
+
+    like_count = db.query(count_model.like_count).filter(count_key == target_id).scalar()
+    return is_liked, max(like_count or 0, 0)
+
+
+def reconcile_like_counts(db: Session, target_model, like_model, count_model, key: str) -> dict:
+    """
+    좋아요 테이블 기준으로 집계 테이블 보정 (커밋은 호출자가 수행)
+
+    - 집계 행이 없는 대상은 실제 좋아요 수로 생성
+    - 실제 좋아요 수와 다른 집계 행은 실제 값으로 갱신
+
+    Returns:
+        dict: 처리 결과 (생성된 집계 행 수, 보정된 집계 행 수)
+    """
+    target_id = target_model.id
+    count_key = getattr(count_model, key)
+    like_key = getattr(like_model, key)
+
+    missing_count = select(func.count(like_model.id)).where(like_key == target_id).scalar_subquery()
+    missing = (
+        select(target_id, missing_count)
+        .outerjoin(count_model, count_key == target_id)
+        .where(count_key.is_(None))
+    )
+    created = db.execute(insert(count_model).from_select([key, "like_count"], missing)).rowcount or 0
+
+    actual_count = select(func.count(like_model.id)).where(like_key == count_key).scalar_subquery()
+    repaired = db.query(count_model).filter(count_model.like_count != actual_count).update(
+        {count_model.like_count: actual_count},
+        synchronize_session=False
+    )
+
+    return {"created": created, "repaired": repaired}
@@ -2,9 +2,47 @@
 Rate Limiter Configuration
 API 요청 횟수 제한 설정 (slowapi)
 """
+from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.core.auth_cache import decode_access_token
+from app.core.config import settings
+# 저장소 URI 스킴(shared+redis, batched+redis) 등록
+from app.core import rate_limit_storage  # noqa: F401
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    요청 식별 키 (인증된 요청은 사용자 ID, 그 외는 클라이언트 IP)
+
+    같은 사용자가 여러 IP(모바일 네트워크 등)에서 요청해도 하나의 한도를 공유하고,
+    NAT 뒤의 여러 사용자는 각자의 한도를 사용합니다. 토큰 검증 결과는 인증 캐시를 재사용합니다.
+    """
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            user_id = decode_access_token(token).get("user_id")
+        except Exception:
+            user_id = None
+        if user_id is not None:
+            return f"user:{user_id}"
+    return f"ip:{get_remote_address(request)}"
+
+
+def _storage_options() -> dict:
+    if settings.RATE_LIMIT_STORAGE_URI.startswith("batched+"):
+        return {"batch_size": settings.RATE_LIMIT_BATCH_SIZE}
+    return {}
+
+
 # Limiter 인스턴스 생성
-# key_func는 클라이언트의 IP 주소를 사용하여 요청을 식별합니다.
-limiter = Limiter(key_func=get_remote_address)
+# - 저장소: RATE_LIMIT_STORAGE_URI (memory://는 프로세스별, shared+redis/batched+redis는 워커 간 공유)
+# - 공유 저장소 장애 시 프로세스별 메모리 저장소로 대체
+limiter = Limiter(
+    key_func=rate_limit_key,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    storage_options=_storage_options(),
+    in_memory_fallback_enabled=not settings.RATE_LIMIT_STORAGE_URI.startswith("memory://")
+)
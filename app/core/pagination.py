@@ -0,0 +1,245 @@
+"""
+Pagination Utilities
+페이지네이션 공통 유틸리티 (OFFSET / 커서 기반 keyset 페이지네이션)
+"""
+import base64
+import binascii
+import json
+import math
+from collections import namedtuple
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any, Hashable, Literal, Optional
+
+from sqlalchemy import DateTime, Enum as SQLEnum, String, and_, asc, cast, desc, func, or_
+from sqlalchemy.orm import Query
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.error_codes import ErrorCode
+from app.core.exceptions import BadRequestException
+
+# 전체 개수 조회 방식 (exact: COUNT 실행, estimate: 캐시된 개수 사용, none: 개수 생략)
+CountMode = Literal["exact", "estimate", "none"]
+
+count_cache = TTLCache(ttl=settings.COUNT_CACHE_TTL_SECONDS, max_size=settings.COUNT_CACHE_MAX_SIZE)
+
+
+def _encode_value(value: Any) -> list:
+    if value is None:
+        return ["null", None]
+    if isinstance(value, bool):
+        return ["bool", value]
+    if isinstance(value, Enum):
+        return ["str", value.name]
+    if isinstance(value, datetime):
+        return ["datetime", value.isoformat()]
+    if isinstance(value, date):
+        return ["date", value.isoformat()]
+    if isinstance(value, Decimal):
+        return ["decimal", str(value)]
+    if isinstance(value, int):
+        return ["int", value]
+    if isinstance(value, float):
+        return ["float", value]
+    return ["str", str(value)]
+
+
+_DECODERS = {
+    "null": lambda v: None,
+    "bool": bool,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "decimal": Decimal,
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+
+def _invalid_cursor(message: str = "Invalid pagination cursor") -> BadRequestException:
+    return BadRequestException(ErrorCode.INVALID_CURSOR, message)
+
+
+def encode_cursor(sort_field: str, order: str, value: Any, last_id: int) -> str:
+    """
+    정렬 키와 마지막 행 ID를 불투명(opaque) 커서 문자열로 인코딩
+
+    Args:
+        sort_field: 정렬 필드 이름
+        order: 정렬 순서 (asc/desc)
+        value: 마지막 행의 정렬 키 값
+        last_id: 마지막 행의 ID (동일 정렬 키 구분용)
+
+    Returns:
+        str: URL-safe base64 커서
+    """
+    payload = {"s": sort_field, "o": order.lower(), "v": _encode_value(value), "i": last_id}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_field: str, order: str) -> tuple[Any, int]:
+    """
+    커서 문자열 디코딩
+
+    Returns:
+        tuple: (정렬 키 값, 마지막 행 ID)
+
+    Raises:
+        BadRequestException: 커서 형식이 잘못되었거나 현재 정렬 조건과 다른 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        value_type, value = payload["v"]
+        value = _DECODERS[value_type](value)
+        last_id = int(payload["i"])
+    except (binascii.Error, ValueError, TypeError, KeyError, InvalidOperation):
+        raise _invalid_cursor()
+
+    if payload.get("s") != sort_field or payload.get("o") != order.lower():
+        raise _invalid_cursor("Cursor does not match the current sort parameters")
+
+    return value, last_id
+
+
+def _sortable(column, dialect_name: str):
+    column_type = getattr(column, "type", None)
+
+    # MySQL ENUM은 ORDER BY(정의 순서)와 비교 연산(문자열)의 기준이 달라 문자열로 변환하여 사용
+    if isinstance(column_type, SQLEnum):
+        return cast(column, String(50))
+
+    # SQLite는 일시를 문자열로 저장하며 server_default(CURRENT_TIMESTAMP)와 Python 값의 형식이 달라
+    # 동일 형식으로 맞춰 비교 (개발/테스트 환경용)
+    if dialect_name == "sqlite" and isinstance(column_type, DateTime):
+        return func.strftime("%Y-%m-%d %H:%M:%f", column)
+
+    return column
+
+
+def _after(sort_expr, id_column, value: Any, last_id: int, is_desc: bool):
+    """
+    커서 이후의 행 조건 (NULL은 가장 작은 값으로 정렬되는 MySQL/SQLite 기준)
+    """
+    if value is None:
+        if is_desc:
+            return and_(sort_expr.is_(None), id_column < last_id)
+        return or_(sort_expr.is_not(None), and_(sort_expr.is_(None), id_column > last_id))
+
+    if is_desc:
+        return or_(
+            sort_expr < value,
+            and_(sort_expr == value, id_column < last_id),
+            sort_expr.is_(None)
+        )
+    return or_(sort_expr > value, and_(sort_expr == value, id_column > last_id))
+
+
+def _strip_cursor_columns(rows: list) -> list:
+    width = len(rows[0]) - 2
+    if width == 1:
+        return [row[0] for row in rows]
+
+    page_row = namedtuple("PageRow", rows[0]._fields[:width], rename=True)
+    return [page_row(*row[:width]) for row in rows]
+
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    sort_field: str,
+    order: str = "desc",
+    size: int = 10,
+    page: int = 1,
+    cursor: Optional[str] = None
+) -> tuple[list, Optional[str]]:
+    """
+    정렬 + 페이지네이션 적용 후 한 페이지 조회
+
+    정렬 키 다음에 ID를 보조 정렬 키로 사용하여 순서를 고정합니다.
+    cursor가 주어지면 OFFSET 대신 (정렬 키, ID) 비교 조건으로 다음 페이지를 조회하므로
+    페이지 깊이와 관계없이 비용이 일정합니다. (이 경우 page는 무시)
+
+    Args:
+        query: 필터가 적용된 쿼리 (정렬 미적용)
+        sort_column: 정렬 컬럼 또는 표현식
+        id_column: 보조 정렬용 고유 ID 컬럼
+        sort_field: 정렬 필드 이름 (커서 검증용)
+        order: 정렬 순서 (asc/desc)
+        size: 페이지 크기
+        page: 페이지 번호 (OFFSET 모드)
+        cursor: 이전 응답의 next_cursor (커서 모드)
+
+    Returns:
+        tuple: (조회 결과 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    is_desc = order.lower() == "desc"
+    sort_expr = _sortable(sort_column, query.session.get_bind().dialect.name)
+
+    offset = (page - 1) * size
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_field, order)
+        query = query.filter(_after(sort_expr, id_column, value, last_id, is_desc))
+        offset = 0
+
+    direction = desc if is_desc else asc
+    rows = (
+        query.order_by(direction(sort_expr), direction(id_column))
+        .add_columns(sort_expr.label("_cursor_value"), id_column.label("_cursor_id"))
+        .offset(offset)
+        .limit(size + 1)
+        .all()
+    )
+
+    if not rows:
+        return [], None
+
+    has_next = len(rows) > size
+    rows = rows[:size]
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort_field, order, last._cursor_value, last._cursor_id)
+
+    return _strip_cursor_columns(rows), next_cursor
+
+
+def count_total(query: Query, count_mode: CountMode = "exact", cache_key: Optional[Hashable] = None) -> Optional[int]:
+    """
+    count_mode에 따라 전체 개수 조회
+
+    - exact: COUNT 쿼리 실행 (결과는 estimate 모드용으로 캐시에 저장)
+    - estimate: COUNT_CACHE_TTL_SECONDS 이내에 계산된 개수가 있으면 재사용, 없으면 exact와 동일
+    - none: 개수를 계산하지 않음 (다음 페이지 여부는 size+1 조회 결과로 판단)
+
+    Args:
+        query: 필터가 적용된 쿼리
+        count_mode: 개수 조회 방식
+        cache_key: 필터 조건을 나타내는 캐시 키 (호출자가 지정)
+
+    Returns:
+        Optional[int]: 전체 개수 (none 모드면 None)
+    """
+    if count_mode == "none":
+        return None
+
+    if count_mode == "estimate" and cache_key is not None:
+        cached = count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    total = query.count()
+    if cache_key is not None:
+        count_cache.set(cache_key, total)
+    return total
+
+
+def get_total_pages(total: Optional[int], size: int) -> Optional[int]:
+    """전체 페이지 수 (전체 개수를 모르면 None)"""
+    if total is None:
+        return None
+    return math.ceil(total / size) if total > 0 else 0
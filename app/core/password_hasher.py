@@ -0,0 +1,149 @@
+"""
+Password Hasher
+bcrypt 해싱/검증 전용 프로세스 풀
+"""
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+import bcrypt
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+
+
+def _hashpw(password: bytes, rounds: int) -> str:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class PasswordHasher:
+    """
+    bcrypt 작업을 별도 프로세스 풀에서 실행
+
+    - 해싱 1회에 수백 ms의 CPU를 사용하므로 요청 스레드/이벤트 루프 대신 전용 프로세스에서 실행
+    - 처리 중 + 대기 중 작업이 max_pending에 도달하면 대기하지 않고 즉시 503 (로그인 폭주 시 다른 API 보호)
+    - 프로세스 풀은 첫 사용 시 생성, workers가 0이면 호출 스레드에서 실행 (동시 실행 수 제한은 동일)
+    - 풀은 서버 프로세스의 다른 스레드(조회 버퍼, 백그라운드 작업)가 실행 중일 때 생성되므로
+      fork 대신 forkserver(미지원 플랫폼은 spawn)로 워커를 시작 (잠금 상태 상속으로 인한 교착 방지)
+    - async 호출(hash_async/verify_async)은 결과를 이벤트 루프에서 기다려 요청 스레드를 점유하지 않음
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, timeout: float = 10.0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self.rejected_count = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_mp_context())
+            return self._executor
+
+    def _busy(self, reason: str) -> ServiceUnavailableException:
+        self.rejected_count += 1
+        return ServiceUnavailableException(details={"reason": reason, "max_pending": self.max_pending})
+
+    def _submit(self, func: Callable[..., Any], *args) -> Future:
+        """슬롯 확보 후 프로세스 풀에 작업 제출 (슬롯은 작업이 끝나면 반환)"""
+        if not self._slots.acquire(blocking=False):
+            raise self._busy("password hashing queue is full")
+
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._reset_executor()
+            raise self._busy("password hashing worker crashed")
+        except BaseException:
+            self._slots.release()
+            raise
+
+        # 슬롯은 작업이 실제로 끝날 때 반환 (타임아웃 후에도 워커 프로세스에서는 계속 실행되므로)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _run_inline(self, func: Callable[..., Any], *args) -> Any:
+        if not self._slots.acquire(blocking=False):
+            raise self._busy("password hashing queue is full")
+        try:
+            return func(*args)
+        finally:
+            self._slots.release()
+
+    def _run(self, func: Callable[..., Any], *args) -> Any:
+        if self.workers <= 0:
+            return self._run_inline(func, *args)
+
+        future = self._submit(func, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # 아직 시작하지 않은 작업만 취소됨 (취소된 작업도 done 콜백으로 슬롯 반환)
+            future.cancel()
+            raise self._busy("password hashing timed out")
+        except BrokenProcessPool:
+            self._reset_executor()
+            raise self._busy("password hashing worker crashed")
+
+    async def _run_async(self, func: Callable[..., Any], *args) -> Any:
+        if self.workers <= 0:
+            return await run_in_threadpool(self._run_inline, func, *args)
+
+        future = self._submit(func, *args)
+        try:
+            # 대기 취소(타임아웃) 시 wrap_future가 아직 시작하지 않은 작업도 취소
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise self._busy("password hashing timed out")
+        except BrokenProcessPool:
+            self._reset_executor()
+            raise self._busy("password hashing worker crashed")
+
+    def _reset_executor(self) -> None:
+        # 워커 프로세스가 비정상 종료되면 다음 요청에서 풀을 다시 생성
+        with self._lock:
+            self._executor = None
+
+    def hash(self, password: bytes, rounds: int) -> str:
+        return self._run(_hashpw, password, rounds)
+
+    def verify(self, password: bytes, hashed: bytes) -> bool:
+        return self._run(_checkpw, password, hashed)
+
+    async def hash_async(self, password: bytes, rounds: int) -> str:
+        return await self._run_async(_hashpw, password, rounds)
+
+    async def verify_async(self, password: bytes, hashed: bytes) -> bool:
+        return await self._run_async(_checkpw, password, hashed)
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS
+)
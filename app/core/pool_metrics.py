@@ -0,0 +1,111 @@
+"""
+Connection Pool Metrics
+커넥션 풀 사용량 및 체크아웃 대기 시간 계측
+"""
+import bisect
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# 대기 시간 히스토그램 버킷 상한 (ms, 마지막 버킷은 +Inf)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class WaitHistogram:
+    """
+    커넥션 체크아웃 대기 시간 히스토그램 (스레드 안전)
+
+    버킷별 개수는 누적이 아닌 구간별 개수이며, 풀 타임아웃으로 실패한 체크아웃은 timeouts로 따로 집계합니다.
+    """
+
+    def __init__(self, buckets_ms: tuple[float, ...] = WAIT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets_ms) + 1)
+            self._count = 0
+            self._sum_ms = 0.0
+            self._max_ms = 0.0
+            self._timeouts = 0
+
+    def observe(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+            self._count += 1
+            self._sum_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+            if timed_out:
+                self._timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"le_{bound}ms" for bound in self.buckets_ms] + ["le_inf"]
+            return {
+                "count": self._count,
+                "timeouts": self._timeouts,
+                "avg_ms": round(self._sum_ms / self._count, 3) if self._count else 0.0,
+                "max_ms": round(self._max_ms, 3),
+                "buckets": dict(zip(labels, self._counts)),
+            }
+
+
+# 풀 이름(pool_logging_name)별 히스토그램 (dispose/recreate 후에도 유지)
+wait_histograms: dict[str, WaitHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def get_wait_histogram(name: str) -> WaitHistogram:
+    with _histograms_lock:
+        if name not in wait_histograms:
+            wait_histograms[name] = WaitHistogram()
+        return wait_histograms[name]
+
+
+class _InstrumentedPoolMixin:
+    """connect() 소요 시간(대기 + 필요 시 새 연결 생성/pre-ping)을 히스토그램에 기록"""
+
+    def connect(self):
+        histogram = get_wait_histogram(self._orig_logging_name or "default")
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            histogram.observe((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        histogram.observe((time.perf_counter() - started) * 1000)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """대기 시간을 계측하는 QueuePool (동기 엔진용)"""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """대기 시간을 계측하는 AsyncAdaptedQueuePool (비동기 엔진용)"""
+
+
+def pool_status(pool: Pool) -> dict[str, Any]:
+    """
+    풀 사용 현황 (QueuePool 계열이 아니면 사용량 항목은 None)
+
+    Returns:
+        dict: 풀 클래스, 크기, 대기 중/사용 중 커넥션 수, overflow, 타임아웃, 대기 시간 히스토그램
+    """
+    is_queue_pool = isinstance(pool, QueuePool)
+    name = pool._orig_logging_name or "default"
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size() if is_queue_pool else None,
+        "checked_in": pool.checkedin() if is_queue_pool else None,
+        "checked_out": pool.checkedout() if is_queue_pool else None,
+        "overflow": pool.overflow() if is_queue_pool else None,
+        "max_overflow": pool._max_overflow if is_queue_pool else None,
+        "timeout": pool.timeout() if is_queue_pool else None,
+        "wait": wait_histograms[name].snapshot() if name in wait_histograms else None,
+    }
@@ -0,0 +1,150 @@
+"""
+Rate Limit Storage
+프로세스 간 공유되는 레이트 리밋 저장소 (Redis 프로토콜) 및 로컬 토큰 버킷
+"""
+import threading
+import time
+from typing import Any, Optional
+
+from limits.storage import Storage
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # redis 미설치 환경 (memory:// 저장소만 사용)
+    RedisError = ConnectionError
+
+
+class SharedRedisStorage(Storage):
+    """
+    Redis 프로토콜 서버에 고정 윈도우 카운터를 저장하는 limits 저장소
+
+    모든 워커 프로세스가 같은 카운터를 사용하므로 설정한 한도가 워커 수와 관계없이 적용됩니다.
+    Redis 명령은 SET NX EX / INCRBY / PTTL / GET / DEL / SCAN / PING만 사용하므로
+    같은 프로토콜을 구현한 서버나 테스트용 클라이언트로 대체할 수 있습니다.
+
+    URI: shared+redis://host:port/db (client 옵션으로 클라이언트 객체를 직접 전달 가능)
+    """
+
+    STORAGE_SCHEME = ["shared+redis", "shared+rediss"]
+    KEY_PREFIX = "ratelimit:"
+
+    def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False, client: Any = None, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(uri.split("+", 1)[1], socket_timeout=options.get("socket_timeout", 0.5))
+        self.client = client
+
+    @property
+    def base_exceptions(self):
+        return (RedisError, ConnectionError, TimeoutError, OSError)
+
+    def _key(self, key: str) -> str:
+        return self.KEY_PREFIX + key
+
+    def _incr_shared(self, key: str, expiry: int, amount: int) -> tuple[int, float]:
+        """
+        공유 카운터 증가
+
+        Returns:
+            tuple: (증가 후 카운터, 윈도우 종료 시각)
+        """
+        key = self._key(key)
+        # 윈도우 첫 요청이면 만료 시간과 함께 생성 (INCRBY 후 EXPIRE 사이에 끊겨 만료 없는 키가 남지 않도록)
+        self.client.set(key, 0, ex=expiry, nx=True)
+        value = int(self.client.incrby(key, amount))
+        ttl_ms = self.client.pttl(key)
+        return value, time.time() + (ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else expiry)
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        return self._incr_shared(key, expiry, amount)[0]
+
+    def get(self, key: str) -> int:
+        return int(self.client.get(self._key(key)) or 0)
+
+    def get_expiry(self, key: str) -> float:
+        ttl_ms = self.client.pttl(self._key(key))
+        return time.time() + max(ttl_ms or 0, 0) / 1000
+
+    def check(self) -> bool:
+        try:
+            return bool(self.client.ping())
+        except self.base_exceptions:
+            return False
+
+    def reset(self) -> Optional[int]:
+        keys = list(self.client.scan_iter(match=self.KEY_PREFIX + "*"))
+        if keys:
+            self.client.delete(*keys)
+        return len(keys)
+
+    def clear(self, key: str) -> None:
+        self.client.delete(self._key(key))
+
+
+class _Lease:
+    __slots__ = ("window_end", "position", "end")
+
+    def __init__(self, window_end: float, position: int, end: int):
+        self.window_end = window_end
+        self.position = position  # 마지막으로 사용한 순번
+        self.end = end            # 예약한 마지막 순번
+
+
+class BatchedRedisStorage(SharedRedisStorage):
+    """
+    공유 카운터에서 batch_size개씩 순번을 미리 예약해 두고 로컬에서 소비하는 토큰 버킷
+
+    - 대부분의 요청은 네트워크 왕복 없이 로컬 예약분으로 판정 (예약분 소진 시에만 Redis 호출)
+    - 반환값은 공유 윈도우 내 순번이므로 한도 초과 판정은 공유 저장소와 동일
+    - 다른 프로세스가 예약만 하고 쓰지 않은 순번만큼 윈도우당 허용량이 최대 (프로세스 수 - 1) × batch_size 줄어들 수 있으므로
+      batch_size는 가장 작은 한도보다 충분히 작게 설정
+
+    URI: batched+redis://host:port/db (batch_size 옵션, 기본 10)
+    """
+
+    STORAGE_SCHEME = ["batched+redis", "batched+rediss"]
+    MAX_LEASES = 10000
+
+    def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False, batch_size: int = 10, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.batch_size = max(int(batch_size), 1)
+        self._lock = threading.Lock()
+        self._leases: dict[str, _Lease] = {}
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is not None and lease.window_end > now and lease.position + amount <= lease.end:
+                lease.position += amount
+                return lease.position
+
+        reserve = max(self.batch_size, amount)
+        end, window_end = self._incr_shared(key, expiry, reserve)
+        start = end - reserve
+
+        with self._lock:
+            if len(self._leases) >= self.MAX_LEASES:
+                self._leases = {k: v for k, v in self._leases.items() if v.window_end > now}
+            self._leases[key] = _Lease(window_end, start + amount, end)
+        return start + amount
+
+    def get(self, key: str) -> int:
+        # 다른 프로세스의 예약분이 포함된 공유 카운터 (로컬 예약 중 미사용분 제외)
+        shared = super().get(key)
+        with self._lock:
+            lease = self._leases.get(key)
+            unused = lease.end - lease.position if lease is not None and lease.window_end > time.time() else 0
+        return max(shared - unused, 0)
+
+    def reset(self) -> Optional[int]:
+        with self._lock:
+            self._leases.clear()
+        return super().reset()
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._leases.pop(key, None)
+        super().clear(key)
@@ -0,0 +1,322 @@
+"""
+Response Cache
+비로그인 카탈로그 조회 응답 캐시 (태그 기반 무효화, ETag 조건부 요청)
+"""
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import math
+import threading
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import urlencode
+
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.core.cache import TTLCache
+from app.core.conditional import is_not_modified, not_modified_response
+from app.core.config import settings
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # redis 미설치 환경 (memory:// 백엔드만 사용)
+    RedisError = ConnectionError
+
+logger = logging.getLogger(__name__)
+
+# 태그 (엔드포인트가 캐시 항목에 붙이고, 변경 서비스가 무효화)
+BOOK_LIST_TAG = "books"
+COUPON_LIST_TAG = "coupons"
+
+
+def book_tag(book_id: int) -> str:
+    return f"book:{book_id}"
+
+
+def book_reviews_tag(book_id: int) -> str:
+    return f"book:{book_id}:reviews"
+
+
+class CachedResponse:
+    """
+    직렬화가 끝난 응답 본문과 검증자(ETag, Last-Modified), 저장 시점의 태그 버전
+    """
+
+    __slots__ = ("body", "etag", "last_modified", "tag_versions")
+
+    def __init__(self, body: bytes, etag: str, tag_versions: dict[str, int], last_modified: Optional[str] = None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.tag_versions = tag_versions
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        return headers
+
+
+def make_etag(body: bytes) -> str:
+    """응답 본문 해시로 strong ETag 생성"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class MemoryResponseCacheBackend:
+    """
+    프로세스 내 LRU 백엔드 (워커별로 캐시와 태그 버전을 따로 가짐)
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.entries = TTLCache(ttl=ttl, max_size=max_size)
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        return self.entries.get(key)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self.entries.set(key, entry)
+
+    def tag_versions(self, tags: list[str]) -> list[int]:
+        with self._lock:
+            return [self._versions.get(tag, 0) for tag in tags]
+
+    def bump(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        with self._lock:
+            self._versions.clear()
+
+
+class RedisResponseCacheBackend:
+    """
+    Redis 프로토콜 서버에 응답과 태그 버전을 저장하는 공유 백엔드
+
+    모든 워커가 같은 캐시를 사용하고, 한 워커에서 무효화하면 다른 워커의 항목도 즉시 무효화됩니다.
+    Redis 명령은 GET / SET EX / MGET / INCR / DEL / SCAN만 사용합니다.
+
+    URI: redis://host:port/db (client 인자로 클라이언트 객체를 직접 전달 가능)
+    """
+
+    KEY_PREFIX = "respcache:"
+    TAG_PREFIX = "respcache:tag:"
+
+    def __init__(self, uri: Optional[str] = None, ttl: float = 30.0, client: Any = None):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(uri, socket_timeout=0.5)
+        self.client = client
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raw = self.client.get(self.KEY_PREFIX + key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CachedResponse(data["body"].encode("utf-8"), data["etag"], data["tags"], data.get("last_modified"))
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        # JSON 응답 본문은 UTF-8 텍스트이므로 그대로 문자열로 저장
+        value = json.dumps({
+            "body": entry.body.decode("utf-8"),
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "tags": entry.tag_versions
+        })
+        self.client.set(self.KEY_PREFIX + key, value, ex=max(math.ceil(self.ttl), 1))
+
+    def tag_versions(self, tags: list[str]) -> list[int]:
+        if not tags:
+            return []
+        return [int(value or 0) for value in self.client.mget([self.TAG_PREFIX + tag for tag in tags])]
+
+    def bump(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self.client.incr(self.TAG_PREFIX + tag)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.KEY_PREFIX + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_backend(uri: str, ttl: float, max_size: int):
+    """
+    URI로 백엔드 생성
+
+    Raises:
+        ValueError: 지원하지 않는 스킴
+    """
+    scheme = uri.split("://", 1)[0]
+    if scheme == "memory":
+        return MemoryResponseCacheBackend(ttl=ttl, max_size=max_size)
+    if scheme in ("redis", "rediss"):
+        return RedisResponseCacheBackend(uri, ttl=ttl)
+    raise ValueError(f"Unsupported response cache backend: {uri}")
+
+
+class ResponseCache:
+    """
+    정규화된 요청 경로/쿼리를 키로 직렬화된 응답을 캐시
+
+    - Authorization 헤더가 있는 요청은 사용자별 응답(좋아요 여부 등)이므로 캐시하지 않음
+    - 항목은 저장 시점의 태그 버전을 함께 보관하고, invalidate()는 태그 버전만 올림
+      (조회 시 버전이 다르면 미스 → 태그별 키 목록을 관리하지 않아도 공유 백엔드에서 동일하게 동작)
+    - 태그 버전은 응답 생성 전에 읽으므로 생성 중 무효화된 응답은 다음 조회에서 미스 처리
+    - 백엔드 장애 시 캐시 없이 DB에서 조회
+    """
+
+    def __init__(self, backend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def is_cacheable(self, request: Request) -> bool:
+        return self.enabled and request.method == "GET" and "authorization" not in request.headers
+
+    @staticmethod
+    def key_for(request: Request) -> str:
+        """경로 + 정렬된 쿼리 파라미터 (빈 값 제외) 키"""
+        params = sorted((name, value) for name, value in request.query_params.multi_items() if value != "")
+        return f"{request.url.path}?{urlencode(params)}"
+
+    def lookup(self, key: str, tags: list[str]) -> tuple[Optional[CachedResponse], Optional[dict[str, int]]]:
+        """
+        캐시 조회
+
+        Returns:
+            tuple: (유효한 항목 또는 None, 현재 태그 버전 - 백엔드 장애 시 None)
+        """
+        try:
+            versions = dict(zip(tags, self.backend.tag_versions(tags)))
+            entry = self.backend.get(key)
+        except (RedisError, ConnectionError, TimeoutError, OSError):
+            logger.warning("Response cache backend unavailable", exc_info=True)
+            return None, None
+
+        if entry is not None and entry.tag_versions == versions:
+            self.hits += 1
+            return entry, versions
+        self.misses += 1
+        return None, versions
+
+    def store(
+        self, key: str, versions: dict[str, int], body: bytes,
+        etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> CachedResponse:
+        """본문 저장 (etag 미지정 시 본문 해시 사용)"""
+        entry = CachedResponse(body, etag or make_etag(body), versions, last_modified)
+        try:
+            self.backend.set(key, entry)
+        except (RedisError, ConnectionError, TimeoutError, OSError):
+            logger.warning("Response cache backend unavailable", exc_info=True)
+        return entry
+
+    def invalidate(self, *tags: str) -> None:
+        """태그가 붙은 모든 항목 무효화"""
+        try:
+            self.backend.bump(tags)
+        except (RedisError, ConnectionError, TimeoutError, OSError):
+            # 무효화 실패 시 항목은 TTL 만료까지 남음
+            logger.warning("Response cache invalidation failed: %s", tags, exc_info=True)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+response_cache = ResponseCache(
+    create_backend(settings.RESPONSE_CACHE_URI, settings.RESPONSE_CACHE_TTL_SECONDS, settings.RESPONSE_CACHE_MAX_SIZE),
+    enabled=settings.RESPONSE_CACHE_ENABLED
+)
+
+
+def _render(entry: CachedResponse, request: Request, cache_status: str) -> Response:
+    headers = {**entry.headers(), "X-Cache": cache_status}
+    if is_not_modified(request, entry.etag, entry.last_modified):
+        return not_modified_response(headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def cached_response(
+    tags: Callable[[dict], Iterable[str]],
+    on_hit: Optional[Callable[[dict], None]] = None,
+    condition: Optional[Callable[[dict], bool]] = None
+):
+    """
+    비로그인 GET 응답을 캐시하는 엔드포인트 데코레이터 (엔드포인트에 request 인자 필요)
+
+    캐시 적중 시 DB 조회와 응답 모델 직렬화를 모두 건너뛰고, If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+    예외로 끝난 요청(404 등)과 304 응답은 캐시하지 않습니다.
+    conditional_response 위에 적용하면 엔드포인트가 만든 ETag/Last-Modified를 본문과 함께 저장합니다.
+
+    Args:
+        tags: 엔드포인트 인자 → 항목에 붙일 태그 목록
+        on_hit: 캐시 적중 시 실행할 부수 효과 (예: 조회수 기록)
+        condition: False를 반환하면 캐시하지 않고 엔드포인트를 그대로 실행
+    """
+    def decorator(func):
+        def prepare(kwargs):
+            request: Request = kwargs["request"]
+            if not response_cache.is_cacheable(request) or (condition is not None and not condition(kwargs)):
+                return None, None, None
+            key = response_cache.key_for(request)
+            entry, versions = response_cache.lookup(key, list(tags(kwargs)))
+            return key, entry, versions
+
+        def finish(kwargs, key, versions, result):
+            etag = last_modified = None
+            if isinstance(result, Response):
+                if result.status_code != 200 or "etag" not in result.headers:
+                    return result
+                body = result.body
+                etag, last_modified = result.headers["etag"], result.headers.get("last-modified")
+            else:
+                body = JSONResponse(jsonable_encoder(result)).body
+            if versions is None:
+                entry = CachedResponse(body, etag or make_etag(body), {}, last_modified)
+            else:
+                entry = response_cache.store(key, versions, body, etag, last_modified)
+            return _render(entry, kwargs["request"], "MISS")
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                # 백엔드(동기 Redis 클라이언트) 호출과 on_hit은 이벤트 루프를 막지 않도록 스레드풀에서 실행
+                key, entry, versions = await run_in_threadpool(prepare, kwargs)
+                if key is None:
+                    return await func(*args, **kwargs)
+                if entry is not None:
+                    if on_hit is not None:
+                        await run_in_threadpool(on_hit, kwargs)
+                    return _render(entry, kwargs["request"], "HIT")
+                result = await func(*args, **kwargs)
+                return await run_in_threadpool(finish, kwargs, key, versions, result)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            key, entry, versions = prepare(kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            if entry is not None:
+                if on_hit is not None:
+                    on_hit(kwargs)
+                return _render(entry, kwargs["request"], "HIT")
+            return finish(kwargs, key, versions, func(*args, **kwargs))
+        return sync_wrapper
+
+    return decorator
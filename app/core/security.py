@@ -5,11 +5,11 @@ JWT 토큰 생성/검증 및 비밀번호 해싱
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
-import bcrypt
 import os
 from app.core.exceptions import UnauthorizedException, TokenExpiredException
 from app.core.error_codes import ErrorCode
 from app.core.config import settings
+from app.core.password_hasher import password_hasher
 
 # JWT 설정
 JWT_SECRET_KEY = settings.JWT_SECRET_KEY
@@ -20,7 +20,7 @@ REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
 
 def hash_password(password: str) -> str:
     """
-    비밀번호를 bcrypt로 해싱
+    비밀번호를 bcrypt로 해싱 (BCRYPT_ROUNDS, 전용 프로세스 풀에서 실행)
     bcrypt는 72 bytes 제한이 있으므로 자동으로 truncate
 
     Args:
@@ -28,15 +28,16 @@ def hash_password(password: str) -> str:
 
     Returns:
         해싱된 비밀번호
+
+    Raises:
+        ServiceUnavailableException: 해싱 대기열이 가득 참
     """
     # bcrypt has a 72-byte password limit, truncate if necessary
     password_bytes = password.encode('utf-8')
     if len(password_bytes) > 72:
         password_bytes = password_bytes[:72]
 
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode('utf-8')
+    return password_hasher.hash(password_bytes, settings.BCRYPT_ROUNDS)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -49,6 +50,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Returns:
         비밀번호 일치 여부
+
+    Raises:
+        ServiceUnavailableException: 해싱 대기열이 가득 참
     """
     # bcrypt has a 72-byte password limit, truncate if necessary
     password_bytes = plain_password.encode('utf-8')
@@ -56,7 +60,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         password_bytes = password_bytes[:72]
 
     hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    return password_hasher.verify(password_bytes, hashed_bytes)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (async 엔드포인트용, 요청 스레드를 점유하지 않고 결과 대기)"""
+    password_bytes = password.encode('utf-8')[:72]
+    return await password_hasher.hash_async(password_bytes, settings.BCRYPT_ROUNDS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (async 엔드포인트용, 요청 스레드를 점유하지 않고 결과 대기)"""
+    password_bytes = plain_password.encode('utf-8')[:72]
+    return await password_hasher.verify_async(password_bytes, hashed_password.encode('utf-8'))
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    해시의 cost가 현재 BCRYPT_ROUNDS와 다른지 확인 ($2b$<cost>$...)
+
+    Args:
+        hashed_password: 해싱된 비밀번호
+
+    Returns:
+        재해싱 필요 여부
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -0,0 +1,76 @@
+"""
+Background Tasks
+주기적으로 실행되는 백그라운드 작업
+"""
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    interval초마다 새 세션으로 작업을 실행하는 백그라운드 스레드
+
+    - 작업 중 예외가 발생하면 롤백 후 로그만 남기고 다음 주기에 다시 실행
+    - interval이 0 이하이면 start()해도 실행하지 않음
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Session], Any],
+        session_factory: Callable[[], Session],
+        interval: float
+    ):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self._session_factory = session_factory
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.run_count = 0
+        self.last_result: Any = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """백그라운드 스레드 시작"""
+        if self.is_running or self.interval <= 0:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """스레드 종료 (실행 중인 작업은 끝날 때까지 대기)"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> Any:
+        """작업 1회 실행"""
+        db = self._session_factory()
+        try:
+            result = self.func(db)
+        except Exception:
+            db.rollback()
+            logger.exception("periodic job %s failed", self.name)
+            return None
+        finally:
+            db.close()
+
+        self.run_count += 1
+        self.last_result = result
+        return result
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            self.run_once()
@@ -5,8 +5,9 @@ Admin Router
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.core.dependencies import get_current_user, require_role, get_sort_params
-from app.models.user import User, UserRole
+from app.core.dependencies import get_current_principal, require_role, get_sort_params, Principal
+from app.core.pagination import CountMode, get_total_pages
+from app.models.user import UserRole
 from app.domains.admin.schemas import (
     AdminUserResponse,
     AdminUserListResponse,
@@ -19,7 +20,6 @@ from app.domains.admin.schemas import (
 from app.domains.admin.service import AdminService
 from app.domains.base import BaseResponse, SuccessResponse
 from typing import Optional
-import math
 
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
@@ -37,8 +37,10 @@ def get_all_users(
     keyword: Optional[str] = Query(None, description="검색 키워드 (이메일 또는 이름)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
         allowed_fields=["id", "email", "name", "created_at", "role"]
     ))
@@ -46,19 +48,21 @@ def get_all_users(
     """전체 사용자 목록 조회 (ADMIN)"""
     sort_field, sort_order = sort_params if sort_params else ("created_at", "desc")
 
-    users, total = AdminService.get_all_users(
+    users, total, next_cursor = AdminService.get_all_users(
         db=db,
         role=role,
         keyword=keyword,
         page=page,
         size=size,
         sort_field=sort_field,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        count_mode=count
     )
 
     # 응답 데이터 구성
     user_list = [AdminUserResponse.model_validate(user) for user in users]
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
 
     payload_data = AdminUserListResponse(
         content=user_list,
@@ -66,7 +70,10 @@ def get_all_users(
         size=size,
         total_elements=total,
         total_pages=total_pages,
-        sort=f"{sort_field},{sort_order}"
+        sort=f"{sort_field},{sort_order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=count
     ).model_dump(by_alias=True) # model_dump with by_alias=True to handle camelCase
 
     return BaseResponse(
@@ -87,7 +94,7 @@ def update_user_role(
     user_id: int,
     data: RoleUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """사용자 역할 변경 (ADMIN)"""
     user = AdminService.update_user_role(db, user_id, data)
@@ -108,7 +115,7 @@ def update_user_role(
 )
 def get_stats(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """통계 조회 (ADMIN)"""
     stats = AdminService.get_stats(db)
@@ -131,7 +138,7 @@ def update_order_status(
     order_id: int,
     data: OrderStatusUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """주문 상태 변경 (ADMIN)"""
     AdminService.update_order_status(db, order_id, data)
@@ -152,7 +159,7 @@ def update_order_status(
 def create_coupon(
     data: CouponCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """쿠폰 생성 (ADMIN)"""
     coupon = AdminService.create_coupon(db, data)
@@ -176,7 +183,7 @@ def issue_coupon(
     coupon_id: int,
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """쿠폰 발급 (ADMIN)"""
     AdminService.issue_coupon_to_user(db, coupon_id, user_id)
@@ -3,7 +3,7 @@ Admin Service
 관리자 관련 비즈니스 로직
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from app.models.user import User, UserRole
 from app.models.book import Book
@@ -15,6 +15,9 @@ from app.domains.admin.schemas import (
     CouponCreateRequest
 )
 from app.core.exceptions import NotFoundException, BadRequestException, ConflictException
+from app.core.pagination import CountMode, count_total, paginate
+from app.core.auth_cache import invalidate_user
+from app.core.response_cache import COUPON_LIST_TAG, response_cache
 from typing import Optional
 
 
@@ -29,8 +32,10 @@ class AdminService:
         page: int = 1,
         size: int = 20,
         sort_field: str = "created_at",
-        sort_order: str = "DESC"
-    ) -> tuple[list[User], int]:
+        sort_order: str = "DESC",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> tuple[list[User], Optional[int], Optional[str]]:
         """
         전체 사용자 목록 조회
 
@@ -39,9 +44,11 @@ class AdminService:
             role: 역할 필터 (선택)
             page: 페이지 번호
             size: 페이지 크기
+            cursor: 다음 페이지 커서 (지정 시 page 무시)
+            count_mode: 전체 개수 조회 방식 (exact/estimate/none)
 
         Returns:
-            tuple: (사용자 목록, 전체 개수)
+            tuple: (사용자 목록, 전체 개수 - none 모드면 None, 다음 페이지 커서)
         """
         query = db.query(User)
 
@@ -54,21 +61,16 @@ class AdminService:
                 (User.name.ilike(f"%{keyword}%"))
             )
 
-        # 동적 정렬
-        if sort_field:
-            if sort_order.upper() == "DESC":
-                query = query.order_by(desc(getattr(User, sort_field)))
-            else:
-                query = query.order_by(getattr(User, sort_field))
-
         # 전체 개수
-        total = query.count()
+        total = count_total(query, count_mode, ("admin_users", role, keyword))
 
-        # 페이지네이션
-        offset = (page - 1) * size
-        users = query.offset(offset).limit(size).all()
+        # 동적 정렬 + 페이지네이션
+        users, next_cursor = paginate(
+            query, getattr(User, sort_field), User.id, sort_field, sort_order,
+            size=size, page=page, cursor=cursor
+        )
 
-        return users, total
+        return users, total, next_cursor
 
     @staticmethod
     def update_user_role(db: Session, user_id: int, data: RoleUpdateRequest) -> User:
@@ -90,8 +92,10 @@ class AdminService:
         if not user:
             raise NotFoundException("USER_NOT_FOUND", "User not found")
 
-        # 역할 변경
-        user.role = data.role
+        # 역할 변경 (토큰 버전을 올려 이전 역할로 발급된 액세스 토큰 폐기)
+        if user.role != data.role:
+            user.role = data.role
+            user.token_version = (user.token_version or 0) + 1
 
         try:
             db.commit()
@@ -100,6 +104,7 @@ class AdminService:
             db.rollback()
             raise BadRequestException("UPDATE_FAILED", f"Failed to update user role: {str(e)}")
 
+        invalidate_user(user_id)
         return user
 
     @staticmethod
@@ -224,6 +229,7 @@ class AdminService:
             db.rollback()
             raise BadRequestException("COUPON_CREATE_FAILED", f"Failed to create coupon: {str(e)}")
 
+        response_cache.invalidate(COUPON_LIST_TAG)
         return coupon
 
     @staticmethod
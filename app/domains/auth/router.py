@@ -2,8 +2,9 @@
 Auth Domain Router
 """
 from fastapi import APIRouter, Depends, status, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.domains.auth import schemas, service
 from app.domains.base import BaseResponse, SuccessResponse
 from app.core.limiter import limiter
@@ -20,8 +21,8 @@ def signup(data: schemas.SignupRequest, request: Request, db: Session = Depends(
 
 @router.post("/login", response_model=BaseResponse[schemas.TokenResponse])
 @limiter.limit("10/minute")
-def login(data: schemas.LoginRequest, request: Request, db: Session = Depends(get_db)):
-    result = service.login(db, data)
+async def login(data: schemas.LoginRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
+    result = await service.login(db, data)
     return BaseResponse(is_success=True, message="로그인에 성공했습니다.", payload=result)
 
 
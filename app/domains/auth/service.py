@@ -1,11 +1,13 @@
 """
 Auth Domain Service
 """
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models import User, RefreshToken, UserRole
 from app.domains.auth import schemas
 from app.core.security import (
-    hash_password, verify_password, create_access_token,
+    hash_password, hash_password_async, verify_password_async, needs_rehash, create_access_token,
     create_refresh_token, decode_token, verify_token_type
 )
 from app.core.exceptions import (
@@ -18,6 +20,17 @@ import os
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
 
+def build_access_claims(user: User) -> dict:
+    """액세스 토큰 claim (Principal 생성에 필요한 정보 + 토큰 버전)"""
+    return {
+        "user_id": user.id,
+        "email": user.email,
+        "role": user.role.value,
+        "name": user.name,
+        "tv": user.token_version or 0
+    }
+
+
 def signup(db: Session, request: schemas.SignupRequest) -> schemas.SignupResponse:
     existing_user = db.query(User).filter(User.email == request.email).first()
     if existing_user:
@@ -36,18 +49,23 @@ def signup(db: Session, request: schemas.SignupRequest) -> schemas.SignupRespons
     return schemas.SignupResponse(user_id=new_user.id, created_at=new_user.created_at)
 
 
-def login(db: Session, request: schemas.LoginRequest) -> schemas.TokenResponse:
-    user = db.query(User).filter(User.email == request.email).first()
-    if not user or not verify_password(request.password, user.password):
+async def login(db: AsyncSession, request: schemas.LoginRequest) -> schemas.TokenResponse:
+    # bcrypt 검증/재해싱은 프로세스 풀 작업을 이벤트 루프에서 기다림 (로그인 폭주 시에도 스레드풀을 점유하지 않음)
+    user = (await db.execute(select(User).where(User.email == request.email))).scalars().first()
+    if not user or not await verify_password_async(request.password, user.password):
         raise InvalidCredentialsException(message="Invalid credentials")
+
+    # BCRYPT_ROUNDS가 변경되었으면 로그인 시 평문 비밀번호로 재해싱 (아래 커밋에 함께 반영)
+    if needs_rehash(user.password):
+        user.password = await hash_password_async(request.password)
     
-    token_data = {"user_id": user.id, "email": user.email, "role": user.role.value}
+    token_data = build_access_claims(user)
     access_token = create_access_token(token_data)
     refresh_token_str = create_refresh_token({"user_id": user.id})
     
     refresh_token = RefreshToken(user_id=user.id, token=refresh_token_str)
     db.add(refresh_token)
-    db.commit()
+    await db.commit()
     
     return schemas.TokenResponse(
         access_token=access_token, refresh_token=refresh_token_str,
@@ -72,7 +90,7 @@ def refresh_access_token(db: Session, request: schemas.RefreshTokenRequest) -> s
     if not user:
         raise UnauthorizedException(error_code=ErrorCode.USER_NOT_FOUND)
     
-    token_data = {"user_id": user.id, "email": user.email, "role": user.role.value}
+    token_data = build_access_claims(user)
     access_token = create_access_token(token_data)
     
     return schemas.TokenResponse(
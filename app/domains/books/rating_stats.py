@@ -0,0 +1,99 @@
+"""
+Book Rating Stats
+도서 평점 집계 테이블(book_rating_stats) 유지 및 재계산
+"""
+from typing import Optional
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.likes import insert_ignore
+from app.models import Book, BookRatingStats, Review
+
+RATINGS = (1, 2, 3, 4, 5)
+STATS_COLUMNS = ["book_id", "review_count", "rating_sum", "avg_rating", *(f"rating_{rating}" for rating in RATINGS)]
+
+
+def _histogram_column(rating: int):
+    return getattr(BookRatingStats, f"rating_{rating}")
+
+
+def _avg_rating(count, total):
+    """리뷰가 없으면 0, 있으면 소수 둘째 자리까지의 평균 평점"""
+    return case((count > 0, func.round(total * 1.0 / count, 2)), else_=0)
+
+
+def _aggregated():
+    """리뷰 테이블 기준 도서별 평점 집계 (STATS_COLUMNS 순서, 리뷰가 없는 도서 포함)"""
+    count = func.count(Review.id)
+    total = func.coalesce(func.sum(Review.rating), 0)
+    return select(
+        Book.id, count, total, _avg_rating(count, total),
+        *(func.coalesce(func.sum(case((Review.rating == rating, 1), else_=0)), 0) for rating in RATINGS)
+    ).outerjoin(Review, Review.book_id == Book.id).group_by(Book.id)
+
+
+def apply_rating_change(db: Session, book_id: int, added: Optional[int] = None, removed: Optional[int] = None) -> None:
+    """
+    리뷰 작성/수정/삭제에 따른 도서 평점 집계 갱신 (커밋은 호출자가 수행)
+
+    리뷰 변경과 같은 트랜잭션에서 실행하며, 카운터를 ± 증감한 뒤 갱신된 값으로 평균을 다시 계산합니다.
+    (평균 계산은 별도 UPDATE로 실행하여 SET 절 평가 순서가 DB마다 달라도 같은 결과)
+
+    Args:
+        db: 데이터베이스 세션
+        book_id: 도서 ID
+        added: 추가된 평점 (작성, 수정 후 평점)
+        removed: 제거된 평점 (삭제, 수정 전 평점)
+    """
+    if added == removed:
+        return
+
+    values = {
+        BookRatingStats.review_count: BookRatingStats.review_count + (added is not None) - (removed is not None),
+        BookRatingStats.rating_sum: BookRatingStats.rating_sum + (added or 0) - (removed or 0),
+    }
+    if added is not None:
+        values[_histogram_column(added)] = _histogram_column(added) + 1
+    if removed is not None:
+        values[_histogram_column(removed)] = _histogram_column(removed) - 1
+
+    stats = db.query(BookRatingStats).filter(BookRatingStats.book_id == book_id)
+    if not stats.update(values, synchronize_session=False):
+        # 집계 행이 없으면 리뷰 테이블 기준으로 생성 (방금 변경분 포함)
+        # 동시 요청이 먼저 생성했으면 중복을 무시하고 증감만 적용 (상대 트랜잭션의 집계에는 이 변경분이 없음)
+        db.flush()
+        row = db.execute(_aggregated().where(Book.id == book_id)).one()
+        if insert_ignore(db, BookRatingStats, dict(zip(STATS_COLUMNS, row)), ["book_id"]):
+            return
+        stats.update(values, synchronize_session=False)
+
+    stats.update(
+        {BookRatingStats.avg_rating: _avg_rating(BookRatingStats.review_count, BookRatingStats.rating_sum)},
+        synchronize_session=False
+    )
+
+
+def rebuild_rating_stats(db: Session, book_id: Optional[int] = None) -> dict:
+    """
+    리뷰 테이블 기준으로 평점 집계 재계산 (커밋은 호출자가 수행)
+
+    Args:
+        db: 데이터베이스 세션
+        book_id: 대상 도서 ID (None이면 전체 도서)
+
+    Returns:
+        dict: 처리 결과 (재계산된 도서 수)
+    """
+    aggregated = _aggregated()
+
+    stats = db.query(BookRatingStats)
+    if book_id is not None:
+        aggregated = aggregated.where(Book.id == book_id)
+        stats = stats.filter(BookRatingStats.book_id == book_id)
+
+    stats.delete(synchronize_session=False)
+    result = db.execute(
+        insert(BookRatingStats).from_select(STATS_COLUMNS, aggregated)
+    )
+    return {"rebuilt": result.rowcount or 0}
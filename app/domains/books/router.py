@@ -1,15 +1,21 @@
 from fastapi import APIRouter, Depends, status, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 from decimal import Decimal
 from datetime import date
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db, get_db
 from app.domains.books import schemas, service
 from app.domains.base import BaseResponse, SuccessResponse
-from app.core.dependencies import require_seller, get_optional_user, get_sort_params
+from app.core.dependencies import require_seller, get_optional_user, get_sort_params, Principal
+from app.core.pagination import CountMode
+from app.core.conditional import conditional_response
 from app.core.limiter import limiter
-from app.models import User
+from app.core.response_cache import BOOK_LIST_TAG, book_tag, cached_response
+from app.domains.books.trending import trending_ranking
+from app.domains.books.view_buffer import view_buffer
 
 router = APIRouter(prefix="/api/books", tags=["Books"])
 
@@ -25,26 +31,56 @@ def create_book(
     data: schemas.BookCreateRequest,
     request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_seller)
+    current_user: Principal = Depends(require_seller)
 ):
     result = service.create_book(db, data, current_user.id)
     return BaseResponse(is_success=True, message="도서가 성공적으로 생성되었습니다.", payload=result)
 
 
+@router.get(
+    "/trending",
+    response_model=BaseResponse[schemas.TrendingBookListResponse],
+    summary="인기 도서 조회"
+)
+@limiter.limit("100/minute")
+def list_trending_books(
+    request: Request,
+    window: schemas.TrendingWindow = Query("24h", description="집계 기간 (1h, 24h, 7d: 조회/찜/주문 점수 반감기)"),
+    size: int = Query(10, ge=1, le=settings.TRENDING_SNAPSHOT_SIZE, description="조회할 도서 수"),
+    db: Session = Depends(get_db)
+):
+    # 백그라운드 작업이 갱신한 메모리 스냅샷에서 응답 (DB는 스냅샷이 없을 때만 사용)
+    result = trending_ranking.top(db, window, size)
+    return BaseResponse(is_success=True, message="인기 도서가 성공적으로 조회되었습니다.", payload=result)
+
+
 @router.get(
     "/{book_id}",
     response_model=BaseResponse[schemas.BookResponse],
     summary="도서 상세 조회"
 )
 @limiter.limit("100/minute")
-def get_book(
+@cached_response(
+    tags=lambda kwargs: [book_tag(kwargs["book_id"])],
+    # 캐시 적중 시에도 조회 기록 (버퍼 미사용 시에는 요청마다 DB에 기록해야 하므로 캐시하지 않음)
+    on_hit=lambda kwargs: view_buffer.record(kwargs["book_id"]),
+    condition=lambda kwargs: view_buffer.is_running
+)
+@conditional_response(
+    lambda db, kwargs: service.get_book_version(db, kwargs["book_id"]),
+    # 304 응답도 조회로 기록
+    on_not_modified=lambda db, kwargs: service.record_view(
+        db, kwargs["book_id"], kwargs["current_user"].id if kwargs["current_user"] else None
+    )
+)
+async def get_book(
     book_id: int,
     request: Request,
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[Principal] = Depends(get_optional_user)
 ):
     user_id = current_user.id if current_user else None
-    result = service.get_book(db, book_id, user_id)
+    result = await service.get_book_async(db, book_id, user_id)
     return BaseResponse(is_success=True, message="도서가 성공적으로 조회되었습니다.", payload=result)
 
 
@@ -54,7 +90,8 @@ def get_book(
     summary="도서 목록 조회"
 )
 @limiter.limit("100/minute")
-def list_books(
+@cached_response(tags=lambda kwargs: [BOOK_LIST_TAG])
+async def list_books(
     request: Request,
     keyword: Optional[str] = Query(None, description="검색 키워드"),
     author: Optional[str] = Query(None, description="작가 필터"),
@@ -66,9 +103,11 @@ def list_books(
     end_date: Optional[date] = Query(None, description="종료일"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
+    db: AsyncSession = Depends(get_async_db),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
-        allowed_fields=["title", "author", "price", "publication_date", "created_at", "view_count"]
+        allowed_fields=["title", "author", "price", "publication_date", "created_at", "view_count", "relevance", "avg_rating"]
     ))
 ):
     sort_field, sort_order = sort_params if sort_params else ("created_at", "desc")
@@ -84,10 +123,12 @@ def list_books(
         end_date=end_date,
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count,
         sort=sort_field,
         order=sort_order
     )
-    result = service.list_books(db, params)
+    result = await service.list_books_async(db, params)
 
     # 응답 스키마에 맞게 정렬 필드 추가
     payload_data = result.model_dump()
@@ -107,7 +148,7 @@ def update_book(
     data: schemas.BookUpdateRequest,
     request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_seller)
+    current_user: Principal = Depends(require_seller)
 ):
     result = service.update_book(db, book_id, data, current_user.id, current_user.role.value)
     return BaseResponse(is_success=True, message="도서가 성공적으로 업데이트되었습니다.", payload=result)
@@ -123,7 +164,7 @@ def delete_book(
     book_id: int,
     request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_seller)
+    current_user: Principal = Depends(require_seller)
 ):
     service.delete_book(db, book_id, current_user.id, current_user.role.value)
     return SuccessResponse(message="도서가 성공적으로 삭제되었습니다.")
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, field_validator
 from datetime import date, datetime
 from typing import Optional, Literal
 from decimal import Decimal
+from app.core.pagination import CountMode
 
 
 class BookCreateRequest(BaseModel):
@@ -73,6 +74,9 @@ class BookResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     view_count: Optional[int] = 0
+    review_count: int = 0
+    average_rating: Optional[float] = None
+    rating_histogram: dict[str, int] = Field(default_factory=lambda: {str(rating): 0 for rating in range(1, 6)})
 
     model_config = {
         "from_attributes": True,
@@ -89,7 +93,10 @@ class BookResponse(BaseModel):
                 "publication_date": "2020-01-01",
                 "created_at": "2025-12-06T09:00:00",
                 "updated_at": "2025-12-06T09:00:00",
-                "view_count": 0
+                "view_count": 0,
+                "review_count": 3,
+                "average_rating": 4.33,
+                "rating_histogram": {"1": 0, "2": 0, "3": 1, "4": 0, "5": 2}
             }
         }
     }
@@ -99,9 +106,12 @@ class BookListResponse(BaseModel):
     content: list[BookResponse]
     page: int
     size: int
-    total_elements: int = Field(..., alias="totalElements")
-    total_pages: int = Field(..., alias="totalPages")
+    total_elements: Optional[int] = Field(..., alias="totalElements")
+    total_pages: Optional[int] = Field(..., alias="totalPages")
     sort: str
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+    has_next: bool = Field(False, alias="hasNext")
+    count_mode: CountMode = Field("exact", alias="countMode")
 
     model_config = {
         "populate_by_name": True,
@@ -112,7 +122,50 @@ class BookListResponse(BaseModel):
                 "size": 10,
                 "total_elements": 100,
                 "total_pages": 10,
-                "sort": "created_at,desc"
+                "sort": "created_at,desc",
+                "next_cursor": "eyJzIjoiY3JlYXRlZF9hdCIsIm8iOiJkZXNjIiwidiI6WyJkYXRldGltZSIsIjIwMjUtMTItMDZUMDk6MDA6MDAiXSwiaSI6OTF9",
+                "has_next": True,
+                "count_mode": "exact"
+            }
+        }
+    }
+
+
+TrendingWindow = Literal["1h", "24h", "7d"]
+
+
+class TrendingBookResponse(BaseModel):
+    rank: int
+    id: int
+    title: str
+    author: str
+    publisher: str
+    price: Decimal
+    score: float
+
+
+class TrendingBookListResponse(BaseModel):
+    window: TrendingWindow
+    content: list[TrendingBookResponse]
+    refreshed_at: Optional[datetime] = Field(None, alias="refreshedAt")
+
+    model_config = {
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "window": "24h",
+                "content": [
+                    {
+                        "rank": 1,
+                        "id": 1,
+                        "title": "채식주의자",
+                        "author": "한강",
+                        "publisher": "창비",
+                        "price": "10800.00",
+                        "score": 42.17
+                    }
+                ],
+                "refreshed_at": "2025-12-06T09:00:00"
             }
         }
     }
@@ -129,5 +182,9 @@ class BookSearchParams(BaseModel):
     end_date: Optional[date] = None
     page: int = Field(1, ge=1)
     size: int = Field(10, ge=1, le=100)
-    sort: Literal["title", "author", "price", "publication_date", "created_at", "view_count"] = "created_at"
+    cursor: Optional[str] = None
+    count_mode: CountMode = "exact"
+    sort: Literal[
+        "title", "author", "price", "publication_date", "created_at", "view_count", "relevance", "avg_rating"
+    ] = "created_at"
     order: Literal["asc", "desc"] = "desc"
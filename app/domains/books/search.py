@@ -0,0 +1,221 @@
+"""
+Book Search
+도서 키워드 검색 백엔드 (LIKE / MySQL FULLTEXT / 인메모리 역색인)
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from sqlalchemy import case, false, literal, or_
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+from app.models import Book
+
+# 필드별 관련도 가중치 (제목 > 저자 > 출판사)
+FIELD_WEIGHTS = {"title": 3, "author": 2, "publisher": 1}
+
+
+def _search_fields(book) -> dict[str, str]:
+    return {field: (getattr(book, field) or "").lower() for field in FIELD_WEIGHTS}
+
+
+class SearchBackend(ABC):
+    """
+    도서 검색 백엔드 인터페이스
+
+    apply()는 키워드 조건이 적용된 쿼리와 관련도 컬럼을 반환합니다.
+    (관련도 컬럼은 sort=relevance 정렬에 사용)
+    """
+    name = "base"
+
+    @abstractmethod
+    def apply(self, db: Session, query: Query, keyword: str) -> tuple[Query, object]:
+        """키워드 조건 적용 (조건이 적용된 쿼리, 관련도 컬럼)"""
+
+    def index_book(self, book: Book) -> None:
+        """도서 생성/수정 후 호출"""
+
+    def remove_book(self, book_id: int) -> None:
+        """도서 삭제 후 호출"""
+
+
+class LikeSearchBackend(SearchBackend):
+    """LIKE '%keyword%' 검색 (모든 DB 지원, 인덱스 미사용)"""
+    name = "like"
+
+    def apply(self, db: Session, query: Query, keyword: str) -> tuple[Query, object]:
+        pattern = f"%{keyword}%"
+        columns = {field: getattr(Book, field) for field in FIELD_WEIGHTS}
+
+        query = query.filter(or_(*(column.like(pattern) for column in columns.values())))
+        relevance = sum(
+            case((columns[field].like(pattern), weight), else_=0)
+            for field, weight in FIELD_WEIGHTS.items()
+        )
+        return query, relevance
+
+
+class FullTextSearchBackend(SearchBackend):
+    """
+    MySQL FULLTEXT(ngram) 검색
+
+    ft_books_search 인덱스를 사용하는 MATCH ... AGAINST 구문으로 검색합니다.
+    MySQL이 아니거나 키워드가 ngram 토큰 길이(2)보다 짧으면 LIKE 검색으로 대체합니다.
+    """
+    name = "fulltext"
+    min_token_length = 2
+
+    def __init__(self):
+        self._fallback = LikeSearchBackend()
+
+    def apply(self, db: Session, query: Query, keyword: str) -> tuple[Query, object]:
+        # 구문 검색("...")으로 ngram 토큰이 연속된 경우만 매칭 (부분 문자열 검색과 동일한 결과)
+        phrase = keyword.replace('"', " ").strip()
+        if db.get_bind().dialect.name != "mysql" or len(phrase) < self.min_token_length:
+            return self._fallback.apply(db, query, keyword)
+
+        relevance = match(Book.title, Book.author, Book.publisher, against=f'"{phrase}"').in_boolean_mode()
+        return query.filter(relevance), relevance
+
+
+class InvertedIndexSearchBackend(SearchBackend):
+    """
+    인메모리 역색인 검색
+
+    - 제목/저자/출판사를 단어별 소문자 bigram으로 토큰화하여 도서 ID 목록을 보관
+    - 키워드의 bigram 교집합으로 후보를 찾은 뒤 부분 문자열 포함 여부로 검증
+    - 첫 검색 시 books 테이블에서 색인을 만들고, refresh_interval마다 다시 구축
+      (다른 프로세스에서 변경된 도서 반영)
+    - 구축은 한 스레드만 실행 (첫 구축 중 동시 검색은 완료를 기다리고, 재구축 중에는 기존 색인으로 응답)
+    - 같은 프로세스의 도서 생성/수정/삭제는 index_book/remove_book으로 즉시 반영
+    """
+    name = "inverted"
+
+    def __init__(self, refresh_interval: float = 300.0):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._postings: dict[str, set[int]] = {}
+        self._documents: dict[int, dict[str, str]] = {}
+        self._built_at: Optional[float] = None
+
+    @staticmethod
+    def tokenize(text: str) -> set[str]:
+        tokens = set()
+        for word in text.lower().split():
+            tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+        return tokens
+
+    def build(self, db: Session) -> None:
+        """books 테이블 전체로 색인 재구축"""
+        rows = db.query(Book.id, Book.title, Book.author, Book.publisher).all()
+        with self._lock:
+            self._postings = {}
+            self._documents = {}
+            for row in rows:
+                self._add(row.id, _search_fields(row))
+            self._built_at = time.monotonic()
+
+    def search(self, db: Session, keyword: str) -> dict[int, int]:
+        """
+        키워드를 포함하는 도서 검색
+
+        Returns:
+            도서 ID -> 관련도 점수
+        """
+        self._ensure_built(db)
+        needle = keyword.lower().strip()
+        if not needle:
+            return {}
+
+        with self._lock:
+            candidates = self._candidates(needle)
+            scores = {}
+            for book_id in candidates:
+                fields = self._documents[book_id]
+                score = sum(weight for field, weight in FIELD_WEIGHTS.items() if needle in fields[field])
+                if score:
+                    scores[book_id] = score
+            return scores
+
+    def apply(self, db: Session, query: Query, keyword: str) -> tuple[Query, object]:
+        scores = self.search(db, keyword)
+        if not scores:
+            return query.filter(false()), literal(0)
+
+        relevance = case(scores, value=Book.id, else_=0)
+        return query.filter(Book.id.in_(scores.keys())), relevance
+
+    def index_book(self, book: Book) -> None:
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._remove(book.id)
+            self._add(book.id, _search_fields(book))
+
+    def remove_book(self, book_id: int) -> None:
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._remove(book_id)
+
+    def _is_stale(self) -> bool:
+        built_at = self._built_at
+        return built_at is None or time.monotonic() - built_at > self.refresh_interval
+
+    def _ensure_built(self, db: Session) -> None:
+        if not self._is_stale():
+            return
+
+        # 색인이 있으면 다른 스레드가 재구축하는 동안 기다리지 않고 기존 색인 사용
+        if not self._build_lock.acquire(blocking=self._built_at is None):
+            return
+        try:
+            # 락을 기다리는 동안 다른 스레드가 구축을 마쳤으면 생략
+            if self._is_stale():
+                self.build(db)
+        finally:
+            self._build_lock.release()
+
+    def _candidates(self, needle: str) -> Iterable[int]:
+        tokens = self.tokenize(needle)
+        # 한 글자 키워드처럼 bigram이 없으면 전체 문서를 검증
+        if not tokens:
+            return list(self._documents)
+
+        postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+        return set.intersection(*postings)
+
+    def _add(self, book_id: int, fields: dict[str, str]) -> None:
+        self._documents[book_id] = fields
+        for token in self.tokenize(" ".join(fields.values())):
+            self._postings.setdefault(token, set()).add(book_id)
+
+    def _remove(self, book_id: int) -> None:
+        fields = self._documents.pop(book_id, None)
+        if fields is None:
+            return
+        for token in self.tokenize(" ".join(fields.values())):
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(book_id)
+                if not posting:
+                    del self._postings[token]
+
+
+def create_search_backend(name: str) -> SearchBackend:
+    backends = {
+        LikeSearchBackend.name: LikeSearchBackend,
+        FullTextSearchBackend.name: FullTextSearchBackend,
+    }
+    if name == InvertedIndexSearchBackend.name:
+        return InvertedIndexSearchBackend(refresh_interval=settings.SEARCH_INDEX_REFRESH_SECONDS)
+    if name not in backends:
+        raise ValueError(f"Unknown search backend: {name}")
+    return backends[name]()
+
+
+search_backend = create_search_backend(settings.SEARCH_BACKEND)
@@ -1,13 +1,60 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func, desc, asc
-from app.models import Book, BookView, UserRole
+from app.models import Book, BookRatingStats, BookView, BookViewCount, UserRole
 from app.domains.books import schemas
+from app.domains.books.view_buffer import view_buffer
+from app.domains.books.view_counts import increment_view_counts
+from app.domains.books.search import search_backend
 from app.core.exceptions import (
     BookNotFoundException, ConflictException, ForbiddenException
 )
+from app.core.conditional import ResourceVersion, latest
 from app.core.error_codes import ErrorCode
+from app.core.pagination import count_total, get_total_pages, paginate
+from app.core.response_cache import BOOK_LIST_TAG, book_reviews_tag, book_tag, response_cache
 from typing import Optional
-import math
+
+
+def _with_view_counts(query, inner: bool = False):
+    """
+    도서 쿼리에 조회수 프로젝션 컬럼 추가
+
+    book_view_counts 집계 테이블을 조인하여 books 행과 함께 한 번의 쿼리로
+    조회수를 가져옵니다. (목록/상세 조회 공용)
+
+    집계 행은 도서 등록 시 생성되고 마이그레이션/ensure_view_counts가 누락분을 채우므로
+    inner=True(조회수 정렬)여도 목록에서 빠지는 도서가 없습니다.
+    """
+    join = query.join if inner else query.outerjoin
+    return join(BookViewCount, BookViewCount.book_id == Book.id)
+
+
+def _with_rating_stats(query, inner: bool = False):
+    """
+    도서 쿼리에 평점 집계 테이블(book_rating_stats) 조인
+
+    리뷰 수/평균/분포를 리뷰 집계 없이 books 행과 함께 조회합니다. (목록/상세 조회 공용)
+
+    집계 행은 도서 등록 시 생성되고 마이그레이션/rebuild_rating_stats가 누락분을 채우므로
+    inner=True(평균 평점 정렬)여도 목록에서 빠지는 도서가 없습니다.
+    """
+    join = query.join if inner else query.outerjoin
+    return join(BookRatingStats, BookRatingStats.book_id == Book.id)
+
+
+def _to_book_response(
+    book: Book, view_count: Optional[int], rating_stats: Optional[BookRatingStats] = None
+) -> schemas.BookResponse:
+    book_response = schemas.BookResponse.model_validate(book)
+    # 아직 버퍼에서 기록되지 않은 조회수 포함
+    book_response.view_count = (view_count or 0) + view_buffer.pending_count(book.id)
+    if rating_stats is not None and rating_stats.review_count:
+        book_response.review_count = rating_stats.review_count
+        book_response.average_rating = float(rating_stats.avg_rating)
+        book_response.rating_histogram = {
+            str(rating): getattr(rating_stats, f"rating_{rating}") for rating in range(1, 6)
+        }
+    return book_response
 
 
 def create_book(db: Session, request: schemas.BookCreateRequest, seller_id: int) -> schemas.BookResponse:
@@ -30,43 +77,76 @@ def create_book(db: Session, request: schemas.BookCreateRequest, seller_id: int)
         publication_date=request.publication_date
     )
     db.add(new_book)
+    db.flush()
+
+    # 조회수/평점 집계 테이블 초기화
+    db.add(BookViewCount(book_id=new_book.id, view_count=0, rolled_up_count=0))
+    db.add(BookRatingStats(book_id=new_book.id))
     db.commit()
     db.refresh(new_book)
+    search_backend.index_book(new_book)
+    response_cache.invalidate(BOOK_LIST_TAG)
 
     return schemas.BookResponse.model_validate(new_book)
 
 
 def get_book(db: Session, book_id: int, user_id: Optional[int] = None) -> schemas.BookResponse:
-    book = db.query(Book).filter(Book.id == book_id).first()
-    if not book:
+    row = _with_rating_stats(_with_view_counts(db.query(Book, BookViewCount.view_count, BookRatingStats))).filter(
+        Book.id == book_id
+    ).first()
+    if not row:
         raise BookNotFoundException(
             message=f"Book with ID {book_id} not found",
             details={"book_id": book_id}
         )
+    book, view_count, rating_stats = row
+
+    if not record_view(db, book_id, user_id):
+        view_count = (view_count or 0) + 1
+
+    return _to_book_response(book, view_count, rating_stats)
+
 
-    view_record = BookView(user_id=user_id, book_id=book_id)
-    db.add(view_record)
+def record_view(db: Session, book_id: int, user_id: Optional[int] = None) -> bool:
+    """
+    도서 조회 기록
+
+    Returns:
+        bool: 버퍼에 적재했는지 여부 (False면 즉시 기록 및 커밋 완료)
+    """
+    if view_buffer.is_running:
+        # write-behind: 버퍼에 적재 후 일괄 기록 (대기 조회수는 응답에 포함됨)
+        view_buffer.record(book_id, user_id)
+        return True
+
+    db.add(BookView(user_id=user_id, book_id=book_id))
+    increment_view_counts(db, [book_id])
     db.commit()
+    return False
 
-    view_count = db.query(func.count(BookView.id)).filter(BookView.book_id == book_id).scalar()
 
-    book_response = schemas.BookResponse.model_validate(book)
-    book_response.view_count = view_count
-    return book_response
+def get_book_version(db: Session, book_id: int) -> Optional[ResourceVersion]:
+    """
+    도서 상세 응답 버전 (조건부 요청용, 없는 도서면 None)
+
+    평점 집계(리뷰 수, 합계, 수정 시각)는 포함하고, 조회수는 요청마다 증가하므로 포함하지 않습니다.
+    (304 응답 시 클라이언트의 조회수는 이전 값 유지)
+    """
+    row = _with_rating_stats(db.query(
+        Book.updated_at, BookRatingStats.review_count, BookRatingStats.rating_sum,
+        BookRatingStats.updated_at.label("rating_updated_at")
+    )).filter(Book.id == book_id).first()
+    if row is None:
+        return None
+    return ResourceVersion("book", book_id, *row, last_modified=latest(row.updated_at, row.rating_updated_at))
 
 
 def list_books(db: Session, params: schemas.BookSearchParams) -> schemas.BookListResponse:
     query = db.query(Book)
 
+    relevance = None
     if params.keyword:
-        search_pattern = f"%{params.keyword}%"
-        query = query.filter(
-            or_(
-                Book.title.like(search_pattern),
-                Book.author.like(search_pattern),
-                Book.publisher.like(search_pattern)
-            )
-        )
+        query, relevance = search_backend.apply(db, query, params.keyword)
 
     if params.author:
         query = query.filter(Book.author.like(f"%{params.author}%"))
@@ -89,33 +169,37 @@ def list_books(db: Session, params: schemas.BookSearchParams) -> schemas.BookLis
     if params.end_date:
         query = query.filter(Book.publication_date <= params.end_date)
 
-    if params.sort == "view_count":
-        subquery = db.query(
-            BookView.book_id,
-            func.count(BookView.id).label("view_count")
-        ).group_by(BookView.book_id).subquery()
+    # 조회수/평균 평점 정렬은 집계 테이블의 인덱스(view_count, avg_rating)를 사용하도록 내부 조인
+    # (모든 도서에 집계 행이 있으므로 목록/전체 개수는 외부 조인과 동일)
+    query = _with_view_counts(query, inner=params.sort == "view_count")
+    query = _with_rating_stats(query, inner=params.sort == "avg_rating")
 
-        query = query.outerjoin(subquery, Book.id == subquery.c.book_id)
-        order_col = subquery.c.view_count
-    else:
-        order_col = getattr(Book, params.sort)
+    count_key = ("books",) + tuple(
+        getattr(params, field) for field in
+        ("keyword", "author", "publisher", "isbn", "min_price", "max_price", "start_date", "end_date")
+    )
+    total_elements = count_total(query, params.count_mode, count_key)
+    total_pages = get_total_pages(total_elements, params.size)
 
-    if params.order == "desc":
-        query = query.order_by(desc(order_col))
-    else:
-        query = query.order_by(asc(order_col))
+    # 페이지 도서와 조회수, 평점 집계를 한 번의 쿼리로 조회
+    query = query.add_columns(BookViewCount.view_count, BookRatingStats)
 
-    total_elements = query.count()
-    total_pages = math.ceil(total_elements / params.size)
+    if params.sort == "view_count":
+        order_col = BookViewCount.view_count
+    elif params.sort == "avg_rating":
+        order_col = BookRatingStats.avg_rating
+    elif params.sort == "relevance":
+        # 키워드가 없으면 관련도 대신 등록일 기준 정렬
+        order_col = relevance if relevance is not None else Book.created_at
+    else:
+        order_col = getattr(Book, params.sort)
 
-    books = query.offset((params.page - 1) * params.size).limit(params.size).all()
+    rows, next_cursor = paginate(
+        query, order_col, Book.id, params.sort, params.order,
+        size=params.size, page=params.page, cursor=params.cursor
+    )
 
-    book_responses = []
-    for book in books:
-        view_count = db.query(func.count(BookView.id)).filter(BookView.book_id == book.id).scalar()
-        book_response = schemas.BookResponse.model_validate(book)
-        book_response.view_count = view_count
-        book_responses.append(book_response)
+    book_responses = [_to_book_response(book, count, rating_stats) for book, count, rating_stats in rows]
 
     return schemas.BookListResponse(
         content=book_responses,
@@ -123,10 +207,23 @@ def list_books(db: Session, params: schemas.BookSearchParams) -> schemas.BookLis
         size=params.size,
         total_elements=total_elements,
         total_pages=total_pages,
-        sort=f"{params.sort},{params.order}"
+        sort=f"{params.sort},{params.order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=params.count_mode
     )
 
 
+async def get_book_async(db: AsyncSession, book_id: int, user_id: Optional[int] = None) -> schemas.BookResponse:
+    # 동기 조회 로직을 run_sync의 greenlet 안에서 그대로 실행
+    # (DB I/O 대기만 비동기 드라이버로 양보하고, 쿼리 구성/결과 변환은 이벤트 루프 스레드에서 동기 실행)
+    return await db.run_sync(get_book, book_id, user_id)
+
+
+async def list_books_async(db: AsyncSession, params: schemas.BookSearchParams) -> schemas.BookListResponse:
+    return await db.run_sync(list_books, params)
+
+
 def update_book(
     db: Session, book_id: int, request: schemas.BookUpdateRequest, user_id: int, user_role: str
 ) -> schemas.BookResponse:
@@ -158,6 +255,8 @@ def update_book(
 
     db.commit()
     db.refresh(book)
+    search_backend.index_book(book)
+    response_cache.invalidate(BOOK_LIST_TAG, book_tag(book_id))
 
     return schemas.BookResponse.model_validate(book)
 
@@ -178,3 +277,5 @@ def delete_book(db: Session, book_id: int, user_id: int, user_role: str) -> None
 
     db.delete(book)
     db.commit()
+    search_backend.remove_book(book_id)
+    response_cache.invalidate(BOOK_LIST_TAG, book_tag(book_id), book_reviews_tag(book_id))
@@ -0,0 +1,321 @@
+"""
+Book Trending
+기간별 시간 감쇠 인기 점수(book_trending_scores) 증분 갱신 및 인기 도서 스냅샷
+"""
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import Select, and_, bindparam, case, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domains.books import schemas
+from app.models import Book, BookTrendingScore, BookTrendingState, BookView, Favorite, Order, OrderItem, OrderStatus
+
+# 기간별 점수 반감기 (이벤트 점수는 반감기가 지날 때마다 절반으로 감소)
+HALF_LIVES = {"1h": timedelta(hours=1), "24h": timedelta(hours=24), "7d": timedelta(days=7)}
+
+# 현재 시각 기준 점수가 이 값보다 작아진 행은 삭제 (조회 1건 기준 반감기의 약 6.6배 경과)
+MIN_SCORE = 0.01
+
+# 점수는 고정 기준 시각(epoch)에 대한 값으로 저장하므로 시간이 지날수록 새 이벤트 점수가 커짐
+# 가장 짧은 반감기 기준으로 이만큼 지나면 기준 시각을 옮겨 float 범위를 유지 (1h 기준 약 21일마다)
+REBASE_HALF_LIVES = 512
+
+# 한 번에 읽는 이벤트 행 수 (밀린 이벤트는 여러 배치로 나누어 반영)
+BATCH_SIZE = 5000
+
+# 건너뛴 ID(아직 커밋되지 않은 트랜잭션의 행일 수 있음)를 재확인하는 기간과 최대 개수
+# (기간이 지나도 나타나지 않으면 롤백/삭제된 것으로 보고 제외, 개수 초과 시 최근 ID만 유지)
+PENDING_ID_TIMEOUT = timedelta(minutes=5)
+MAX_PENDING_IDS = 10000
+
+# 최초 실행 시 반영하는 과거 이벤트 범위 (가장 긴 반감기의 배수)
+BOOTSTRAP_HALF_LIVES = 4
+
+STATE_ID = 1
+
+
+def _growth(period: str, epoch: datetime, at: datetime) -> float:
+    """기준 시각 epoch 대비 at 시각 이벤트의 점수 배율 (2^(경과 시간 / 반감기))"""
+    return 2.0 ** ((at - epoch) / HALF_LIVES[period])
+
+
+class EventSource:
+    """
+    인기 점수에 반영하는 이벤트 종류
+
+    query()는 (id, book_id, occurred_at, units, counted) 컬럼을 조회합니다. 반영 제외 조건은 WHERE가 아닌
+    counted 컬럼으로 표시하여, 조회 결과에 없는 ID는 아직 커밋되지 않았거나 롤백/삭제된 행만 남도록 합니다.
+    """
+
+    def __init__(self, weight: float, id_column, state_attr: str, pending_attr: str, query: Callable[[], Select]):
+        self.weight = weight
+        self.id_column = id_column
+        self.state_attr = state_attr
+        self.pending_attr = pending_attr
+        self.query = query
+
+
+def _view_events() -> Select:
+    return select(
+        BookView.id.label("id"), BookView.book_id, BookView.viewed_at.label("occurred_at"),
+        literal(1).label("units"), literal(1).label("counted")
+    )
+
+
+def _favorite_events() -> Select:
+    # 반영 전에 삭제된 찜은 제외 (반영 후 삭제는 점수에서 빼지 않고 감쇠에 맡김)
+    return select(
+        Favorite.id.label("id"), Favorite.book_id, Favorite.created_at.label("occurred_at"),
+        literal(1).label("units"), case((Favorite.is_deleted.is_(False), 1), else_=0).label("counted")
+    )
+
+
+def _order_events() -> Select:
+    # 취소된 주문, 도서가 삭제된 주문 항목은 제외
+    counted = case((and_(OrderItem.book_id.isnot(None), Order.status != OrderStatus.CANCELLED), 1), else_=0)
+    return select(
+        OrderItem.id.label("id"), OrderItem.book_id, Order.created_at.label("occurred_at"),
+        OrderItem.quantity.label("units"), counted.label("counted")
+    ).join(Order, Order.id == OrderItem.order_id)
+
+
+# 이벤트 종류별 가중치 (주문은 수량만큼 적용)
+EVENT_SOURCES = [
+    EventSource(1.0, BookView.id, "last_view_id", "pending_view_ids", _view_events),
+    EventSource(3.0, Favorite.id, "last_favorite_id", "pending_favorite_ids", _favorite_events),
+    EventSource(5.0, OrderItem.id, "last_order_item_id", "pending_order_item_ids", _order_events),
+]
+
+
+def _bootstrap_state(db: Session, now: datetime) -> BookTrendingState:
+    """최초 실행 시 최근 이벤트부터 반영하도록 상태 행 생성 (전체 이력을 다시 읽지 않음)"""
+    cutoff = now - max(HALF_LIVES.values()) * BOOTSTRAP_HALF_LIVES
+    state = BookTrendingState(id=STATE_ID, epoch=now, refreshed_at=now)
+    for source in EVENT_SOURCES:
+        # 범위 내 첫 이벤트 직전 ID부터 시작 (오래된 행이 압축/삭제되어도 빈 ID로 기록되지 않음)
+        events = source.query().subquery()
+        first_id = db.execute(select(func.min(events.c.id)).where(events.c.occurred_at >= cutoff)).scalar()
+        if first_id is None:
+            first_id = (db.execute(select(func.max(events.c.id))).scalar() or 0) + 1
+        setattr(state, source.state_attr, first_id - 1)
+        setattr(state, source.pending_attr, [])
+    db.add(state)
+    db.flush()
+    return state
+
+
+def _scan_events(db: Session, source: EventSource, state: BookTrendingState, now: datetime) -> list:
+    """
+    마지막 반영 ID 이후의 이벤트와, 이전 갱신에서 건너뛴 ID 중 그 사이 커밋된 이벤트 조회
+
+    자동 증가 ID는 커밋 순서와 다르므로 더 작은 ID의 트랜잭션이 나중에 커밋될 수 있습니다.
+    조회 중 건너뛴 ID는 재확인 목록에 두고 다음 갱신에서 다시 조회하며, 각 ID는 한 번만 반영됩니다.
+    """
+    last_id = getattr(state, source.state_attr)
+    pending = {
+        event_id: datetime.fromisoformat(first_seen)
+        for event_id, first_seen in getattr(state, source.pending_attr) or []
+        if now - datetime.fromisoformat(first_seen) < PENDING_ID_TIMEOUT
+    }
+
+    rows = []
+    if pending:
+        rows = db.execute(source.query().where(source.id_column.in_(list(pending)))).all()
+        for row in rows:
+            del pending[row.id]
+
+    while True:
+        batch = db.execute(
+            source.query().where(source.id_column > last_id).order_by(source.id_column).limit(BATCH_SIZE)
+        ).all()
+        for row in batch:
+            pending.update((event_id, now) for event_id in range(max(last_id + 1, row.id - MAX_PENDING_IDS), row.id))
+            last_id = row.id
+        rows.extend(batch)
+        if len(batch) < BATCH_SIZE:
+            break
+
+    setattr(state, source.state_attr, last_id)
+    setattr(state, source.pending_attr, [
+        [event_id, pending[event_id].isoformat()] for event_id in sorted(pending)[-MAX_PENDING_IDS:]
+    ])
+    return rows
+
+
+def _collect_increments(db: Session, state: BookTrendingState, now: datetime) -> tuple[dict, int]:
+    """새로 커밋된 이벤트를 기준 시각(epoch) 대비 발생 시각만큼의 배율로 기간별/도서별 합산"""
+    increments = {period: defaultdict(float) for period in HALF_LIVES}
+    collected = 0
+
+    for source in EVENT_SOURCES:
+        for row in _scan_events(db, source, state, now):
+            if not row.counted:
+                continue
+            # 발생 시각이 갱신 시각보다 늦게 기록된 경우(시계 차이)는 갱신 시각으로 취급
+            occurred_at = min(row.occurred_at, now)
+            for period in HALF_LIVES:
+                increments[period][row.book_id] += source.weight * row.units * _growth(period, state.epoch, occurred_at)
+            collected += 1
+
+    return increments, collected
+
+
+def _apply_increments(db: Session, period: str, increments: dict[int, float]) -> None:
+    """기존 점수 행은 executemany UPDATE로 더하고, 없는 행은 다중 행 INSERT로 생성"""
+    if not increments:
+        return
+
+    existing = {
+        book_id for (book_id,) in db.query(BookTrendingScore.book_id).filter(
+            BookTrendingScore.period == period,
+            BookTrendingScore.book_id.in_(list(increments))
+        )
+    }
+
+    scores = BookTrendingScore.__table__
+    if existing:
+        db.execute(
+            update(scores)
+            .where(scores.c.book_id == bindparam("b_book_id"), scores.c.period == period)
+            .values(score=scores.c.score + bindparam("b_delta")),
+            [{"b_book_id": book_id, "b_delta": increments[book_id]} for book_id in existing]
+        )
+
+    new_rows = [
+        {"book_id": book_id, "period": period, "score": delta}
+        for book_id, delta in increments.items() if book_id not in existing
+    ]
+    if new_rows:
+        db.execute(insert(BookTrendingScore), new_rows)
+
+
+def refresh_trending_scores(db: Session, now: Optional[datetime] = None) -> dict:
+    """
+    새로 커밋된 이벤트(조회, 찜, 주문)만 읽어 기간별 인기 점수 증분 갱신
+
+    점수는 고정 기준 시각(epoch)에 대한 값(Σ 가중치 × 2^((발생 시각 - epoch) / 반감기))으로 저장하므로
+    기존 점수 행은 갱신하지 않고 새 이벤트 점수만 더합니다. 순위는 저장된 값 그대로 정렬하고, 현재 시각 점수는
+    조회 시 2^((현재 시각 - epoch) / 반감기)로 나누어 계산합니다. 현재 점수가 MIN_SCORE 미만인 행은
+    (period, score) 인덱스 범위로 삭제하며, 전체 행 UPDATE는 기준 시각을 옮길 때(REBASE_HALF_LIVES)만 실행합니다.
+    (상태 행을 잠근 트랜잭션에서 실행하므로 여러 워커가 동시에 실행해도 이벤트가 중복 반영되지 않음)
+
+    Args:
+        db: 데이터베이스 세션
+        now: 점수 기준 시각 (기본값: 현재 UTC 시각)
+
+    Returns:
+        dict: 처리 결과 (반영된 이벤트 수, 점수가 갱신된 도서 수, 정리된 점수 행 수)
+    """
+    now = now or datetime.utcnow()
+
+    state = db.query(BookTrendingState).filter(BookTrendingState.id == STATE_ID).with_for_update().first()
+    if state is None:
+        state = _bootstrap_state(db, now)
+    now = max(now, state.refreshed_at)
+
+    rebased = (now - state.epoch) / min(HALF_LIVES.values()) >= REBASE_HALF_LIVES
+    if rebased:
+        for period in HALF_LIVES:
+            db.query(BookTrendingScore).filter(BookTrendingScore.period == period).update(
+                {BookTrendingScore.score: BookTrendingScore.score / _growth(period, state.epoch, now)},
+                synchronize_session=False
+            )
+        state.epoch = now
+
+    increments, events = _collect_increments(db, state, now)
+    for period, deltas in increments.items():
+        _apply_increments(db, period, deltas)
+
+    pruned = 0
+    for period in HALF_LIVES:
+        pruned += db.query(BookTrendingScore).filter(
+            BookTrendingScore.period == period,
+            BookTrendingScore.score < MIN_SCORE * _growth(period, state.epoch, now)
+        ).delete(synchronize_session=False)
+
+    state.refreshed_at = now
+    db.commit()
+
+    books = set().union(*increments.values())
+    return {"events": events, "books": len(books), "pruned": pruned, "rebased": rebased}
+
+
+class TrendingSnapshot:
+    """기간별 인기 도서 목록 (갱신 시 통째로 교체되므로 읽을 때 잠금 불필요)"""
+
+    def __init__(self, books: dict[str, list[schemas.TrendingBookResponse]], refreshed_at: Optional[datetime]):
+        self.books = books
+        self.refreshed_at = refreshed_at
+
+
+def load_trending_snapshot(db: Session, size: int) -> TrendingSnapshot:
+    """점수 테이블에서 기간별 상위 size개 도서 조회 ((period, score) 인덱스 사용, 점수는 마지막 갱신 시각 기준)"""
+    state = db.query(BookTrendingState.epoch, BookTrendingState.refreshed_at).filter(
+        BookTrendingState.id == STATE_ID
+    ).first()
+    epoch, refreshed_at = state if state else (None, None)
+
+    books = {}
+    for period in HALF_LIVES:
+        rows = db.query(
+            Book.id, Book.title, Book.author, Book.publisher, Book.price, BookTrendingScore.score
+        ).join(
+            BookTrendingScore, BookTrendingScore.book_id == Book.id
+        ).filter(
+            BookTrendingScore.period == period
+        ).order_by(
+            BookTrendingScore.score.desc(), Book.id
+        ).limit(size).all()
+
+        books[period] = [
+            schemas.TrendingBookResponse(
+                rank=rank, id=book_id, title=title, author=author, publisher=publisher, price=price,
+                score=round(score / _growth(period, epoch, refreshed_at), 2)
+            )
+            for rank, (book_id, title, author, publisher, price, score) in enumerate(rows, start=1)
+        ]
+
+    return TrendingSnapshot(books, refreshed_at)
+
+
+class TrendingRanking:
+    """
+    인기 도서 스냅샷 보관소
+
+    - refresh(): 점수 증분 갱신 후 스냅샷 교체 (백그라운드 작업에서 주기적으로 실행)
+    - top(): 메모리 스냅샷에서 바로 응답 (스냅샷이 없을 때만 점수 테이블에서 1회 로드)
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._snapshot: Optional[TrendingSnapshot] = None
+        self._load_lock = threading.Lock()
+
+    def refresh(self, db: Session) -> dict:
+        result = refresh_trending_scores(db)
+        self._snapshot = load_trending_snapshot(db, self.size)
+        return result
+
+    def top(self, db: Session, window: str, size: int) -> schemas.TrendingBookListResponse:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._load_lock:
+                if self._snapshot is None:
+                    self._snapshot = load_trending_snapshot(db, self.size)
+                snapshot = self._snapshot
+
+        return schemas.TrendingBookListResponse(
+            window=window,
+            content=snapshot.books[window][:size],
+            refreshed_at=snapshot.refreshed_at
+        )
+
+    def clear(self) -> None:
+        self._snapshot = None
+
+
+trending_ranking = TrendingRanking(settings.TRENDING_SNAPSHOT_SIZE)
@@ -0,0 +1,210 @@
+"""
+Book View Buffer
+도서 조회 기록 write-behind 버퍼
+"""
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.domains.books.view_counts import increment_view_counts
+from app.models import Book, BookView, User
+
+logger = logging.getLogger(__name__)
+
+
+class BookViewBuffer:
+    """
+    도서 조회 이벤트를 메모리에 모았다가 다중 행 INSERT로 일괄 기록하는 버퍼
+
+    - 이벤트는 도서 ID별로 묶어서 보관 (도서별 대기 조회수 O(1) 조회)
+    - flush_size 도달 또는 flush_interval 경과 시 백그라운드 스레드가 기록
+    - max_pending 초과 시 이벤트를 버리고 dropped_count 증가
+    - stop() 호출 시 남은 이벤트를 모두 기록 (graceful drain)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        flush_size: int = 500,
+        flush_interval: float = 5.0,
+        max_pending: int = 10000
+    ):
+        self._session_factory = session_factory
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[int, list[tuple[Optional[int], datetime]]] = defaultdict(list)
+        self._pending_total = 0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.dropped_count = 0
+        self.flushed_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """백그라운드 flush 스레드 시작"""
+        if self.is_running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="book-view-buffer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """스레드 종료 후 남은 이벤트 기록"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def record(self, book_id: int, user_id: Optional[int] = None) -> bool:
+        """
+        조회 이벤트 추가
+
+        Returns:
+            버퍼에 추가되었는지 여부 (용량 초과로 버려진 경우 False)
+        """
+        with self._lock:
+            if self._pending_total >= self.max_pending:
+                self.dropped_count += 1
+                return False
+            self._pending[book_id].append((user_id, datetime.utcnow()))
+            self._pending_total += 1
+            should_flush = self._pending_total >= self.flush_size
+
+        if should_flush:
+            self._wakeup.set()
+        return True
+
+    def pending_count(self, book_id: int) -> int:
+        """아직 기록되지 않은 도서별 조회 수"""
+        with self._lock:
+            events = self._pending.get(book_id)
+            return len(events) if events else 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = self._pending_total
+        return {
+            "running": self.is_running,
+            "pending": pending,
+            "flushed": self.flushed_count,
+            "dropped": self.dropped_count,
+            "max_pending": self.max_pending
+        }
+
+    def flush(self) -> int:
+        """
+        대기 중인 이벤트를 다중 행 INSERT로 기록
+
+        Returns:
+            기록된 이벤트 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending_total:
+                    return 0
+                batch = self._pending
+                self._pending = defaultdict(list)
+                self._pending_total = 0
+
+            rows = [
+                {"book_id": book_id, "user_id": user_id, "viewed_at": viewed_at}
+                for book_id, events in batch.items()
+                for user_id, viewed_at in events
+            ]
+
+            try:
+                written = self._write(rows)
+            except SQLAlchemyError:
+                logger.exception("book view flush failed, re-queueing %d events", len(rows))
+                self._requeue(batch)
+                return 0
+
+            self.flushed_count += written
+            return written
+
+    def _write(self, rows: list[dict]) -> int:
+        db = self._session_factory()
+        try:
+            try:
+                self._insert(db, rows)
+                return len(rows)
+            except IntegrityError:
+                # 기록 전에 삭제된 도서/사용자가 있는 경우: 해당 이벤트만 정리 후 재시도
+                db.rollback()
+                rows = self._filter_orphans(db, rows)
+                if rows:
+                    self._insert(db, rows)
+                return len(rows)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _insert(db: Session, rows: list[dict]) -> None:
+        # 원본 조회 기록과 집계 테이블을 같은 트랜잭션에서 갱신
+        db.execute(insert(BookView), rows)
+        increment_view_counts(db, (row["book_id"] for row in rows))
+        db.commit()
+
+    def _filter_orphans(self, db: Session, rows: list[dict]) -> list[dict]:
+        book_ids = {row["book_id"] for row in rows}
+        user_ids = {row["user_id"] for row in rows if row["user_id"] is not None}
+
+        existing_books = {id_ for (id_,) in db.query(Book.id).filter(Book.id.in_(book_ids))}
+        existing_users = {id_ for (id_,) in db.query(User.id).filter(User.id.in_(user_ids))} if user_ids else set()
+
+        filtered = []
+        for row in rows:
+            if row["book_id"] not in existing_books:
+                self.dropped_count += 1
+                continue
+            if row["user_id"] not in existing_users:
+                row["user_id"] = None
+            filtered.append(row)
+        return filtered
+
+    def _requeue(self, batch: dict[int, list[tuple[Optional[int], datetime]]]) -> None:
+        with self._lock:
+            for book_id, events in batch.items():
+                room = self.max_pending - self._pending_total
+                if room <= 0:
+                    self.dropped_count += len(events)
+                    continue
+                kept = events[:room]
+                self.dropped_count += len(events) - len(kept)
+                self._pending[book_id][:0] = kept
+                self._pending_total += len(kept)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                break
+            self.flush()
+
+
+view_buffer = BookViewBuffer(
+    SessionLocal,
+    flush_size=settings.VIEW_BUFFER_FLUSH_SIZE,
+    flush_interval=settings.VIEW_BUFFER_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.VIEW_BUFFER_MAX_PENDING
+)
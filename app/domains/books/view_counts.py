@@ -0,0 +1,110 @@
+"""
+Book View Counts
+도서 조회수 집계 테이블(book_view_counts) 유지 및 롤업
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import Book, BookView, BookViewCount
+
+
+def increment_view_counts(db: Session, book_ids: Iterable[int]) -> None:
+    """
+    조회 이벤트만큼 도서별 누적 조회수 증가 (커밋은 호출자가 수행)
+
+    Args:
+        db: 데이터베이스 세션
+        book_ids: 조회된 도서 ID 목록 (중복 허용, 도서별로 합산)
+    """
+    for book_id, count in Counter(book_ids).items():
+        updated = db.query(BookViewCount).filter(
+            BookViewCount.book_id == book_id
+        ).update(
+            {BookViewCount.view_count: BookViewCount.view_count + count},
+            synchronize_session=False
+        )
+        if not updated:
+            db.add(BookViewCount(book_id=book_id, view_count=count, rolled_up_count=0))
+
+
+def ensure_view_counts(db: Session) -> int:
+    """
+    집계 행이 없는 도서에 대해 books_view 기준으로 집계 행 생성
+
+    Returns:
+        생성된 집계 행 수
+    """
+    raw_count = (
+        select(func.count(BookView.id))
+        .where(BookView.book_id == Book.id)
+        .scalar_subquery()
+    )
+    missing = (
+        select(Book.id, raw_count, 0)
+        .outerjoin(BookViewCount, BookViewCount.book_id == Book.id)
+        .where(BookViewCount.book_id.is_(None))
+    )
+    result = db.execute(
+        insert(BookViewCount).from_select(
+            ["book_id", "view_count", "rolled_up_count"], missing
+        )
+    )
+    return result.rowcount or 0
+
+
+def rollup_book_views(db: Session, older_than_days: int, rebuild: bool = False) -> dict:
+    """
+    오래된 조회 기록을 집계 테이블로 압축
+
+    older_than_days보다 오래된 books_view 행을 도서별로 집계하여 rolled_up_count에
+    더한 뒤 삭제합니다. (누적 조회수 view_count는 기록 시점에 이미 반영되어 있음)
+
+    Args:
+        db: 데이터베이스 세션
+        older_than_days: 보존 기간 (일)
+        rebuild: True면 view_count를 rolled_up_count + 남은 원본 행 수로 재계산
+
+    Returns:
+        dict: 처리 결과 (생성된 집계 행 수, 압축된 조회 기록 수, 재계산된 도서 수)
+    """
+    created = ensure_view_counts(db)
+
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    max_id = db.query(func.max(BookView.id)).filter(BookView.viewed_at < cutoff).scalar()
+
+    compacted = 0
+    if max_id is not None:
+        old_rows = db.query(BookView).filter(BookView.viewed_at < cutoff, BookView.id <= max_id)
+
+        per_book = old_rows.with_entities(
+            BookView.book_id, func.count(BookView.id)
+        ).group_by(BookView.book_id).all()
+
+        for book_id, count in per_book:
+            db.query(BookViewCount).filter(BookViewCount.book_id == book_id).update(
+                {BookViewCount.rolled_up_count: BookViewCount.rolled_up_count + count},
+                synchronize_session=False
+            )
+            compacted += count
+
+        old_rows.delete(synchronize_session=False)
+
+    rebuilt = 0
+    if rebuild:
+        raw_count = (
+            select(func.count(BookView.id))
+            .where(BookView.book_id == BookViewCount.book_id)
+            .scalar_subquery()
+        )
+        rebuilt = db.query(BookViewCount).update(
+            {BookViewCount.view_count: BookViewCount.rolled_up_count + raw_count},
+            synchronize_session=False
+        )
+
+    db.commit()
+
+    return {"created": created, "compacted": compacted, "rebuilt": rebuilt}
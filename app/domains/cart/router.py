@@ -5,8 +5,7 @@ Cart Router
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.core.dependencies import get_current_principal, Principal
 from app.domains.cart.schemas import (
     CartAddRequest,
     CartUpdateRequest,
@@ -30,7 +29,7 @@ router = APIRouter(prefix="/api/cart", tags=["Cart"])
 def add_to_cart(
     data: CartAddRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """장바구니 추가"""
     cart_item = CartService.add_to_cart(db, current_user.id, data)
@@ -60,7 +59,7 @@ def add_to_cart(
 )
 def get_cart(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """장바구니 조회"""
     cart_items, total_items, total_quantity, total_price = CartService.get_cart(
@@ -93,7 +92,7 @@ def update_quantity(
     cart_item_id: int,
     data: CartUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """수량 수정"""
     cart_item = CartService.update_quantity(db, cart_item_id, current_user.id, data)
@@ -124,7 +123,7 @@ def update_quantity(
 def delete_from_cart(
     cart_item_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """항목 삭제"""
     CartService.delete_from_cart(db, cart_item_id, current_user.id)
@@ -8,8 +8,13 @@ from sqlalchemy.exc import IntegrityError
 from app.models.cart import Cart
 from app.models.book import Book
 from app.domains.cart.schemas import CartAddRequest, CartUpdateRequest
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.exceptions import NotFoundException, BadRequestException, ForbiddenException, ConflictException
 
+# 사용자별 장바구니 스냅샷 캐시 (같은 프로세스의 장바구니 변경 시 즉시 무효화, 그 외는 TTL로 만료)
+cart_cache = TTLCache(ttl=settings.CART_CACHE_TTL_SECONDS, max_size=settings.CART_CACHE_MAX_SIZE)
+
 
 class CartService:
     """장바구니 서비스"""
@@ -48,6 +53,7 @@ class CartService:
             existing.quantity += data.quantity
             db.commit()
             db.refresh(existing)
+            CartService.invalidate_cache(user_id)
             return existing
 
         # 장바구니 추가
@@ -65,13 +71,22 @@ class CartService:
             db.rollback()
             raise BadRequestException("CART_ADD_FAILED", f"Failed to add to cart: {str(e)}")
 
+        CartService.invalidate_cache(user_id)
         return cart_item
 
     @staticmethod
-    def get_cart(db: Session, user_id: int) -> tuple[list[Cart], int, int, int]:
+    def invalidate_cache(user_id: int) -> None:
+        """사용자 장바구니 스냅샷 캐시 삭제 (장바구니 변경 후 호출)"""
+        cart_cache.delete(user_id)
+
+    @staticmethod
+    def get_cart(db: Session, user_id: int) -> tuple[list[dict], int, int, int]:
         """
         장바구니 조회
 
+        도서 정보를 조인한 한 번의 쿼리로 조회하고 합계는 한 번의 순회로 계산합니다.
+        결과는 사용자별로 CART_CACHE_TTL_SECONDS 동안 캐시됩니다.
+
         Args:
             db: 데이터베이스 세션
             user_id: 사용자 ID
@@ -79,30 +94,45 @@ class CartService:
         Returns:
             tuple: (장바구니 항목 목록, 총 항목 수, 총 수량, 총 금액)
         """
+        cached = cart_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         # 삭제되지 않은 항목만 조회
-        cart_items = db.query(Cart).filter(
+        rows = db.query(
+            Cart, Book.title, Book.author, Book.price
+        ).join(
+            Book, Book.id == Cart.book_id
+        ).filter(
             Cart.user_id == user_id,
             Cart.deleted_at.is_(None)
         ).order_by(desc(Cart.created_at)).all()
 
-        total_items = len(cart_items)
+        cart_items = []
         total_quantity = 0
         total_price = 0
 
         # 도서 정보 및 소계 추가
-        for item in cart_items:
-            book = db.query(Book).filter(Book.id == item.book_id).first()
-            if book:
-                item.book_title = book.title
-                item.book_author = book.author
-                item.book_price = book.price
-                item.book_thumbnail = None  # Book 모델에 thumbnail_url 필드 없음
-                item.subtotal = book.price * item.quantity
-
-                total_quantity += item.quantity
-                total_price += item.subtotal
-
-        return cart_items, total_items, total_quantity, total_price
+        for item, title, author, price in rows:
+            subtotal = price * item.quantity
+            cart_items.append({
+                "id": item.id,
+                "user_id": item.user_id,
+                "book_id": item.book_id,
+                "book_title": title,
+                "book_author": author,
+                "book_price": price,
+                "book_thumbnail": None,  # Book 모델에 thumbnail_url 필드 없음
+                "quantity": item.quantity,
+                "subtotal": subtotal,
+                "created_at": item.created_at
+            })
+            total_quantity += item.quantity
+            total_price += subtotal
+
+        snapshot = (cart_items, len(cart_items), total_quantity, total_price)
+        cart_cache.set(user_id, snapshot)
+        return snapshot
 
     @staticmethod
     def update_quantity(db: Session, cart_id: int, user_id: int, data: CartUpdateRequest) -> Cart:
@@ -144,6 +174,7 @@ class CartService:
             db.rollback()
             raise BadRequestException("UPDATE_FAILED", f"Failed to update cart: {str(e)}")
 
+        CartService.invalidate_cache(user_id)
         return cart_item
 
     @staticmethod
@@ -181,3 +212,5 @@ class CartService:
         except IntegrityError as e:
             db.rollback()
             raise BadRequestException("DELETE_FAILED", f"Failed to delete cart item: {str(e)}")
+
+        CartService.invalidate_cache(user_id)
@@ -2,27 +2,34 @@
 Comments Router
 댓글 관련 엔드포인트
 """
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.core.dependencies import get_current_user, get_optional_user
-from app.models.user import User
+from app.core.database import get_async_db, get_db
+from app.core.conditional import conditional_response
+from app.core.dependencies import get_current_user, get_current_principal, get_optional_user, Principal
+from app.core.pagination import CountMode, get_total_pages
 from app.domains.comments.schemas import (
     CommentCreateRequest,
     CommentUpdateRequest,
     CommentResponse,
     CommentListResponse,
+    CommentTreeNode,
+    CommentTreeResponse,
     LikeToggleResponse
 )
 from app.domains.comments.service import CommentService
 from app.domains.base import BaseResponse, SuccessResponse
 from typing import Optional
-import math
 
 
 router = APIRouter(prefix="/api/comments", tags=["Comments"])
 
 
+def _user_id(current_user: Optional[Principal]) -> Optional[int]:
+    return current_user.id if current_user else None
+
+
 @router.post(
     "",
     response_model=BaseResponse[CommentResponse],
@@ -33,7 +40,7 @@ router = APIRouter(prefix="/api/comments", tags=["Comments"])
 def create_comment(
     data: CommentCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """댓글 작성"""
     comment = CommentService.create_comment(db, current_user.id, data)
@@ -56,29 +63,33 @@ def create_comment(
     summary="댓글 목록 조회",
     description="댓글 목록을 조회합니다. 리뷰별, 사용자별 필터링을 지원합니다."
 )
-def get_comments(
+async def get_comments(
     review_id: Optional[int] = Query(None, description="리뷰 ID 필터"),
     user_id: Optional[int] = Query(None, description="작성자 ID 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 has_next만 제공)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[Principal] = Depends(get_optional_user)
 ):
     """댓글 목록 조회"""
     current_user_id = current_user.id if current_user else None
 
-    comments, total = CommentService.get_comments(
+    comments, total, next_cursor = await CommentService.get_comments_async(
         db=db,
         current_user_id=current_user_id,
         review_id=review_id,
         user_id=user_id,
         page=page,
-        size=size
+        size=size,
+        cursor=cursor,
+        count_mode=count
     )
 
     # 응답 데이터 구성
     comment_list = [CommentResponse.model_validate(comment) for comment in comments]
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
 
     return BaseResponse(
         is_success=True,
@@ -88,7 +99,47 @@ def get_comments(
             page=page,
             size=size,
             total_elements=total,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+            has_next=next_cursor is not None,
+            count_mode=count
+        )
+    )
+
+
+@router.get(
+    "/tree",
+    response_model=BaseResponse[CommentTreeResponse],
+    summary="댓글 트리 조회",
+    description="리뷰의 댓글을 대댓글이 포함된 트리 구조로 한 번에 조회합니다."
+)
+async def get_comment_tree(
+    review_id: int = Query(..., description="리뷰 ID"),
+    max_depth: Optional[int] = Query(None, ge=1, le=50, description="최대 깊이 (1이면 최상위 댓글만)"),
+    per_level_limit: Optional[int] = Query(None, ge=1, le=100, description="최상위 댓글 및 댓글별 대댓글 최대 개수 (작성순)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[Principal] = Depends(get_optional_user)
+):
+    """댓글 트리 조회"""
+    current_user_id = current_user.id if current_user else None
+
+    roots, total = await CommentService.get_comment_tree_async(
+        db=db,
+        review_id=review_id,
+        current_user_id=current_user_id,
+        max_depth=max_depth,
+        per_level_limit=per_level_limit
+    )
+
+    return BaseResponse(
+        is_success=True,
+        message="댓글 트리가 성공적으로 조회되었습니다.",
+        payload=CommentTreeResponse(
+            review_id=review_id,
+            total_elements=total,
+            max_depth=max_depth,
+            per_level_limit=per_level_limit,
+            content=[CommentTreeNode.model_validate(comment) for comment in roots]
         )
     )
 
@@ -99,14 +150,18 @@ def get_comments(
     summary="댓글 상세 조회",
     description="특정 댓글의 상세 정보를 조회합니다."
 )
-def get_comment(
+@conditional_response(
+    lambda db, kwargs: CommentService.get_comment_version(db, kwargs["comment_id"], _user_id(kwargs["current_user"]))
+)
+async def get_comment(
     comment_id: int,
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[Principal] = Depends(get_optional_user)
 ):
     """댓글 상세 조회"""
     current_user_id = current_user.id if current_user else None
-    comment = CommentService.get_comment(db, comment_id, current_user_id)
+    comment = await CommentService.get_comment_async(db, comment_id, current_user_id)
 
     return BaseResponse(
         is_success=True,
@@ -125,7 +180,7 @@ def update_comment(
     comment_id: int,
     data: CommentUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """댓글 수정 (본인만 가능)"""
     comment = CommentService.update_comment(db, comment_id, current_user.id, data)
@@ -149,7 +204,7 @@ def update_comment(
 def delete_comment(
     comment_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """댓글 삭제 (본인 또는 관리자 가능)"""
     CommentService.delete_comment(db, comment_id, current_user)
@@ -168,7 +223,7 @@ def delete_comment(
 def toggle_like(
     comment_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """댓글 좋아요 토글"""
     is_liked, like_count = CommentService.toggle_like(db, comment_id, current_user.id)
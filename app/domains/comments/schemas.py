@@ -5,6 +5,7 @@ Comments Schemas
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
+from app.core.pagination import CountMode
 
 
 class CommentCreateRequest(BaseModel):
@@ -69,13 +70,32 @@ class CommentResponse(BaseModel):
     }
 
 
+class CommentTreeNode(CommentResponse):
+    """댓글 트리 노드 (대댓글 포함)"""
+    depth: int = Field(..., description="깊이 (최상위 댓글은 1)")
+    reply_count: int = Field(0, description="전체 대댓글 수 (per_level_limit로 잘린 대댓글 포함)")
+    children: list["CommentTreeNode"] = Field(default_factory=list, description="대댓글 목록")
+
+
+class CommentTreeResponse(BaseModel):
+    """댓글 트리 응답"""
+    review_id: int = Field(..., description="리뷰 ID")
+    total_elements: int = Field(..., description="조회된 전체 댓글 수 (max_depth 적용 후)")
+    max_depth: Optional[int] = Field(None, description="최대 깊이")
+    per_level_limit: Optional[int] = Field(None, description="단계별 최대 댓글 수")
+    content: list[CommentTreeNode] = Field(..., description="최상위 댓글 목록")
+
+
 class CommentListResponse(BaseModel):
     """댓글 목록 응답"""
     content: list[CommentResponse] = Field(..., description="댓글 목록")
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
-    total_elements: int = Field(..., description="전체 댓글 수")
-    total_pages: int = Field(..., description="전체 페이지 수")
+    total_elements: Optional[int] = Field(..., description="전체 댓글 수 (count=none이면 null)")
+    total_pages: Optional[int] = Field(..., description="전체 페이지 수 (count=none이면 null)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_next: bool = Field(False, description="다음 페이지 존재 여부")
+    count_mode: CountMode = Field("exact", description="전체 개수 조회 방식 (exact/estimate/none)")
 
     model_config = {
         "json_schema_extra": {
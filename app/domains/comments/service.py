@@ -2,20 +2,69 @@
 Comments Service
 댓글 관련 비즈니스 로직
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from collections import defaultdict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import exists, func, literal, select
 from sqlalchemy.exc import IntegrityError
-from app.models.comment import Comment, CommentLike
+from app.models.comment import Comment, CommentLike, CommentLikeCount
 from app.models.review import Review
 from app.models.user import User, UserRole
 from app.domains.comments.schemas import CommentCreateRequest, CommentUpdateRequest
 from app.core.exceptions import NotFoundException, BadRequestException, ForbiddenException
+from app.core import likes
+from app.core.auth_cache import Principal
+from app.core.conditional import ResourceVersion, latest
+from app.core.pagination import CountMode, count_total, paginate
 from typing import Optional
 
 
 class CommentService:
     """댓글 서비스"""
 
+    @staticmethod
+    def _with_details(query):
+        """
+        댓글 쿼리에 좋아요 수(CommentLikeCount)와 작성자 이름(User)을 조인하여 함께 조회
+
+        Returns:
+            (Comment, like_count, user_name) 행을 반환하는 쿼리
+        """
+        return query.outerjoin(
+            CommentLikeCount, CommentLikeCount.comment_id == Comment.id
+        ).outerjoin(
+            User, User.id == Comment.user_id
+        ).add_columns(
+            func.coalesce(CommentLikeCount.like_count, 0).label("like_count"),
+            User.name.label("user_name")
+        )
+
+    @staticmethod
+    def _hydrate(db: Session, rows: list, current_user_id: Optional[int]) -> list[Comment]:
+        """
+        _with_details 조회 결과를 응답용 댓글 목록으로 변환
+
+        현재 사용자의 좋아요 여부는 페이지 전체에 대해 IN 쿼리 한 번으로 조회합니다.
+        """
+        liked_ids = set()
+        if current_user_id and rows:
+            comment_ids = [row.Comment.id for row in rows]
+            liked_ids = {
+                comment_id for (comment_id,) in db.query(CommentLike.comment_id).filter(
+                    CommentLike.user_id == current_user_id,
+                    CommentLike.comment_id.in_(comment_ids)
+                )
+            }
+
+        comments = []
+        for row in rows:
+            comment = row.Comment
+            comment.like_count = row.like_count
+            comment.user_name = row.user_name or "Unknown"
+            comment.is_liked = comment.id in liked_ids
+            comments.append(comment)
+        return comments
+
     @staticmethod
     def create_comment(db: Session, user_id: int, data: CommentCreateRequest) -> Comment:
         """
@@ -60,6 +109,10 @@ class CommentService:
 
         try:
             db.add(comment)
+            db.flush()
+
+            # 좋아요 카운트 테이블 초기화
+            db.add(CommentLikeCount(comment_id=comment.id, like_count=0))
             db.commit()
             db.refresh(comment)
         except IntegrityError as e:
@@ -75,8 +128,10 @@ class CommentService:
         review_id: Optional[int] = None,
         user_id: Optional[int] = None,
         page: int = 1,
-        size: int = 20
-    ) -> tuple[list[Comment], int]:
+        size: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> tuple[list[Comment], Optional[int], Optional[str]]:
         """
         댓글 목록 조회
 
@@ -87,9 +142,11 @@ class CommentService:
             user_id: 작성자 ID 필터 (선택)
             page: 페이지 번호
             size: 페이지 크기
+            cursor: 다음 페이지 커서 (지정 시 page 무시)
+            count_mode: 전체 개수 조회 방식 (exact/estimate/none)
 
         Returns:
-            tuple: (댓글 목록, 전체 개수)
+            tuple: (댓글 목록, 전체 개수 - none 모드면 None, 다음 페이지 커서)
         """
         query = db.query(Comment)
 
@@ -99,39 +156,138 @@ class CommentService:
         if user_id:
             query = query.filter(Comment.user_id == user_id)
 
-        # 정렬 (최신순)
-        query = query.order_by(desc(Comment.created_at))
-
         # 전체 개수
-        total = query.count()
+        total = count_total(query, count_mode, ("comments", review_id, user_id))
+
+        # 페이지네이션 (최신순, 좋아요 수/작성자 이름 포함)
+        rows, next_cursor = paginate(
+            CommentService._with_details(query), Comment.created_at, Comment.id, "created_at", "desc",
+            size=size, page=page, cursor=cursor
+        )
+        comments = CommentService._hydrate(db, rows, current_user_id)
+
+        return comments, total, next_cursor
+
+    @staticmethod
+    async def get_comments_async(db: AsyncSession, *args, **kwargs) -> tuple[list[Comment], Optional[int], Optional[str]]:
+        """댓글 목록 조회 (비동기 세션용, 인자는 동기 메서드와 동일)"""
+        return await db.run_sync(CommentService.get_comments, *args, **kwargs)
+
+    @staticmethod
+    def _supports_recursive_cte(db: Session) -> bool:
+        """WITH RECURSIVE 지원 여부 (MySQL 8.0+, SQLite 3.8.3+)"""
+        dialect = db.get_bind().dialect
+        version = dialect.server_version_info or ()
+        if dialect.name == "mysql":
+            return not dialect.is_mariadb and version >= (8, 0)
+        if dialect.name == "sqlite":
+            return version >= (3, 8, 3)
+        return dialect.name == "postgresql"
+
+    @staticmethod
+    def _load_tree_rows(db: Session, review_id: int, max_depth: Optional[int]) -> list[tuple]:
+        """
+        리뷰의 댓글 트리를 한 번의 쿼리로 조회
+
+        Returns:
+            list: ((Comment, like_count, user_name) 행, 깊이) 목록 (작성 순)
+        """
+        ordering = (Comment.created_at.asc(), Comment.id.asc())
+
+        if CommentService._supports_recursive_cte(db):
+            # 최상위 댓글에서 시작해 대댓글을 따라 내려가며 깊이 계산 (max_depth에서 중단)
+            tree = select(
+                Comment.id, literal(1).label("depth")
+            ).where(
+                Comment.review_id == review_id,
+                Comment.parent_comment_id.is_(None)
+            ).cte("comment_tree", recursive=True)
+
+            child = aliased(Comment)
+            step = select(
+                child.id, (tree.c.depth + 1).label("depth")
+            ).join(tree, child.parent_comment_id == tree.c.id)
+            if max_depth is not None:
+                step = step.where(tree.c.depth < max_depth)
+            tree = tree.union_all(step)
+
+            rows = CommentService._with_details(db.query(Comment)).join(
+                tree, tree.c.id == Comment.id
+            ).add_columns(tree.c.depth).order_by(*ordering).all()
+            return [(row, row.depth) for row in rows]
+
+        # WITH RECURSIVE 미지원 DB: 리뷰의 댓글 전체를 조회한 뒤 메모리에서 깊이 계산
+        rows = CommentService._with_details(db.query(Comment)).filter(
+            Comment.review_id == review_id
+        ).order_by(*ordering).all()
+
+        children = defaultdict(list)
+        for row in rows:
+            children[row.Comment.parent_comment_id].append(row)
+
+        depths = {}
+        level, depth = children[None], 1
+        while level and (max_depth is None or depth <= max_depth):
+            next_level = []
+            for row in level:
+                depths[row.Comment.id] = depth
+                next_level.extend(children[row.Comment.id])
+            level, depth = next_level, depth + 1
+
+        return [(row, depths[row.Comment.id]) for row in rows if row.Comment.id in depths]
+
+    @staticmethod
+    def get_comment_tree(
+        db: Session,
+        review_id: int,
+        current_user_id: Optional[int],
+        max_depth: Optional[int] = None,
+        per_level_limit: Optional[int] = None
+    ) -> tuple[list[Comment], int]:
+        """
+        리뷰의 댓글 트리 조회
+
+        댓글 전체를 한 번의 쿼리로 조회한 뒤 parent_comment_id 기준으로 메모리에서 O(n)으로 조립합니다.
+        각 댓글에는 depth, reply_count(전체 대댓글 수), children(대댓글 목록) 속성이 추가됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            review_id: 리뷰 ID
+            current_user_id: 현재 사용자 ID (선택)
+            max_depth: 최대 깊이 (1이면 최상위 댓글만, 미지정 시 제한 없음)
+            per_level_limit: 최상위 댓글 및 댓글별 대댓글 최대 개수 (작성순, 미지정 시 제한 없음)
+
+        Returns:
+            tuple: (최상위 댓글 목록, 조회된 전체 댓글 수)
+
+        Raises:
+            NotFoundException: 리뷰를 찾을 수 없음
+        """
+        tree_rows = CommentService._load_tree_rows(db, review_id, max_depth)
+
+        if not tree_rows:
+            if not db.query(Review.id).filter(Review.id == review_id).first():
+                raise NotFoundException("REVIEW_NOT_FOUND", "Review not found")
+            return [], 0
 
-        # 페이지네이션
-        offset = (page - 1) * size
-        comments = query.offset(offset).limit(size).all()
+        comments = CommentService._hydrate(db, [row for row, _ in tree_rows], current_user_id)
+
+        children = defaultdict(list)
+        for comment, (_, depth) in zip(comments, tree_rows):
+            comment.depth = depth
+            children[comment.parent_comment_id].append(comment)
 
-        # 현재 사용자의 좋아요 여부 및 좋아요 수 추가
         for comment in comments:
-            # 좋아요 수
-            like_count = db.query(func.count(CommentLike.id)).filter(
-                CommentLike.comment_id == comment.id
-            ).scalar()
-            comment.like_count = like_count or 0
-
-            # 현재 사용자의 좋아요 여부
-            if current_user_id:
-                is_liked = db.query(CommentLike).filter(
-                    CommentLike.comment_id == comment.id,
-                    CommentLike.user_id == current_user_id
-                ).first() is not None
-                comment.is_liked = is_liked
-            else:
-                comment.is_liked = False
-
-            # 작성자 이름 추가
-            user = db.query(User).filter(User.id == comment.user_id).first()
-            comment.user_name = user.name if user else "Unknown"
-
-        return comments, total
+            replies = children.get(comment.id, [])
+            comment.reply_count = len(replies)
+            comment.children = replies[:per_level_limit]
+
+        return children[None][:per_level_limit], len(comments)
+
+    @staticmethod
+    async def get_comment_tree_async(db: AsyncSession, *args, **kwargs) -> tuple[list[Comment], int]:
+        """리뷰의 댓글 트리 조회 (비동기 세션용, 인자는 동기 메서드와 동일)"""
+        return await db.run_sync(CommentService.get_comment_tree, *args, **kwargs)
 
     @staticmethod
     def get_comment(db: Session, comment_id: int, current_user_id: Optional[int]) -> Comment:
@@ -149,32 +305,47 @@ class CommentService:
         Raises:
             NotFoundException: 댓글을 찾을 수 없음
         """
-        comment = db.query(Comment).filter(Comment.id == comment_id).first()
-        if not comment:
+        row = CommentService._with_details(db.query(Comment)).filter(Comment.id == comment_id).first()
+        if not row:
             raise NotFoundException("COMMENT_NOT_FOUND", "Comment not found")
 
-        # 좋아요 수
-        like_count = db.query(func.count(CommentLike.id)).filter(
-            CommentLike.comment_id == comment.id
-        ).scalar()
-        comment.like_count = like_count or 0
-
-        # 현재 사용자의 좋아요 여부
-        if current_user_id:
-            is_liked = db.query(CommentLike).filter(
-                CommentLike.comment_id == comment.id,
-                CommentLike.user_id == current_user_id
-            ).first() is not None
-            comment.is_liked = is_liked
-        else:
-            comment.is_liked = False
-
-        # 작성자 이름
-        user = db.query(User).filter(User.id == comment.user_id).first()
-        comment.user_name = user.name if user else "Unknown"
+        comment, = CommentService._hydrate(db, [row], current_user_id)
 
         return comment
 
+    @staticmethod
+    def get_comment_version(db: Session, comment_id: int, current_user_id: Optional[int]) -> Optional[ResourceVersion]:
+        """
+        댓글 상세 응답 버전 (조건부 요청용, 없는 댓글이면 None)
+
+        댓글/좋아요 수/작성자 수정 시각과 좋아요 수, 현재 사용자의 좋아요 여부를 한 번의 쿼리로 조회합니다.
+        """
+        is_liked = exists().where(
+            CommentLike.comment_id == Comment.id,
+            CommentLike.user_id == current_user_id
+        ) if current_user_id else literal(False)
+
+        row = db.query(
+            Comment.updated_at, CommentLikeCount.like_count, CommentLikeCount.updated_at.label("like_updated_at"),
+            User.updated_at.label("user_updated_at"), is_liked.label("is_liked")
+        ).outerjoin(
+            CommentLikeCount, CommentLikeCount.comment_id == Comment.id
+        ).outerjoin(
+            User, User.id == Comment.user_id
+        ).filter(Comment.id == comment_id).first()
+        if not row:
+            return None
+
+        return ResourceVersion(
+            "comment", comment_id, *row,
+            last_modified=latest(row.updated_at, row.like_updated_at, row.user_updated_at)
+        )
+
+    @staticmethod
+    async def get_comment_async(db: AsyncSession, *args, **kwargs) -> Comment:
+        """댓글 상세 조회 (비동기 세션용, 인자는 동기 메서드와 동일)"""
+        return await db.run_sync(CommentService.get_comment, *args, **kwargs)
+
     @staticmethod
     def update_comment(db: Session, comment_id: int, user_id: int, data: CommentUpdateRequest) -> Comment:
         """
@@ -214,14 +385,14 @@ class CommentService:
         return comment
 
     @staticmethod
-    def delete_comment(db: Session, comment_id: int, current_user: User) -> None:
+    def delete_comment(db: Session, comment_id: int, current_user: Principal) -> None:
         """
         댓글 삭제 (본인 또는 관리자 가능)
 
         Args:
             db: 데이터베이스 세션
             comment_id: 댓글 ID
-            current_user: 현재 사용자 객체
+            current_user: 현재 사용자 (Principal)
 
         Raises:
             NotFoundException: 댓글을 찾을 수 없음
@@ -242,7 +413,7 @@ class CommentService:
     @staticmethod
     def toggle_like(db: Session, comment_id: int, user_id: int) -> tuple[bool, int]:
         """
-        댓글 좋아요 토글
+        댓글 좋아요 토글 (단일 트랜잭션, 동시 요청 안전)
 
         Args:
             db: 데이터베이스 세션
@@ -256,32 +427,22 @@ class CommentService:
             NotFoundException: 댓글을 찾을 수 없음
         """
         # 댓글 존재 확인
-        comment = db.query(Comment).filter(Comment.id == comment_id).first()
-        if not comment:
+        if not db.query(Comment.id).filter(Comment.id == comment_id).first():
             raise NotFoundException("COMMENT_NOT_FOUND", "Comment not found")
 
-        # 기존 좋아요 확인
-        existing_like = db.query(CommentLike).filter(
-            CommentLike.comment_id == comment_id,
-            CommentLike.user_id == user_id
-        ).first()
+        is_liked, like_count = likes.toggle_like(db, CommentLike, CommentLikeCount, "comment_id", comment_id, user_id)
+        db.commit()
 
-        is_liked = False
+        return is_liked, like_count
 
-        if existing_like:
-            # 좋아요 취소
-            db.delete(existing_like)
-        else:
-            # 좋아요 추가
-            new_like = CommentLike(comment_id=comment_id, user_id=user_id)
-            db.add(new_like)
-            is_liked = True
+    @staticmethod
+    def reconcile_like_counts(db: Session) -> dict:
+        """
+        댓글 좋아요 수 집계 테이블을 좋아요 테이블 기준으로 보정
 
+        Returns:
+            dict: 처리 결과 (생성된 집계 행 수, 보정된 집계 행 수)
+        """
+        result = likes.reconcile_like_counts(db, Comment, CommentLike, CommentLikeCount, "comment_id")
         db.commit()
-
-        # 좋아요 수 조회
-        like_count = db.query(func.count(CommentLike.id)).filter(
-            CommentLike.comment_id == comment_id
-        ).scalar()
-
-        return is_liked, like_count or 0
+        return result
@@ -1,13 +1,13 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Request
 from sqlalchemy.orm import Session
 from typing import Optional
-import math
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.domains.coupons import schemas, service
 from app.domains.base import BaseResponse
-from app.core.dependencies import get_current_user, get_sort_params
-from app.models import User
+from app.core.dependencies import get_current_principal, get_sort_params, Principal
+from app.core.pagination import CountMode, get_total_pages
+from app.core.response_cache import COUPON_LIST_TAG, cached_response
 
 router = APIRouter(prefix="/api/coupons", tags=["Coupons"])
 
@@ -18,11 +18,15 @@ router = APIRouter(prefix="/api/coupons", tags=["Coupons"])
     summary="사용 가능한 쿠폰 조회",
     description="현재 사용 가능한 활성화된 쿠폰 목록을 조회합니다."
 )
+@cached_response(tags=lambda kwargs: [COUPON_LIST_TAG])
 def get_available_coupons(
+    request: Request,
     keyword: Optional[str] = Query(None, description="검색 키워드 (쿠폰 이름 또는 설명)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
+    db: Session = Depends(get_read_db),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
         allowed_fields=["name", "discount_rate", "start_at", "end_at", "created_at"]
     ))
@@ -35,23 +39,28 @@ def get_available_coupons(
     """
     sort_field, sort_order = sort_params if sort_params else ("created_at", "desc")
 
-    coupons, total = service.get_available_coupons(
+    coupons, total, next_cursor = service.get_available_coupons(
         db=db,
         keyword=keyword,
         page=page,
         size=size,
         sort_field=sort_field,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        count_mode=count
     )
 
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
     payload_data = schemas.CouponListResponse(
         content=[schemas.CouponResponse.model_validate(c) for c in coupons],
         page=page,
         size=size,
         total_elements=total,
         total_pages=total_pages,
-        sort=f"{sort_field},{sort_order}"
+        sort=f"{sort_field},{sort_order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=count
     ).model_dump(by_alias=True)
 
     return BaseResponse(
@@ -72,8 +81,10 @@ def get_my_coupons(
     keyword: Optional[str] = Query(None, description="검색 키워드 (쿠폰 이름 또는 설명)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_read_db),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
         allowed_fields=["coupon_name", "discount_rate", "assigned_at", "used_at", "start_at", "end_at"]
     ))
@@ -87,7 +98,7 @@ def get_my_coupons(
     """
     sort_field, sort_order = sort_params if sort_params else ("assigned_at", "desc")
 
-    coupons, total = service.get_my_coupons(
+    coupons, total, next_cursor = service.get_my_coupons(
         db=db,
         user_id=current_user.id,
         is_used=is_used,
@@ -95,11 +106,13 @@ def get_my_coupons(
         page=page,
         size=size,
         sort_field=sort_field,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        count_mode=count
     )
     unused_count = sum(1 for c in coupons if not c["is_used"])
 
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
     payload_data = schemas.MyCouponListResponse(
         content=[schemas.UserCouponResponse.model_validate(c) for c in coupons],
         page=page,
@@ -107,6 +120,9 @@ def get_my_coupons(
         total_elements=total,
         total_pages=total_pages,
         sort=f"{sort_field},{sort_order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=count,
         unused_count=unused_count
     ).model_dump(by_alias=True)
 
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
+from app.core.pagination import CountMode
 
 
 class CouponResponse(BaseModel):
@@ -67,9 +68,12 @@ class CouponListResponse(BaseModel):
     content: list[CouponResponse]
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
-    total_elements: int = Field(..., alias="totalElements", description="전체 쿠폰 수")
-    total_pages: int = Field(..., alias="totalPages", description="전체 페이지 수")
+    total_elements: Optional[int] = Field(..., alias="totalElements", description="전체 쿠폰 수 (count=none이면 null)")
+    total_pages: Optional[int] = Field(..., alias="totalPages", description="전체 페이지 수 (count=none이면 null)")
     sort: str = Field(..., description="정렬 기준")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor", description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_next: bool = Field(False, alias="hasNext", description="다음 페이지 존재 여부")
+    count_mode: CountMode = Field("exact", alias="countMode", description="전체 개수 조회 방식 (exact/estimate/none)")
 
     model_config = {
         "populate_by_name": True,
@@ -97,9 +101,12 @@ class MyCouponListResponse(BaseModel):
     content: list[UserCouponResponse]
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
-    total_elements: int = Field(..., alias="totalElements", description="전체 쿠폰 수")
-    total_pages: int = Field(..., alias="totalPages", description="전체 페이지 수")
+    total_elements: Optional[int] = Field(..., alias="totalElements", description="전체 쿠폰 수 (count=none이면 null)")
+    total_pages: Optional[int] = Field(..., alias="totalPages", description="전체 페이지 수 (count=none이면 null)")
     sort: str = Field(..., description="정렬 기준")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor", description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_next: bool = Field(False, alias="hasNext", description="다음 페이지 존재 여부")
+    count_mode: CountMode = Field("exact", alias="countMode", description="전체 개수 조회 방식 (exact/estimate/none)")
     unused_count: int
 
     model_config = {
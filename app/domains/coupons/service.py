@@ -4,6 +4,7 @@ from datetime import datetime
 from app.models.coupon import Coupon, UserCoupon
 from app.domains.coupons import schemas
 from app.core.exceptions import BaseAPIException
+from app.core.pagination import CountMode, count_total, paginate
 from fastapi import status
 from typing import Optional
 
@@ -14,8 +15,10 @@ def get_available_coupons(
     page: int = 1,
     size: int = 10,
     sort_field: str = "created_at",
-    sort_order: str = "DESC"
-) -> tuple[list[Coupon], int]:
+    sort_order: str = "DESC",
+    cursor: Optional[str] = None,
+    count_mode: CountMode = "exact"
+) -> tuple[list[Coupon], Optional[int], Optional[str]]:
     """
     현재 사용 가능한 활성화된 쿠폰 목록 조회
     """
@@ -35,21 +38,16 @@ def get_available_coupons(
             (Coupon.description.ilike(f"%{keyword}%"))
         )
     
-    # 동적 정렬
-    if sort_field:
-        if sort_order.upper() == "DESC":
-            query = query.order_by(getattr(Coupon, sort_field).desc())
-        else:
-            query = query.order_by(getattr(Coupon, sort_field))
-    
-    # 전체 개수
-    total = query.count()
+    # 전체 개수 (estimate 모드는 TTL 동안 유효기간 변화를 반영하지 않는 근사값)
+    total = count_total(query, count_mode, ("available_coupons", keyword))
 
-    # 페이지네이션
-    offset = (page - 1) * size
-    coupons = query.offset(offset).limit(size).all()
+    # 동적 정렬 + 페이지네이션
+    coupons, next_cursor = paginate(
+        query, getattr(Coupon, sort_field), Coupon.id, sort_field, sort_order,
+        size=size, page=page, cursor=cursor
+    )
 
-    return coupons, total
+    return coupons, total, next_cursor
 
 
 def get_my_coupons(
@@ -60,8 +58,10 @@ def get_my_coupons(
     page: int = 1,
     size: int = 10,
     sort_field: str = "assigned_at",
-    sort_order: str = "DESC"
-) -> tuple[list[dict], int]:
+    sort_order: str = "DESC",
+    cursor: Optional[str] = None,
+    count_mode: CountMode = "exact"
+) -> tuple[list[dict], Optional[int], Optional[str]]:
     """
     내가 보유한 쿠폰 목록 조회 (사용/미사용 필터링 가능)
     """
@@ -94,23 +94,19 @@ def get_my_coupons(
         )
 
     # 동적 정렬
-    if sort_field:
-        if sort_field in ["coupon_name", "discount_rate", "start_at", "end_at"]:
-            model_field = getattr(Coupon, sort_field.replace("coupon_", ""))
-        else: # UserCoupon 모델 필드
-            model_field = getattr(UserCoupon, sort_field)
-        
-        if sort_order.upper() == "DESC":
-            query = query.order_by(model_field.desc())
-        else:
-            query = query.order_by(model_field)
+    if sort_field in ["coupon_name", "discount_rate", "start_at", "end_at"]:
+        model_field = getattr(Coupon, sort_field.replace("coupon_", ""))
+    else: # UserCoupon 모델 필드
+        model_field = getattr(UserCoupon, sort_field)
 
     # 전체 개수
-    total = query.count()
+    total = count_total(query, count_mode, ("my_coupons", user_id, is_used, keyword))
 
     # 페이지네이션
-    offset = (page - 1) * size
-    results = query.offset(offset).limit(size).all()
+    results, next_cursor = paginate(
+        query, model_field, UserCoupon.id, sort_field, sort_order,
+        size=size, page=page, cursor=cursor
+    )
 
     # Convert to dict
     coupons = []
@@ -129,4 +125,4 @@ def get_my_coupons(
             "is_active": row.is_active
         })
 
-    return coupons, total
+    return coupons, total, next_cursor
@@ -6,8 +6,8 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.core.database import get_db
-from app.core.dependencies import get_current_user, get_sort_params
-from app.models.user import User
+from app.core.dependencies import get_current_principal, get_sort_params, Principal
+from app.core.pagination import CountMode, get_total_pages
 from app.domains.favorites.schemas import (
     FavoriteAddRequest,
     FavoriteResponse,
@@ -15,7 +15,6 @@ from app.domains.favorites.schemas import (
 )
 from app.domains.favorites.service import FavoriteService
 from app.domains.base import BaseResponse, SuccessResponse
-import math
 
 
 router = APIRouter(prefix="/api/favorites", tags=["Favorites"])
@@ -31,7 +30,7 @@ router = APIRouter(prefix="/api/favorites", tags=["Favorites"])
 def add_favorite(
     data: FavoriteAddRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """위시리스트 추가"""
     favorite = FavoriteService.add_favorite(db, current_user.id, data)
@@ -61,9 +60,11 @@ def add_favorite(
 def get_favorites(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
     keyword: Optional[str] = Query(None, description="검색 키워드 (도서 제목 또는 저자)"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
         allowed_fields=["book_title", "created_at"]
     ))
@@ -71,19 +72,21 @@ def get_favorites(
     """위시리스트 조회"""
     sort_field, sort_order = sort_params if sort_params else ("created_at", "desc")
 
-    favorites, total = FavoriteService.get_favorites(
+    favorites, total, next_cursor = FavoriteService.get_favorites(
         db=db,
         user_id=current_user.id,
         keyword=keyword,
         page=page,
         size=size,
         sort_field=sort_field,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        count_mode=count
     )
 
     # 응답 데이터 구성
     favorite_list = [FavoriteResponse.model_validate(favorite) for favorite in favorites]
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
 
     payload_data = FavoriteListResponse(
         content=favorite_list,
@@ -91,7 +94,10 @@ def get_favorites(
         size=size,
         total_elements=total,
         total_pages=total_pages,
-        sort=f"{sort_field},{sort_order}"
+        sort=f"{sort_field},{sort_order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=count
     ).model_dump(by_alias=True)
 
     return BaseResponse(
@@ -110,7 +116,7 @@ def get_favorites(
 def delete_favorite(
     favorite_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """위시리스트 삭제"""
     FavoriteService.delete_favorite(db, favorite_id, current_user.id)
@@ -3,12 +3,12 @@ Favorites Service
 위시리스트 관련 비즈니스 로직
 """
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
 from sqlalchemy.exc import IntegrityError
 from app.models.favorite import Favorite
 from app.models.book import Book
 from app.domains.favorites.schemas import FavoriteAddRequest
 from app.core.exceptions import NotFoundException, BadRequestException, ConflictException
+from app.core.pagination import CountMode, count_total, paginate
 from typing import Optional
 
 
@@ -71,8 +71,10 @@ class FavoriteService:
         page: int = 1,
         size: int = 20,
         sort_field: str = "created_at",
-        sort_order: str = "DESC"
-    ) -> tuple[list[Favorite], int]:
+        sort_order: str = "DESC",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> tuple[list[Favorite], Optional[int], Optional[str]]:
         """
         위시리스트 조회
 
@@ -81,9 +83,11 @@ class FavoriteService:
             user_id: 사용자 ID
             page: 페이지 번호
             size: 페이지 크기
+            cursor: 다음 페이지 커서 (지정 시 page 무시)
+            count_mode: 전체 개수 조회 방식 (exact/estimate/none)
 
         Returns:
-            tuple: (위시리스트 목록, 전체 개수)
+            tuple: (위시리스트 목록, 전체 개수 - none 모드면 None, 다음 페이지 커서)
         """
         # 삭제되지 않은 항목만 조회 및 Book 모델과 조인
         query = db.query(Favorite).options(joinedload(Favorite.book)).filter(
@@ -99,28 +103,23 @@ class FavoriteService:
             )
 
         # 동적 정렬
-        if sort_field:
-            # Book 모델 필드인 경우 Book 테이블 기준으로 정렬
-            if sort_field in ["book_title", "book_author"]:
-                # 'book_title'은 Book.title, 'book_author'는 Book.author에 해당
-                model_field = getattr(Book, sort_field.replace("book_", ""))
-                if sort_order.upper() == "DESC":
-                    query = query.order_by(desc(model_field))
-                else:
-                    query = query.order_by(model_field)
-            else: # Favorite 모델 필드인 경우
-                model_field = getattr(Favorite, sort_field)
-                if sort_order.upper() == "DESC":
-                    query = query.order_by(desc(model_field))
-                else:
-                    query = query.order_by(model_field)
+        # Book 모델 필드인 경우 Book 테이블 기준으로 정렬
+        if sort_field in ["book_title", "book_author"]:
+            # 'book_title'은 Book.title, 'book_author'는 Book.author에 해당
+            if not keyword:
+                query = query.join(Book)
+            model_field = getattr(Book, sort_field.replace("book_", ""))
+        else: # Favorite 모델 필드인 경우
+            model_field = getattr(Favorite, sort_field)
 
         # 전체 개수
-        total = query.count()
+        total = count_total(query, count_mode, ("favorites", user_id, keyword))
 
         # 페이지네이션
-        offset = (page - 1) * size
-        favorites = query.offset(offset).limit(size).all()
+        favorites, next_cursor = paginate(
+            query, model_field, Favorite.id, sort_field, sort_order,
+            size=size, page=page, cursor=cursor
+        )
 
         # 도서 정보 추가
         for favorite in favorites:
@@ -131,7 +130,7 @@ class FavoriteService:
                 favorite.book_price = favorite.book.price
                 favorite.book_thumbnail = None  # Book 모델에 thumbnail_url 필드 없음
 
-        return favorites, total
+        return favorites, total, next_cursor
 
     @staticmethod
     def delete_favorite(db: Session, favorite_id: int, user_id: int) -> None:
@@ -2,8 +2,16 @@
 Health Check Router
 서버 상태 확인 엔드포인트
 """
-from fastapi import APIRouter
+import time
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.database import async_engine, async_replica_engines, engine, replica_engines
+from app.core.pool_metrics import pool_status
 
 router = APIRouter(tags=["Health"])
 
@@ -21,3 +29,38 @@ def health_check():
         "service": "Bookstore API",
         "version": "1.0.0"
     }
+
+
+@router.get(
+    "/health/db",
+    summary="DB 헬스체크",
+    description="DB 연결(SELECT 1)과 커넥션 풀 사용 현황(사용 중/overflow/대기 시간 히스토그램)을 확인합니다. "
+                "DB에 연결할 수 없으면 503을 반환합니다."
+)
+def db_health_check():
+    """DB 헬스체크 API"""
+    started = time.perf_counter()
+    error = None
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except SQLAlchemyError as e:
+        error = type(e).__name__
+    latency_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    body = {
+        "status": "unhealthy" if error else "healthy",
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "latency_ms": latency_ms,
+        "error": error,
+        "pools": {
+            "primary": pool_status(engine.pool),
+            "async": pool_status(async_engine.sync_engine.pool),
+            **{f"replica-{i}": pool_status(e.pool) for i, e in enumerate(replica_engines)},
+            **{f"async-replica-{i}": pool_status(e.sync_engine.pool) for i, e in enumerate(async_replica_engines)},
+        }
+    }
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE if error else status.HTTP_200_OK,
+        content=body
+    )
@@ -3,15 +3,15 @@ Library Router
 구매한 도서 관련 엔드포인트
 """
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
-from app.core.database import get_db
-from app.core.dependencies import get_current_user, get_sort_params
-from app.models.user import User
+from app.core.database import get_async_db, get_db
+from app.core.dependencies import get_current_principal, get_sort_params, Principal
+from app.core.pagination import CountMode, get_total_pages
 from app.domains.library.schemas import LibraryBookResponse, LibraryListResponse
 from app.domains.library.service import LibraryService
 from app.domains.base import BaseResponse
-import math
 
 
 router = APIRouter(prefix="/api/library", tags=["Library"])
@@ -23,12 +23,14 @@ router = APIRouter(prefix="/api/library", tags=["Library"])
     summary="구매한 도서 목록 조회",
     description="배송 완료(DELIVERED) 상태인 주문의 도서 목록을 조회합니다."
 )
-def get_library(
+async def get_library(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
     keyword: Optional[str] = Query(None, description="검색 키워드 (도서 제목 또는 저자)"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
         allowed_fields=["title", "author", "order_date"]
     ))
@@ -36,19 +38,21 @@ def get_library(
     """구매한 도서 목록 조회"""
     sort_field, sort_order = sort_params if sort_params else ("order_date", "desc")
 
-    books, total = LibraryService.get_purchased_books(
+    books, total, next_cursor = await LibraryService.get_purchased_books_async(
         db=db,
         user_id=current_user.id,
         keyword=keyword,
         page=page,
         size=size,
         sort_field=sort_field,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        count_mode=count
     )
 
     # 응답 데이터 구성
     book_list = [LibraryBookResponse(**book) for book in books]
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
 
     payload_data = LibraryListResponse(
         content=book_list,
@@ -56,7 +60,10 @@ def get_library(
         size=size,
         total_elements=total,
         total_pages=total_pages,
-        sort=f"{sort_field},{sort_order}"
+        sort=f"{sort_field},{sort_order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=count
     ).model_dump(by_alias=True)
 
     return BaseResponse(
@@ -2,10 +2,11 @@
 Library Service
 구매한 도서 관련 비즈니스 로직
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.book import Book
+from app.core.pagination import CountMode, count_total, paginate
 from typing import Optional
 
 
@@ -20,8 +21,10 @@ class LibraryService:
         page: int = 1,
         size: int = 20,
         sort_field: str = "order_date", # Default sort to 'order_date' for library
-        sort_order: str = "DESC"
-    ) -> tuple[list[dict], int]:
+        sort_order: str = "DESC",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> tuple[list[dict], Optional[int], Optional[str]]:
         """
         구매한 도서 목록 조회 (DELIVERED 상태)
 
@@ -30,9 +33,11 @@ class LibraryService:
             user_id: 사용자 ID
             page: 페이지 번호
             size: 페이지 크기
+            cursor: 다음 페이지 커서 (지정 시 page 무시)
+            count_mode: 전체 개수 조회 방식 (exact/estimate/none)
 
         Returns:
-            tuple: (구매한 도서 목록, 전체 개수)
+            tuple: (구매한 도서 목록, 전체 개수 - none 모드면 None, 다음 페이지 커서)
         """
         # DELIVERED 상태인 주문의 항목만 조회
         query = db.query(OrderItem, Order, Book).join(
@@ -52,23 +57,19 @@ class LibraryService:
             )
 
         # 동적 정렬
-        if sort_field:
-            if sort_field == "order_date":
-                model_field = Order.created_at # Map 'order_date' to Order.created_at
-            else: # title, author
-                model_field = getattr(Book, sort_field)
-
-            if sort_order.upper() == "DESC":
-                query = query.order_by(desc(model_field))
-            else:
-                query = query.order_by(model_field)
+        if sort_field == "order_date":
+            model_field = Order.created_at # Map 'order_date' to Order.created_at
+        else: # title, author
+            model_field = getattr(Book, sort_field)
 
         # 전체 개수
-        total = query.count()
+        total = count_total(query, count_mode, ("library", user_id, keyword))
 
         # 페이지네이션
-        offset = (page - 1) * size
-        results = query.offset(offset).limit(size).all()
+        results, next_cursor = paginate(
+            query, model_field, OrderItem.id, sort_field, sort_order,
+            size=size, page=page, cursor=cursor
+        )
 
         # 응답 데이터 구성
         books = []
@@ -83,4 +84,9 @@ class LibraryService:
                 "order_id": order.id
             })
 
-        return books, total
+        return books, total, next_cursor
+
+    @staticmethod
+    async def get_purchased_books_async(db: AsyncSession, *args, **kwargs) -> tuple[list[dict], Optional[int], Optional[str]]:
+        """구매한 도서 목록 조회 (비동기 세션용, 인자는 동기 메서드와 동일)"""
+        return await db.run_sync(LibraryService.get_purchased_books, *args, **kwargs)
@@ -2,14 +2,16 @@
 Orders Router
 주문 관련 엔드포인트
 """
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.core.dependencies import get_current_user, get_sort_params
-from app.models.user import User
+from app.core.conditional import conditional_response
+from app.core.dependencies import get_current_principal, get_sort_params, Principal
+from app.core.pagination import CountMode, get_total_pages
 from app.models.order import OrderStatus
 from app.domains.orders.schemas import (
     OrderCreateRequest,
+    OrderCheckoutRequest,
     OrderResponse,
     OrderListResponse,
     OrderItemResponse
@@ -17,7 +19,6 @@ from app.domains.orders.schemas import (
 from app.domains.orders.service import OrderService
 from app.domains.base import BaseResponse
 from typing import Optional
-import math
 
 
 router = APIRouter(prefix="/api/orders", tags=["Orders"])
@@ -33,7 +34,7 @@ router = APIRouter(prefix="/api/orders", tags=["Orders"])
 def create_order(
     data: OrderCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """주문 생성"""
     order = OrderService.create_order(db, current_user.id, data)
@@ -48,6 +49,31 @@ def create_order(
     )
 
 
+@router.post(
+    "/checkout",
+    response_model=BaseResponse[OrderResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="장바구니 주문",
+    description="장바구니의 모든 항목으로 주문을 생성하고 장바구니를 비웁니다. 쿠폰을 적용할 수 있습니다."
+)
+def checkout(
+    data: OrderCheckoutRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """장바구니 주문"""
+    order = OrderService.checkout(db, current_user.id, data)
+
+    # 주문 항목 조회
+    order = OrderService.get_order(db, order.id, current_user.id)
+
+    return BaseResponse(
+        is_success=True,
+        message="주문이 성공적으로 생성되었습니다.",
+        payload=OrderResponse.model_validate(order)
+    )
+
+
 @router.get(
     "",
     response_model=BaseResponse[OrderListResponse],
@@ -58,8 +84,10 @@ def get_orders(
     status: Optional[OrderStatus] = Query(None, description="주문 상태 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
         allowed_fields=["id", "created_at", "status", "total_price"]
     ))
@@ -67,19 +95,21 @@ def get_orders(
     """주문 목록 조회"""
     sort_field, sort_order = sort_params if sort_params else ("created_at", "desc")
 
-    orders, total = OrderService.get_orders(
+    orders, total, next_cursor = OrderService.get_orders(
         db=db,
         user_id=current_user.id,
         status=status,
         page=page,
         size=size,
         sort_field=sort_field,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        count_mode=count
     )
 
     # 응답 데이터 구성
     order_list = [OrderResponse.model_validate(order) for order in orders]
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
 
     payload_data = OrderListResponse(
         content=order_list,
@@ -87,7 +117,10 @@ def get_orders(
         size=size,
         total_elements=total,
         total_pages=total_pages,
-        sort=f"{sort_field},{sort_order}"
+        sort=f"{sort_field},{sort_order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=count
     ).model_dump(by_alias=True)
 
     return BaseResponse(
@@ -103,10 +136,14 @@ def get_orders(
     summary="주문 상세 조회",
     description="특정 주문의 상세 정보를 조회합니다."
 )
+@conditional_response(
+    lambda db, kwargs: OrderService.get_order_version(db, kwargs["order_id"], kwargs["current_user"].id)
+)
 def get_order(
     order_id: int,
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """주문 상세 조회"""
     order = OrderService.get_order(db, order_id, current_user.id)
@@ -127,7 +164,7 @@ def get_order(
 def cancel_order(
     order_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """주문 취소"""
     order = OrderService.cancel_order(db, order_id, current_user.id)
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional, List
 from decimal import Decimal
 from app.models.order import OrderStatus
+from app.core.pagination import CountMode
 
 
 class OrderItemRequest(BaseModel):
@@ -35,6 +36,21 @@ class OrderCreateRequest(BaseModel):
     }
 
 
+class OrderCheckoutRequest(BaseModel):
+    """장바구니 주문 요청"""
+    coupon_id: Optional[int] = Field(None, description="쿠폰 ID (선택)")
+    shipping_address: str = Field(..., min_length=5, max_length=255, description="배송지 주소")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "coupon_id": 1,
+                "shipping_address": "서울시 강남구 테헤란로 123"
+            }
+        }
+    }
+
+
 class OrderItemResponse(BaseModel):
     """주문 항목 응답"""
     id: int = Field(..., description="주문 항목 ID")
@@ -100,9 +116,12 @@ class OrderListResponse(BaseModel):
     content: list[OrderResponse] = Field(..., description="주문 목록")
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
-    total_elements: int = Field(..., alias="totalElements", description="전체 주문 수")
-    total_pages: int = Field(..., alias="totalPages", description="전체 페이지 수")
+    total_elements: Optional[int] = Field(..., alias="totalElements", description="전체 주문 수 (count=none이면 null)")
+    total_pages: Optional[int] = Field(..., alias="totalPages", description="전체 페이지 수 (count=none이면 null)")
     sort: str = Field(..., description="정렬 기준")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor", description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_next: bool = Field(False, alias="hasNext", description="다음 페이지 존재 여부")
+    count_mode: CountMode = Field("exact", alias="countMode", description="전체 개수 조회 방식 (exact/estimate/none)")
 
     model_config = {
         "populate_by_name": True,
@@ -2,14 +2,19 @@
 Orders Service
 주문 관련 비즈니스 로직
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import and_, func, insert
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from app.models.order import Order, OrderItem, OrderStatus
+from app.models.cart import Cart
 from app.models.book import Book
-from app.models.coupon import Coupon, UserCoupon, CouponIssuance, CouponUsageHistory, CouponType
-from app.domains.orders.schemas import OrderCreateRequest
-from app.core.exceptions import NotFoundException, BadRequestException, ForbiddenException
+from app.models.coupon import Coupon, CouponIssuance, CouponUsageHistory, CouponType
+from app.domains.orders.schemas import OrderCreateRequest, OrderCheckoutRequest
+from app.domains.cart.service import CartService
+from app.core.conditional import ResourceVersion, latest
+from app.core.error_codes import ErrorCode
+from app.core.exceptions import BaseAPIException, NotFoundException, BadRequestException, ForbiddenException
+from app.core.pagination import CountMode, count_total, paginate
 from datetime import datetime
 from typing import Optional
 
@@ -18,34 +23,119 @@ class OrderService:
     """주문 서비스"""
 
     @staticmethod
-    def create_order(db: Session, user_id: int, data: OrderCreateRequest) -> Order:
+    def _with_items(query):
+        """주문 항목과 도서를 IN 쿼리로 함께 로딩 (주문 수와 무관하게 쿼리 2개)"""
+        return query.options(selectinload(Order.items).selectinload(OrderItem.book))
+
+    @staticmethod
+    def _hydrate(db: Session, orders: list[Order]) -> list[Order]:
         """
-        주문 생성
+        응답용 주문 데이터 구성 (_with_items로 조회한 주문 목록)
+
+        사용한 쿠폰 이름은 쿠폰 사용 이력(order_id)에서 IN 쿼리 한 번으로 조회합니다.
+        """
+        coupon_names = {}
+        if orders:
+            coupon_names = dict(
+                db.query(CouponUsageHistory.order_id, Coupon.name).join(
+                    Coupon, Coupon.id == CouponUsageHistory.coupon_id
+                ).filter(
+                    CouponUsageHistory.order_id.in_([order.id for order in orders])
+                ).all()
+            )
+
+        for order in orders:
+            order.coupon_code = coupon_names.get(order.id)
+            for item in order.items:
+                item.book_title = item.book.title if item.book else "Unknown"
+                item.book_author = item.book.author if item.book else "Unknown"
+                item.subtotal = item.price_at_purchase * item.quantity
+
+        return orders
+
+    @staticmethod
+    def _validate_coupon(db: Session, user_id: int, coupon_id: int) -> Coupon:
+        """
+        쿠폰 사용 가능 여부 검증 (쿠폰/발급/사용 이력을 한 번의 쿼리로 조회)
+
+        Raises:
+            NotFoundException: 쿠폰을 찾을 수 없음
+            BadRequestException: 쿠폰 사용 불가
+        """
+        row = db.query(
+            Coupon,
+            CouponIssuance.id.label("issuance_id"),
+            CouponUsageHistory.id.label("usage_id")
+        ).outerjoin(
+            CouponIssuance,
+            and_(CouponIssuance.coupon_id == Coupon.id, CouponIssuance.user_id == user_id)
+        ).outerjoin(
+            CouponUsageHistory,
+            and_(CouponUsageHistory.coupon_id == Coupon.id, CouponUsageHistory.user_id == user_id)
+        ).filter(Coupon.id == coupon_id).first()
+
+        if not row:
+            raise NotFoundException("COUPON_NOT_FOUND", "Coupon not found")
+        coupon = row.Coupon
+
+        # 쿠폰 유효성 검증
+        if not coupon.is_active:
+            raise BadRequestException("COUPON_INACTIVE", "Coupon is not active")
+
+        now = datetime.utcnow()
+        if coupon.start_at and now < coupon.start_at:
+            raise BadRequestException("COUPON_NOT_YET_VALID", "Coupon is not yet valid")
+        if coupon.end_at and now > coupon.end_at:
+            raise BadRequestException("COUPON_EXPIRED", "Coupon has expired")
+
+        # PERSONAL 쿠폰: 발급받았는지 확인 (UNIVERSAL 쿠폰은 발급 확인 불필요)
+        if coupon.coupon_type == CouponType.PERSONAL and row.issuance_id is None:
+            raise BadRequestException(
+                "COUPON_NOT_ISSUED",
+                "This coupon has not been issued to you"
+            )
+
+        # 이미 사용했는지 확인
+        if row.usage_id is not None:
+            raise BadRequestException("COUPON_ALREADY_USED", "Coupon has already been used")
+
+        return coupon
+
+    @staticmethod
+    def _price_order(db: Session, user_id: int, items: list, coupon_id: Optional[int]) -> dict:
+        """
+        주문 금액 계산 (도서는 IN 쿼리 한 번, 쿠폰은 쿼리 한 번으로 검증)
 
         Args:
             db: 데이터베이스 세션
             user_id: 사용자 ID
-            data: 주문 데이터
+            items: 주문 항목 목록 (book_id, quantity 속성)
+            coupon_id: 쿠폰 ID (선택)
 
         Returns:
-            Order: 생성된 주문
+            dict: 주문 항목 데이터, 총 금액, 할인 금액, 최종 금액, 쿠폰 이름
 
         Raises:
             NotFoundException: 도서 또는 쿠폰을 찾을 수 없음
             BadRequestException: 쿠폰 사용 불가
         """
+        book_ids = {item.book_id for item in items}
+        books = {
+            book.id: book for book in db.query(
+                Book.id, Book.price, Book.title, Book.author
+            ).filter(Book.id.in_(book_ids))
+        }
+
         # 주문 항목 검증 및 총 금액 계산
         total_price = 0
         order_items_data = []
 
-        for item in data.items:
-            book = db.query(Book).filter(Book.id == item.book_id).first()
+        for item in items:
+            book = books.get(item.book_id)
             if not book:
                 raise NotFoundException("BOOK_NOT_FOUND", f"Book with ID {item.book_id} not found")
 
-            subtotal = book.price * item.quantity
-            total_price += subtotal
-
+            total_price += book.price * item.quantity
             order_items_data.append({
                 "book_id": book.id,
                 "quantity": item.quantity,
@@ -58,89 +148,87 @@ class OrderService:
         discount_amount = 0
         coupon_code = None
 
-        if data.coupon_id:
-            coupon = db.query(Coupon).filter(Coupon.id == data.coupon_id).first()
-            if not coupon:
-                raise NotFoundException("COUPON_NOT_FOUND", "Coupon not found")
-
-            # 쿠폰 유효성 검증
-            if not coupon.is_active:
-                raise BadRequestException("COUPON_INACTIVE", "Coupon is not active")
-
-            now = datetime.utcnow()
-            if coupon.start_at and now < coupon.start_at:
-                raise BadRequestException("COUPON_NOT_YET_VALID", "Coupon is not yet valid")
-            if coupon.end_at and now > coupon.end_at:
-                raise BadRequestException("COUPON_EXPIRED", "Coupon has expired")
-
-            # 쿠폰 타입에 따라 발급 여부 확인
-            if coupon.coupon_type == CouponType.PERSONAL:
-                # PERSONAL 쿠폰: 발급받았는지 확인
-                issuance = db.query(CouponIssuance).filter(
-                    CouponIssuance.user_id == user_id,
-                    CouponIssuance.coupon_id == data.coupon_id
-                ).first()
-                if not issuance:
-                    raise BadRequestException(
-                        "COUPON_NOT_ISSUED",
-                        "This coupon has not been issued to you"
-                    )
-            # UNIVERSAL 쿠폰: 모두 사용 가능 (발급 확인 불필요)
-
-            # 이미 사용했는지 확인
-            usage = db.query(CouponUsageHistory).filter(
-                CouponUsageHistory.user_id == user_id,
-                CouponUsageHistory.coupon_id == data.coupon_id
-            ).first()
-            if usage:
-                raise BadRequestException("COUPON_ALREADY_USED", "Coupon has already been used")
+        if coupon_id:
+            coupon = OrderService._validate_coupon(db, user_id, coupon_id)
 
             # 할인 금액 계산 (discount_rate는 백분율)
             discount_amount = int(float(total_price) * float(coupon.discount_rate) / 100)
-
             coupon_code = coupon.name
 
         final_price = total_price - discount_amount
         if final_price < 0:
             final_price = 0
 
-        # 주문 생성
+        return {
+            "items": order_items_data,
+            "total_price": total_price,
+            "discount_amount": discount_amount,
+            "final_price": final_price,
+            "coupon_code": coupon_code
+        }
+
+    @staticmethod
+    def _insert_order(
+        db: Session,
+        user_id: int,
+        pricing: dict,
+        coupon_id: Optional[int],
+        shipping_address: str
+    ) -> Order:
+        """
+        주문, 주문 항목(다중 행 INSERT), 쿠폰 사용 이력을 한 트랜잭션으로 저장 (커밋은 호출자가 수행)
+        """
         order = Order(
             user_id=user_id,
             status=OrderStatus.PENDING,
-            total_price=total_price,
-            discount_amount=discount_amount,
-            final_price=final_price,
-            shipping_address=data.shipping_address
+            total_price=pricing["total_price"],
+            discount_amount=pricing["discount_amount"],
+            final_price=pricing["final_price"],
+            shipping_address=shipping_address
         )
+        db.add(order)
+        db.flush()  # ID 생성
+
+        db.execute(insert(OrderItem), [
+            {
+                "order_id": order.id,
+                "book_id": item_data["book_id"],
+                "quantity": item_data["quantity"],
+                "price_at_purchase": item_data["price"]
+            }
+            for item_data in pricing["items"]
+        ])
+
+        # 쿠폰 사용 처리 (동시에 같은 쿠폰을 사용하면 유니크 제약으로 주문 전체가 롤백됨)
+        if coupon_id:
+            db.add(CouponUsageHistory(user_id=user_id, coupon_id=coupon_id, order_id=order.id))
+            db.flush()
 
-        try:
-            db.add(order)
-            db.flush()  # ID 생성
-
-            # 주문 항목 생성
-            for item_data in order_items_data:
-                order_item = OrderItem(
-                    order_id=order.id,
-                    book_id=item_data["book_id"],
-                    quantity=item_data["quantity"],
-                    price_at_purchase=item_data["price"]
-                )
-                db.add(order_item)
+        return order
 
-            db.commit()
-            db.refresh(order)
+    @staticmethod
+    def create_order(db: Session, user_id: int, data: OrderCreateRequest) -> Order:
+        """
+        주문 생성
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            data: 주문 데이터
 
-            # 주문 생성 성공 후 쿠폰 사용 처리
-            if data.coupon_id:
-                usage_history = CouponUsageHistory(
-                    user_id=user_id,
-                    coupon_id=data.coupon_id,
-                    order_id=order.id
-                )
-                db.add(usage_history)
-                db.commit()
+        Returns:
+            Order: 생성된 주문
 
+        Raises:
+            NotFoundException: 도서 또는 쿠폰을 찾을 수 없음
+            BadRequestException: 쿠폰 사용 불가
+        """
+        pricing = OrderService._price_order(db, user_id, data.items, data.coupon_id)
+
+        try:
+            order = OrderService._insert_order(db, user_id, pricing, data.coupon_id, data.shipping_address)
+            db.commit()
+            db.refresh(order)
         except IntegrityError as e:
             db.rollback()
             raise BadRequestException("ORDER_CREATE_FAILED", f"Failed to create order: {str(e)}")
@@ -149,7 +237,60 @@ class OrderService:
             raise BadRequestException("ORDER_CREATE_FAILED", f"Failed to create order: {str(e)}")
 
         # 응답용 데이터 추가
-        order.coupon_code = coupon_code
+        order.coupon_code = pricing["coupon_code"]
+
+        return order
+
+    @staticmethod
+    def checkout(db: Session, user_id: int, data: OrderCheckoutRequest) -> Order:
+        """
+        장바구니 주문 (장바구니 → 주문 변환을 한 트랜잭션으로 처리)
+
+        장바구니 행을 잠근(SELECT ... FOR UPDATE) 뒤 도서 일괄 조회로 금액을 계산하고,
+        주문 생성과 장바구니 논리 삭제를 함께 커밋합니다. 중간에 실패하면 전체 롤백됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            data: 쿠폰 및 배송지
+
+        Returns:
+            Order: 생성된 주문
+
+        Raises:
+            BadRequestException: 장바구니가 비어 있음, 쿠폰 사용 불가
+            NotFoundException: 도서 또는 쿠폰을 찾을 수 없음
+        """
+        try:
+            # 같은 사용자의 동시 주문/장바구니 변경 방지
+            cart_items = db.query(Cart.id, Cart.book_id, Cart.quantity).filter(
+                Cart.user_id == user_id,
+                Cart.deleted_at.is_(None)
+            ).order_by(Cart.id).with_for_update().all()
+
+            if not cart_items:
+                raise BadRequestException(ErrorCode.CART_EMPTY, "Cart is empty")
+
+            pricing = OrderService._price_order(db, user_id, cart_items, data.coupon_id)
+            order = OrderService._insert_order(db, user_id, pricing, data.coupon_id, data.shipping_address)
+
+            # 장바구니 일괄 논리 삭제
+            db.query(Cart).filter(
+                Cart.id.in_([item.id for item in cart_items])
+            ).update({Cart.deleted_at: datetime.utcnow()}, synchronize_session=False)
+
+            db.commit()
+            db.refresh(order)
+            CartService.invalidate_cache(user_id)
+        except BaseAPIException:
+            db.rollback()
+            raise
+        except IntegrityError as e:
+            db.rollback()
+            raise BadRequestException("ORDER_CREATE_FAILED", f"Failed to create order: {str(e)}")
+
+        # 응답용 데이터 추가
+        order.coupon_code = pricing["coupon_code"]
 
         return order
 
@@ -161,8 +302,10 @@ class OrderService:
         page: int = 1,
         size: int = 10,
         sort_field: str = "created_at",
-        sort_order: str = "DESC"
-    ) -> tuple[list[Order], int]:
+        sort_order: str = "DESC",
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> tuple[list[Order], Optional[int], Optional[str]]:
         """
         주문 목록 조회
 
@@ -172,9 +315,11 @@ class OrderService:
             status: 주문 상태 필터 (선택)
             page: 페이지 번호
             size: 페이지 크기
+            cursor: 다음 페이지 커서 (지정 시 page 무시)
+            count_mode: 전체 개수 조회 방식 (exact/estimate/none)
 
         Returns:
-            tuple: (주문 목록, 전체 개수)
+            tuple: (주문 목록, 전체 개수 - none 모드면 None, 다음 페이지 커서)
         """
         query = db.query(Order).filter(Order.user_id == user_id)
 
@@ -182,35 +327,17 @@ class OrderService:
         if status:
             query = query.filter(Order.status == status)
 
-        # 동적 정렬
-        if sort_field:
-            if sort_order.upper() == "DESC":
-                query = query.order_by(desc(getattr(Order, sort_field)))
-            else:
-                query = query.order_by(getattr(Order, sort_field))
-
         # 전체 개수
-        total = query.count()
-
-        # 페이지네이션
-        offset = (page - 1) * size
-        orders = query.offset(offset).limit(size).all()
+        total = count_total(query, count_mode, ("orders", user_id, status))
 
-        # 쿠폰 코드 추가
-        for order in orders:
-            user_coupon = db.query(UserCoupon).filter(
-                UserCoupon.order_id == order.id
-            ).first()
-            if user_coupon:
-                coupon = db.query(Coupon).filter(Coupon.id == user_coupon.coupon_id).first()
-                order.coupon_code = coupon.name if coupon else None
-            else:
-                order.coupon_code = None
-
-            # 주문 항목 추가
-            order.items = []
+        # 동적 정렬 + 페이지네이션 (주문 항목/도서/쿠폰 이름은 일괄 로딩)
+        orders, next_cursor = paginate(
+            OrderService._with_items(query), getattr(Order, sort_field), Order.id, sort_field, sort_order,
+            size=size, page=page, cursor=cursor
+        )
+        OrderService._hydrate(db, orders)
 
-        return orders, total
+        return orders, total, next_cursor
 
     @staticmethod
     def get_order(db: Session, order_id: int, user_id: int) -> Order:
@@ -229,7 +356,7 @@ class OrderService:
             NotFoundException: 주문을 찾을 수 없음
             ForbiddenException: 본인의 주문이 아님
         """
-        order = db.query(Order).filter(Order.id == order_id).first()
+        order = OrderService._with_items(db.query(Order)).filter(Order.id == order_id).first()
         if not order:
             raise NotFoundException("ORDER_NOT_FOUND", "Order not found")
 
@@ -237,27 +364,32 @@ class OrderService:
         if order.user_id != user_id:
             raise ForbiddenException("FORBIDDEN", "You can only view your own orders")
 
-        # 쿠폰 코드 추가
-        user_coupon = db.query(UserCoupon).filter(UserCoupon.order_id == order.id).first()
-        if user_coupon:
-            coupon = db.query(Coupon).filter(Coupon.id == user_coupon.coupon_id).first()
-            order.coupon_code = coupon.name if coupon else None
-        else:
-            order.coupon_code = None
-
-        # 주문 항목 조회
-        order_items = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
-        for item in order_items:
-            book = db.query(Book).filter(Book.id == item.book_id).first()
-            if book:
-                item.book_title = book.title
-                item.book_author = book.author
-            item.subtotal = item.price_at_purchase * item.quantity
-
-        order.items = order_items
+        OrderService._hydrate(db, [order])
 
         return order
 
+    @staticmethod
+    def get_order_version(db: Session, order_id: int, user_id: int) -> Optional[ResourceVersion]:
+        """
+        주문 상세 응답 버전 (조건부 요청용, 없거나 본인의 주문이 아니면 None)
+
+        주문 수정 시각/상태와 주문 항목 도서(제목/저자)의 마지막 수정 시각을 한 번의 쿼리로 조회합니다.
+        """
+        row = db.query(
+            Order.updated_at, Order.status, func.max(Book.updated_at).label("book_updated_at")
+        ).outerjoin(
+            OrderItem, OrderItem.order_id == Order.id
+        ).outerjoin(
+            Book, Book.id == OrderItem.book_id
+        ).filter(
+            Order.id == order_id,
+            Order.user_id == user_id
+        ).group_by(Order.id, Order.updated_at, Order.status).first()
+        if not row:
+            return None
+
+        return ResourceVersion("order", order_id, *row, last_modified=latest(row.updated_at, row.book_updated_at))
+
     @staticmethod
     def cancel_order(db: Session, order_id: int, user_id: int) -> Order:
         """
@@ -2,11 +2,14 @@
 Reviews Router
 리뷰 관련 엔드포인트
 """
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.core.dependencies import get_current_user, get_optional_user, get_sort_params
-from app.models.user import User
+from app.core.database import get_async_db, get_db
+from app.core.conditional import conditional_response
+from app.core.dependencies import get_current_user, get_current_principal, get_optional_user, get_sort_params, Principal
+from app.core.pagination import CountMode, get_total_pages
+from app.core.response_cache import book_reviews_tag, cached_response
 from app.domains.reviews.schemas import (
     ReviewCreateRequest,
     ReviewUpdateRequest,
@@ -17,12 +20,15 @@ from app.domains.reviews.schemas import (
 from app.domains.reviews.service import ReviewService
 from app.domains.base import BaseResponse, SuccessResponse
 from typing import Optional
-import math
 
 
 router = APIRouter(prefix="/api/reviews", tags=["Reviews"])
 
 
+def _user_id(current_user: Optional[Principal]) -> Optional[int]:
+    return current_user.id if current_user else None
+
+
 @router.post(
     "",
     response_model=BaseResponse[ReviewResponse],
@@ -33,7 +39,7 @@ router = APIRouter(prefix="/api/reviews", tags=["Reviews"])
 def create_review(
     data: ReviewCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """리뷰 작성 (구매 검증)"""
     review = ReviewService.create_review(db, current_user.id, data)
@@ -56,14 +62,22 @@ def create_review(
     summary="리뷰 목록 조회",
     description="리뷰 목록을 조회합니다. 검색, 필터링, 정렬, 페이지네이션을 지원합니다."
 )
-def get_reviews(
+@cached_response(
+    tags=lambda kwargs: [book_reviews_tag(kwargs["book_id"])],
+    # 도서별 목록만 캐시 (전체/작성자별 목록은 리뷰 변경마다 무효화 범위가 너무 넓음)
+    condition=lambda kwargs: kwargs["book_id"] is not None
+)
+async def get_reviews(
+    request: Request,
     book_id: Optional[int] = Query(None, description="도서 ID 필터"),
     user_id: Optional[int] = Query(None, description="작성자 ID 필터"),
     min_rating: Optional[int] = Query(None, ge=1, le=5, description="최소 평점 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor, 지정 시 page 무시)"),
+    count: CountMode = Query("exact", description="전체 개수 조회 방식 (exact: 정확한 개수, estimate: 캐시된 근사값, none: 생략 후 hasNext만 제공)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[Principal] = Depends(get_optional_user),
     sort_params: Optional[tuple[str, str]] = Depends(get_sort_params(
         allowed_fields=["created_at", "rating", "like_count"]
     ))
@@ -72,7 +86,7 @@ def get_reviews(
     current_user_id = current_user.id if current_user else None
     sort_field, sort_order = sort_params if sort_params else ("created_at", "desc")
 
-    reviews, total = ReviewService.get_reviews(
+    reviews, total, next_cursor = await ReviewService.get_reviews_async(
         db=db,
         current_user_id=current_user_id,
         book_id=book_id,
@@ -81,12 +95,14 @@ def get_reviews(
         sort=sort_field,
         order=sort_order,
         page=page,
-        size=size
+        size=size,
+        cursor=cursor,
+        count_mode=count
     )
 
     # 응답 데이터 구성
     review_list = [ReviewResponse.model_validate(review) for review in reviews]
-    total_pages = math.ceil(total / size) if total > 0 else 0
+    total_pages = get_total_pages(total, size)
     
     payload_data = ReviewListResponse(
         content=review_list,
@@ -94,7 +110,10 @@ def get_reviews(
         size=size,
         total_elements=total,
         total_pages=total_pages,
-        sort=f"{sort_field},{sort_order}"
+        sort=f"{sort_field},{sort_order}",
+        next_cursor=next_cursor,
+        has_next=next_cursor is not None,
+        count_mode=count
     ).model_dump(by_alias=True) # model_dump with by_alias=True to handle camelCase
 
     return BaseResponse(
@@ -110,14 +129,18 @@ def get_reviews(
     summary="리뷰 상세 조회",
     description="특정 리뷰의 상세 정보를 조회합니다."
 )
-def get_review(
+@conditional_response(
+    lambda db, kwargs: ReviewService.get_review_version(db, kwargs["review_id"], _user_id(kwargs["current_user"]))
+)
+async def get_review(
     review_id: int,
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_optional_user)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[Principal] = Depends(get_optional_user)
 ):
     """리뷰 상세 조회"""
     current_user_id = current_user.id if current_user else None
-    review = ReviewService.get_review(db, review_id, current_user_id)
+    review = await ReviewService.get_review_async(db, review_id, current_user_id)
 
     return BaseResponse(
         is_success=True,
@@ -136,7 +159,7 @@ def update_review(
     review_id: int,
     data: ReviewUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """리뷰 수정 (본인만 가능)"""
     review = ReviewService.update_review(db, review_id, current_user.id, data)
@@ -160,7 +183,7 @@ def update_review(
 def delete_review(
     review_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """리뷰 삭제 (본인만 가능)"""
     ReviewService.delete_review(db, review_id, current_user.id)
@@ -179,7 +202,7 @@ def delete_review(
 def toggle_like(
     review_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """리뷰 좋아요 토글"""
     is_liked, like_count = ReviewService.toggle_like(db, review_id, current_user.id)
@@ -2,8 +2,9 @@
 Reviews Service
 리뷰 관련 비즈니스 로직
 """
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func
+from sqlalchemy import exists, func, literal
 from sqlalchemy.exc import IntegrityError
 from app.models.review import Review, ReviewLike, ReviewLikeCount
 from app.models.book import Book
@@ -11,12 +12,60 @@ from app.models.order import Order, OrderItem, OrderStatus
 from app.models.user import User
 from app.domains.reviews.schemas import ReviewCreateRequest, ReviewUpdateRequest
 from app.core.exceptions import NotFoundException, BadRequestException, ForbiddenException
+from app.core import likes
+from app.core.conditional import ResourceVersion, latest
+from app.core.pagination import CountMode, count_total, paginate
+from app.core.response_cache import BOOK_LIST_TAG, book_reviews_tag, book_tag, response_cache
+from app.domains.books.rating_stats import apply_rating_change
 from typing import Optional
 
 
 class ReviewService:
     """리뷰 서비스"""
 
+    @staticmethod
+    def _with_details(query):
+        """
+        리뷰 쿼리에 좋아요 수(ReviewLikeCount)와 작성자 이름(User)을 조인하여 함께 조회
+
+        Returns:
+            (Review, like_count, user_name) 행을 반환하는 쿼리
+        """
+        return query.outerjoin(
+            ReviewLikeCount, ReviewLikeCount.review_id == Review.id
+        ).outerjoin(
+            User, User.id == Review.user_id
+        ).add_columns(
+            func.coalesce(ReviewLikeCount.like_count, 0).label("like_count"),
+            User.name.label("user_name")
+        )
+
+    @staticmethod
+    def _hydrate(db: Session, rows: list, current_user_id: Optional[int]) -> list[Review]:
+        """
+        _with_details 조회 결과를 응답용 리뷰 목록으로 변환
+
+        현재 사용자의 좋아요 여부는 페이지 전체에 대해 IN 쿼리 한 번으로 조회합니다.
+        """
+        liked_ids = set()
+        if current_user_id and rows:
+            review_ids = [row.Review.id for row in rows]
+            liked_ids = {
+                review_id for (review_id,) in db.query(ReviewLike.review_id).filter(
+                    ReviewLike.user_id == current_user_id,
+                    ReviewLike.review_id.in_(review_ids)
+                )
+            }
+
+        reviews = []
+        for row in rows:
+            review = row.Review
+            review.like_count = row.like_count
+            review.user_name = row.user_name or "Unknown"
+            review.is_liked = review.id in liked_ids
+            reviews.append(review)
+        return reviews
+
     @staticmethod
     def verify_purchase(db: Session, user_id: int, book_id: int) -> Optional[int]:
         """
@@ -91,18 +140,20 @@ class ReviewService:
 
         try:
             db.add(review)
-            db.commit()
-            db.refresh(review)
+            db.flush()
 
-            # 좋아요 카운트 테이블 초기화
+            # 좋아요 카운트 테이블 초기화 및 도서 평점 집계 반영 (리뷰와 같은 트랜잭션)
             like_count = ReviewLikeCount(review_id=review.id, like_count=0)
             db.add(like_count)
+            apply_rating_change(db, review.book_id, added=review.rating)
             db.commit()
+            db.refresh(review)
 
         except IntegrityError as e:
             db.rollback()
             raise BadRequestException("REVIEW_CREATE_FAILED", f"Failed to create review: {str(e)}")
 
+        ReviewService._invalidate_cache(review.book_id, rating_changed=True)
         return review
 
     @staticmethod
@@ -115,8 +166,10 @@ class ReviewService:
         sort: str = "created_at",
         order: str = "desc",
         page: int = 1,
-        size: int = 10
-    ) -> tuple[list[Review], int]:
+        size: int = 10,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = "exact"
+    ) -> tuple[list[Review], Optional[int], Optional[str]]:
         """
         리뷰 목록 조회 (좋아요 순 Top-N 지원)
 
@@ -130,9 +183,11 @@ class ReviewService:
             order: 정렬 순서
             page: 페이지 번호
             size: 페이지 크기
+            cursor: 다음 페이지 커서 (지정 시 page 무시)
+            count_mode: 전체 개수 조회 방식 (exact/estimate/none)
 
         Returns:
-            tuple: (리뷰 목록, 전체 개수)
+            tuple: (리뷰 목록, 전체 개수 - none 모드면 None, 다음 페이지 커서)
         """
         query = db.query(Review)
 
@@ -144,48 +199,32 @@ class ReviewService:
         if min_rating:
             query = query.filter(Review.rating >= min_rating)
 
+        # 전체 개수 (조인 없이 필터 조건만으로 계산)
+        total = count_total(query, count_mode, ("reviews", book_id, user_id, min_rating))
+
+        # 좋아요 수/작성자 이름을 같은 쿼리에서 조회
+        query = ReviewService._with_details(query)
+
         # 정렬
         if sort == "like_count":
-            # 좋아요 수로 정렬 시 ReviewLikeCount 테이블 조인
-            query = query.join(ReviewLikeCount, Review.id == ReviewLikeCount.review_id)
-            order_by = desc(ReviewLikeCount.like_count) if order == "desc" else asc(ReviewLikeCount.like_count)
+            sort_column = ReviewLikeCount.like_count
         elif sort == "rating":
-            order_by = desc(Review.rating) if order == "desc" else asc(Review.rating)
+            sort_column = Review.rating
         else:  # created_at (기본값)
-            order_by = desc(Review.created_at) if order == "desc" else asc(Review.created_at)
+            sort_column = Review.created_at
 
-        query = query.order_by(order_by)
+        # 페이지네이션
+        rows, next_cursor = paginate(
+            query, sort_column, Review.id, sort, order, size=size, page=page, cursor=cursor
+        )
+        reviews = ReviewService._hydrate(db, rows, current_user_id)
 
-        # 전체 개수
-        total = query.count()
+        return reviews, total, next_cursor
 
-        # 페이지네이션
-        offset = (page - 1) * size
-        reviews = query.offset(offset).limit(size).all()
-
-        # 현재 사용자의 좋아요 여부 및 좋아요 수 추가
-        for review in reviews:
-            # 좋아요 수 (캐시에서 조회)
-            like_count_obj = db.query(ReviewLikeCount).filter(
-                ReviewLikeCount.review_id == review.id
-            ).first()
-            review.like_count = like_count_obj.like_count if like_count_obj else 0
-
-            # 현재 사용자의 좋아요 여부
-            if current_user_id:
-                is_liked = db.query(ReviewLike).filter(
-                    ReviewLike.review_id == review.id,
-                    ReviewLike.user_id == current_user_id
-                ).first() is not None
-                review.is_liked = is_liked
-            else:
-                review.is_liked = False
-
-            # 작성자 이름 추가
-            user = db.query(User).filter(User.id == review.user_id).first()
-            review.user_name = user.name if user else "Unknown"
-
-        return reviews, total
+    @staticmethod
+    async def get_reviews_async(db: AsyncSession, *args, **kwargs) -> tuple[list[Review], Optional[int], Optional[str]]:
+        """리뷰 목록 조회 (비동기 세션용, 인자는 동기 메서드와 동일)"""
+        return await db.run_sync(ReviewService.get_reviews, *args, **kwargs)
 
     @staticmethod
     def get_review(db: Session, review_id: int, current_user_id: Optional[int]) -> Review:
@@ -203,32 +242,47 @@ class ReviewService:
         Raises:
             NotFoundException: 리뷰를 찾을 수 없음
         """
-        review = db.query(Review).filter(Review.id == review_id).first()
-        if not review:
+        row = ReviewService._with_details(db.query(Review)).filter(Review.id == review_id).first()
+        if not row:
             raise NotFoundException("REVIEW_NOT_FOUND", "Review not found")
 
-        # 좋아요 수
-        like_count_obj = db.query(ReviewLikeCount).filter(
-            ReviewLikeCount.review_id == review.id
-        ).first()
-        review.like_count = like_count_obj.like_count if like_count_obj else 0
-
-        # 현재 사용자의 좋아요 여부
-        if current_user_id:
-            is_liked = db.query(ReviewLike).filter(
-                ReviewLike.review_id == review.id,
-                ReviewLike.user_id == current_user_id
-            ).first() is not None
-            review.is_liked = is_liked
-        else:
-            review.is_liked = False
-
-        # 작성자 이름
-        user = db.query(User).filter(User.id == review.user_id).first()
-        review.user_name = user.name if user else "Unknown"
+        review, = ReviewService._hydrate(db, [row], current_user_id)
 
         return review
 
+    @staticmethod
+    def get_review_version(db: Session, review_id: int, current_user_id: Optional[int]) -> Optional[ResourceVersion]:
+        """
+        리뷰 상세 응답 버전 (조건부 요청용, 없는 리뷰면 None)
+
+        리뷰/좋아요 수/작성자 수정 시각과 좋아요 수, 현재 사용자의 좋아요 여부를 한 번의 쿼리로 조회합니다.
+        """
+        is_liked = exists().where(
+            ReviewLike.review_id == Review.id,
+            ReviewLike.user_id == current_user_id
+        ) if current_user_id else literal(False)
+
+        row = db.query(
+            Review.updated_at, ReviewLikeCount.like_count, ReviewLikeCount.updated_at.label("like_updated_at"),
+            User.updated_at.label("user_updated_at"), is_liked.label("is_liked")
+        ).outerjoin(
+            ReviewLikeCount, ReviewLikeCount.review_id == Review.id
+        ).outerjoin(
+            User, User.id == Review.user_id
+        ).filter(Review.id == review_id).first()
+        if not row:
+            return None
+
+        return ResourceVersion(
+            "review", review_id, *row,
+            last_modified=latest(row.updated_at, row.like_updated_at, row.user_updated_at)
+        )
+
+    @staticmethod
+    async def get_review_async(db: AsyncSession, *args, **kwargs) -> Review:
+        """리뷰 상세 조회 (비동기 세션용, 인자는 동기 메서드와 동일)"""
+        return await db.run_sync(ReviewService.get_review, *args, **kwargs)
+
     @staticmethod
     def update_review(db: Session, review_id: int, user_id: int, data: ReviewUpdateRequest) -> Review:
         """
@@ -265,16 +319,19 @@ class ReviewService:
         if 'content' in update_data:
             update_data['comment'] = update_data.pop('content')
 
+        old_rating = review.rating
         for field, value in update_data.items():
             setattr(review, field, value)
 
         try:
+            apply_rating_change(db, review.book_id, added=review.rating, removed=old_rating)
             db.commit()
             db.refresh(review)
         except IntegrityError as e:
             db.rollback()
             raise BadRequestException("UPDATE_FAILED", f"Failed to update review: {str(e)}")
 
+        ReviewService._invalidate_cache(review.book_id, rating_changed=review.rating != old_rating)
         return review
 
     @staticmethod
@@ -300,13 +357,24 @@ class ReviewService:
             raise ForbiddenException("FORBIDDEN", "You can only delete your own reviews")
 
         # CASCADE로 관련 데이터 자동 삭제 (review_likes, review_like_counts, comments)
+        book_id = review.book_id
         db.delete(review)
+        apply_rating_change(db, book_id, removed=review.rating)
         db.commit()
+        ReviewService._invalidate_cache(book_id, rating_changed=True)
+
+    @staticmethod
+    def _invalidate_cache(book_id: int, rating_changed: bool) -> None:
+        """도서별 리뷰 목록 응답 캐시 무효화 (평점이 바뀌면 평점 집계를 포함한 도서 목록/상세도 무효화)"""
+        tags = [book_reviews_tag(book_id)]
+        if rating_changed:
+            tags += [BOOK_LIST_TAG, book_tag(book_id)]
+        response_cache.invalidate(*tags)
 
     @staticmethod
     def toggle_like(db: Session, review_id: int, user_id: int) -> tuple[bool, int]:
         """
-        리뷰 좋아요 토글
+        리뷰 좋아요 토글 (단일 트랜잭션, 동시 요청 안전)
 
         Args:
             db: 데이터베이스 세션
@@ -319,49 +387,25 @@ class ReviewService:
         Raises:
             NotFoundException: 리뷰를 찾을 수 없음
         """
-        # 리뷰 존재 확인
-        review = db.query(Review).filter(Review.id == review_id).first()
-        if not review:
+        # 리뷰 존재 확인 (응답 캐시 무효화용 도서 ID 함께 조회)
+        row = db.query(Review.book_id).filter(Review.id == review_id).first()
+        if not row:
             raise NotFoundException("REVIEW_NOT_FOUND", "Review not found")
 
-        # 기존 좋아요 확인
-        existing_like = db.query(ReviewLike).filter(
-            ReviewLike.review_id == review_id,
-            ReviewLike.user_id == user_id
-        ).first()
-
-        is_liked = False
-
-        if existing_like:
-            # 좋아요 취소
-            db.delete(existing_like)
-        else:
-            # 좋아요 추가
-            new_like = ReviewLike(review_id=review_id, user_id=user_id)
-            db.add(new_like)
-            is_liked = True
-
+        is_liked, like_count = likes.toggle_like(db, ReviewLike, ReviewLikeCount, "review_id", review_id, user_id)
         db.commit()
+        response_cache.invalidate(book_reviews_tag(row.book_id))
 
-        # 좋아요 수 업데이트 (캐시 테이블)
-        like_count_obj = db.query(ReviewLikeCount).filter(
-            ReviewLikeCount.review_id == review_id
-        ).first()
+        return is_liked, like_count
 
-        if not like_count_obj:
-            # 캐시가 없으면 생성
-            current_count = db.query(func.count(ReviewLike.id)).filter(
-                ReviewLike.review_id == review_id
-            ).scalar()
-            like_count_obj = ReviewLikeCount(review_id=review_id, like_count=current_count)
-            db.add(like_count_obj)
-        else:
-            # 캐시 업데이트
-            current_count = db.query(func.count(ReviewLike.id)).filter(
-                ReviewLike.review_id == review_id
-            ).scalar()
-            like_count_obj.like_count = current_count
+    @staticmethod
+    def reconcile_like_counts(db: Session) -> dict:
+        """
+        리뷰 좋아요 수 집계 테이블을 좋아요 테이블 기준으로 보정
 
+        Returns:
+            dict: 처리 결과 (생성된 집계 행 수, 보정된 집계 행 수)
+        """
+        result = likes.reconcile_like_counts(db, Review, ReviewLike, ReviewLikeCount, "review_id")
         db.commit()
-
-        return is_liked, like_count_obj.like_count
+        return result
@@ -2,11 +2,11 @@
 Users Router
 사용자 프로필 관련 엔드포인트
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.models.user import User
-from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_response
+from app.core.dependencies import get_current_principal, Principal
 from app.domains.users.schemas import UserResponse, UserUpdateRequest
 from app.domains.users.service import UserService
 from app.domains.base import BaseResponse, SuccessResponse
@@ -23,8 +23,10 @@ router = APIRouter(prefix="/api/users", tags=["Users"])
     description="현재 로그인한 사용자의 프로필 정보를 조회합니다.",
     operation_id="users.list"
 )
+@conditional_response(lambda db, kwargs: UserService.get_profile_version(db, kwargs["current_user"].id))
 def get_my_profile(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -52,7 +54,7 @@ def get_my_profile(
 )
 def update_my_profile(
     data: UserUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -81,7 +83,7 @@ def update_my_profile(
     operation_id="users.delete"
 )
 def delete_my_account(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -7,7 +7,10 @@ from sqlalchemy.exc import IntegrityError
 from app.models.user import User
 from app.domains.users.schemas import UserUpdateRequest
 from app.core.security import hash_password
+from app.core.auth_cache import invalidate_user
+from app.core.conditional import ResourceVersion
 from app.core.exceptions import NotFoundException, BadRequestException
+from typing import Optional
 
 
 class UserService:
@@ -34,6 +37,14 @@ class UserService:
 
         return user
 
+    @staticmethod
+    def get_profile_version(db: Session, user_id: int) -> Optional[ResourceVersion]:
+        """프로필 응답 버전 (조건부 요청용, 없는 사용자면 None)"""
+        updated_at = db.query(User.updated_at).filter(User.id == user_id).scalar()
+        if updated_at is None:
+            return None
+        return ResourceVersion("user", user_id, updated_at, last_modified=updated_at)
+
     @staticmethod
     def update_profile(db: Session, user_id: int, data: UserUpdateRequest) -> User:
         """
@@ -76,6 +87,7 @@ class UserService:
             db.rollback()
             raise BadRequestException("UPDATE_FAILED", f"Failed to update profile: {str(e)}")
 
+        invalidate_user(user_id)
         return user
 
     @staticmethod
@@ -106,3 +118,4 @@ class UserService:
         # - books_view
         db.delete(user)
         db.commit()
+        invalidate_user(user_id)
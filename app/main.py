@@ -7,8 +7,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.middleware import SlowAPIMiddleware
+from app.core.config import settings
 from app.core.limiter import limiter
 from app.middleware.logging import logging_middleware
+from app.middleware.replica import replica_routing_middleware
 from app.middleware.error_handler import add_error_handlers
 from app.domains.health.router import router as health_router
 from app.domains.auth.router import router as auth_router
@@ -22,6 +24,37 @@ from app.domains.orders.router import router as orders_router
 from app.domains.library.router import router as library_router
 from app.domains.admin.router import router as admin_router
 from app.domains.coupons.router import router as coupons_router
+from app.domains.books.trending import trending_ranking
+from app.domains.books.view_buffer import view_buffer
+from app.domains.reviews.service import ReviewService
+from app.domains.comments.service import CommentService
+from app.core.database import SessionLocal
+from app.core.tasks import PeriodicJob
+from app.core.password_hasher import password_hasher
+
+
+def reconcile_like_counts(db):
+    """리뷰/댓글 좋아요 수 집계 테이블 보정"""
+    return {
+        "reviews": ReviewService.reconcile_like_counts(db),
+        "comments": CommentService.reconcile_like_counts(db)
+    }
+
+
+like_reconcile_job = PeriodicJob(
+    "like-count-reconcile",
+    reconcile_like_counts,
+    SessionLocal,
+    interval=settings.LIKE_RECONCILE_INTERVAL_SECONDS
+)
+
+trending_refresh_job = PeriodicJob(
+    "book-trending-refresh",
+    trending_ranking.refresh,
+    SessionLocal,
+    interval=settings.TRENDING_REFRESH_INTERVAL_SECONDS
+)
+
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -39,6 +72,9 @@ app.add_middleware(SlowAPIMiddleware)
 # 로깅 미드웨어 추가
 app.middleware("http")(logging_middleware)
 
+# 읽기 복제본 라우팅 미들웨어 추가 (쓰기 요청/쓰기 직후 조회는 primary 사용)
+app.middleware("http")(replica_routing_middleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -74,12 +110,24 @@ async def startup_event():
     print("📖 Swagger Docs: http://localhost:8000/docs")
     print("🔧 ReDoc: http://localhost:8000/redoc")
 
+    if settings.VIEW_BUFFER_ENABLED:
+        view_buffer.start()
+
+    like_reconcile_job.start()
+    trending_refresh_job.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     print("👋 Bookstore API Server Shutting Down...")
 
+    # 버퍼에 남은 조회 기록 저장
+    view_buffer.stop()
+    like_reconcile_job.stop()
+    trending_refresh_job.stop()
+    password_hasher.shutdown()
+
 
 @app.get("/", include_in_schema=False)
 async def root():
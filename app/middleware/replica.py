@@ -0,0 +1,34 @@
+import math
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.database import replica_engines, use_primary
+
+# 쓰기 직후 조회를 primary로 고정하는 쿠키 (복제 지연 동안 자신의 변경을 못 보는 문제 방지)
+PRIMARY_STICKY_COOKIE = "db_primary"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+async def replica_routing_middleware(request: Request, call_next):
+    """
+    읽기 복제본 라우팅 기준 설정
+
+    - 쓰기 요청(POST/PUT/PATCH/DELETE)은 요청 전체를 primary로 고정
+    - 쓰기 성공 후 REPLICA_STICKY_SECONDS 동안 같은 클라이언트의 조회도 primary 사용 (쿠키)
+    """
+    is_write = request.method not in SAFE_METHODS
+    if is_write or request.cookies.get(PRIMARY_STICKY_COOKIE):
+        use_primary()
+
+    response = await call_next(request)
+
+    if is_write and replica_engines and response.status_code < 400 and settings.REPLICA_STICKY_SECONDS > 0:
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            "1",
+            max_age=math.ceil(settings.REPLICA_STICKY_SECONDS),
+            httponly=True,
+            samesite="lax"
+        )
+    return response
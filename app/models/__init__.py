@@ -1,8 +1,10 @@
 """Models Package"""
 from app.models.user import User, RefreshToken, UserRole, Gender
-from app.models.book import Book, BookView
+from app.models.book import (
+    Book, BookView, BookViewCount, BookRatingStats, BookTrendingScore, BookTrendingState
+)
 from app.models.review import Review, ReviewLike, ReviewLikeCount
-from app.models.comment import Comment, CommentLike
+from app.models.comment import Comment, CommentLike, CommentLikeCount
 from app.models.cart import Cart
 from app.models.favorite import Favorite
 from app.models.order import Order, OrderItem, OrderStatus
@@ -10,9 +12,9 @@ from app.models.coupon import Coupon, UserCoupon, CouponIssuance, CouponUsageHis
 
 __all__ = [
     "User", "RefreshToken", "UserRole", "Gender",
-    "Book", "BookView",
+    "Book", "BookView", "BookViewCount", "BookRatingStats", "BookTrendingScore", "BookTrendingState",
     "Review", "ReviewLike", "ReviewLikeCount",
-    "Comment", "CommentLike",
+    "Comment", "CommentLike", "CommentLikeCount",
     "Cart", "Favorite",
     "Order", "OrderItem", "OrderStatus",
     "Coupon", "UserCoupon", "CouponIssuance", "CouponUsageHistory", "CouponType",
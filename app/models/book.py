@@ -1,8 +1,8 @@
 """
 Book Models
-도서 및 조회 기록 관련 모델
+도서 및 조회 기록, 평점/인기 점수 집계 관련 모델
 """
-from sqlalchemy import Column, BigInteger, Integer, String, Date, DateTime, ForeignKey, DECIMAL, Text
+from sqlalchemy import Column, BigInteger, Integer, String, Date, DateTime, ForeignKey, DECIMAL, Float, JSON, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -11,6 +11,13 @@ from app.core.database import Base
 class Book(Base):
     """도서 테이블"""
     __tablename__ = "books"
+    __table_args__ = (
+        # 키워드 검색용 전문 검색 인덱스 (MySQL 전용, 한글 검색을 위해 ngram 파서 사용)
+        Index(
+            "ft_books_search", "title", "author", "publisher",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="도서 고유 ID")
     seller_id = Column(
@@ -43,6 +50,9 @@ class Book(Base):
     carts = relationship("Cart", back_populates="book", cascade="all, delete-orphan")
     order_items = relationship("OrderItem", back_populates="book", cascade="all, delete-orphan")
     books_view = relationship("BookView", back_populates="book", cascade="all, delete-orphan")
+    view_count_cache = relationship("BookViewCount", back_populates="book", uselist=False, cascade="all, delete-orphan")
+    rating_stats = relationship("BookRatingStats", back_populates="book", uselist=False, cascade="all, delete-orphan")
+    trending_scores = relationship("BookTrendingScore", back_populates="book", cascade="all, delete-orphan")
 
 
 class BookView(Base):
@@ -69,3 +79,102 @@ class BookView(Base):
     # Relationships
     user = relationship("User", back_populates="books_view")
     book = relationship("Book", back_populates="books_view")
+
+
+class BookViewCount(Base):
+    """도서 조회수 집계 테이블 (조회수 정렬 성능 최적화)"""
+    __tablename__ = "book_view_counts"
+
+    book_id = Column(
+        Integer,
+        ForeignKey("books.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="도서 ID"
+    )
+    view_count = Column(Integer, nullable=False, default=0, index=True, comment="누적 조회수")
+    rolled_up_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="books_view에서 압축(삭제)되어 집계에만 남은 조회수"
+    )
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="마지막 업데이트 일시"
+    )
+
+    # Relationships
+    book = relationship("Book", back_populates="view_count_cache")
+
+
+class BookRatingStats(Base):
+    """도서 평점 집계 테이블 (리뷰 수, 평점 합계, 1~5점 분포, 평균 평점 정렬 성능 최적화)"""
+    __tablename__ = "book_rating_stats"
+
+    book_id = Column(
+        Integer,
+        ForeignKey("books.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="도서 ID"
+    )
+    review_count = Column(Integer, nullable=False, default=0, comment="리뷰 수")
+    rating_sum = Column(Integer, nullable=False, default=0, comment="평점 합계")
+    avg_rating = Column(DECIMAL(3, 2), nullable=False, default=0, index=True, comment="평균 평점 (리뷰가 없으면 0)")
+    rating_1 = Column(Integer, nullable=False, default=0, comment="1점 리뷰 수")
+    rating_2 = Column(Integer, nullable=False, default=0, comment="2점 리뷰 수")
+    rating_3 = Column(Integer, nullable=False, default=0, comment="3점 리뷰 수")
+    rating_4 = Column(Integer, nullable=False, default=0, comment="4점 리뷰 수")
+    rating_5 = Column(Integer, nullable=False, default=0, comment="5점 리뷰 수")
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="마지막 업데이트 일시"
+    )
+
+    # Relationships
+    book = relationship("Book", back_populates="rating_stats")
+
+
+class BookTrendingScore(Base):
+    """도서 인기 점수 테이블 (기간별 시간 감쇠 점수, 인기 도서 조회 성능 최적화)"""
+    __tablename__ = "book_trending_scores"
+    __table_args__ = (
+        Index("ix_book_trending_scores_period_score", "period", "score"),
+    )
+
+    book_id = Column(
+        Integer,
+        ForeignKey("books.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="도서 ID"
+    )
+    period = Column(String(8), primary_key=True, comment="집계 기간 (1h, 24h, 7d: 점수 반감기)")
+    score = Column(
+        Float,
+        nullable=False,
+        default=0,
+        comment="시간 감쇠 점수 (book_trending_state.epoch 기준, Σ 가중치 × 2^((발생 시각 - epoch) / 반감기))"
+    )
+
+    # Relationships
+    book = relationship("Book", back_populates="trending_scores")
+
+
+class BookTrendingState(Base):
+    """도서 인기 점수 갱신 상태 테이블 (단일 행, 이벤트별 마지막 반영 ID와 아직 커밋되지 않았을 수 있는 빈 ID)"""
+    __tablename__ = "book_trending_state"
+
+    id = Column(Integer, primary_key=True, autoincrement=False, comment="상태 ID (항상 1)")
+    last_view_id = Column(Integer, nullable=False, default=0, comment="마지막으로 반영한 books_view ID")
+    last_favorite_id = Column(Integer, nullable=False, default=0, comment="마지막으로 반영한 favorites ID")
+    last_order_item_id = Column(Integer, nullable=False, default=0, comment="마지막으로 반영한 order_items ID")
+    pending_view_ids = Column(JSON, nullable=False, default=list, comment="재확인할 books_view 빈 ID ([ID, 처음 발견 일시])")
+    pending_favorite_ids = Column(JSON, nullable=False, default=list, comment="재확인할 favorites 빈 ID ([ID, 처음 발견 일시])")
+    pending_order_item_ids = Column(JSON, nullable=False, default=list, comment="재확인할 order_items 빈 ID ([ID, 처음 발견 일시])")
+    epoch = Column(DateTime, nullable=False, comment="점수 기준 시각 (float 범위 유지를 위해 주기적으로 이동)")
+    refreshed_at = Column(DateTime, nullable=False, comment="마지막 갱신 일시")
@@ -1,6 +1,6 @@
 """
 Comment Models
-댓글 및 댓글 좋아요 관련 모델
+댓글, 댓글 좋아요, 댓글 좋아요 캐시 관련 모델
 """
 from sqlalchemy import Column, BigInteger, Integer, Text, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.sql import func
@@ -47,6 +47,7 @@ class Comment(Base):
     review = relationship("Review", back_populates="comments")
     user = relationship("User", back_populates="comments")
     likes = relationship("CommentLike", back_populates="comment", cascade="all, delete-orphan")
+    like_count_cache = relationship("CommentLikeCount", back_populates="comment", uselist=False, cascade="all, delete-orphan")
 
     # Self-referential relationship for nested comments
     parent = relationship("Comment", remote_side=[id], backref="replies")
@@ -79,3 +80,26 @@ class CommentLike(Base):
     # Relationships
     comment = relationship("Comment", back_populates="likes")
     user = relationship("User", back_populates="comment_likes")
+
+
+class CommentLikeCount(Base):
+    """댓글 좋아요 수 캐시 테이블"""
+    __tablename__ = "comment_like_counts"
+
+    comment_id = Column(
+        Integer,
+        ForeignKey("comments.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="댓글 ID"
+    )
+    like_count = Column(Integer, nullable=False, default=0, comment="좋아요 수 캐시")
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="마지막 업데이트 일시"
+    )
+
+    # Relationships
+    comment = relationship("Comment", back_populates="like_count_cache")
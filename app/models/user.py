@@ -39,6 +39,13 @@ class User(Base):
     birth_date = Column(Date, nullable=False, comment="생년월일")
     gender = Column(Enum(Gender), nullable=False, comment="성별")
     address = Column(String(255), nullable=True, comment="주소")
+    token_version = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="토큰 버전 (역할 변경 시 증가, 이전 버전의 액세스 토큰 무효화)"
+    )
     created_at = Column(DateTime, nullable=False, server_default=func.now(), comment="생성일시")
     updated_at = Column(
         DateTime,
@@ -0,0 +1,37 @@
+"""
+Book Rating Stats Rebuild Script
+도서 평점 집계 테이블을 리뷰 테이블 기준으로 재계산하는 스크립트
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.domains.books.rating_stats import rebuild_rating_stats
+
+
+def main():
+    """메인 실행 함수"""
+    print("=" * 60)
+    print("⭐ Book Rating Stats Rebuild")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        result = rebuild_rating_stats(db)
+        db.commit()
+        print(f"🔁 Books rebuilt: {result['rebuilt']}")
+        print("✅ Rebuild completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
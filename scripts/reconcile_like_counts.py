@@ -0,0 +1,39 @@
+"""
+Like Count Reconciliation Script
+리뷰/댓글 좋아요 수 집계 테이블을 좋아요 테이블 기준으로 보정하는 스크립트
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.domains.reviews.service import ReviewService
+from app.domains.comments.service import CommentService
+
+
+def main():
+    """메인 실행 함수"""
+    print("=" * 60)
+    print("👍 Like Count Reconciliation")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        for label, service in (("Review", ReviewService), ("Comment", CommentService)):
+            result = service.reconcile_like_counts(db)
+            print(f"🆕 {label} counter rows created: {result['created']}")
+            print(f"🔁 {label} counters repaired: {result['repaired']}")
+        print("✅ Reconciliation completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
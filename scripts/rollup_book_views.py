@@ -0,0 +1,46 @@
+"""
+Book View Rollup Script
+오래된 도서 조회 기록(books_view)을 조회수 집계 테이블로 압축하는 스크립트
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.domains.books.view_counts import rollup_book_views
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="Roll up old book view records into book_view_counts")
+    parser.add_argument("--days", type=int, default=30, help="보존할 원본 조회 기록 기간 (일, 기본 30)")
+    parser.add_argument("--rebuild", action="store_true", help="누적 조회수를 집계 + 원본 기록 기준으로 재계산")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📚 Book View Rollup")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        result = rollup_book_views(db, older_than_days=args.days, rebuild=args.rebuild)
+
+        print(f"🆕 Counter rows created: {result['created']}")
+        print(f"🗜️  View records compacted (older than {args.days} days): {result['compacted']}")
+        if args.rebuild:
+            print(f"🔁 Counters rebuilt: {result['rebuilt']}")
+        print("✅ Rollup completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
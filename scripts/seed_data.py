@@ -16,14 +16,15 @@ import random
 
 from app.core.database import SessionLocal, engine
 from app.models.user import User, UserRole, Gender, RefreshToken
-from app.models.book import Book, BookView
+from app.models.book import Book, BookView, BookViewCount, BookRatingStats, BookTrendingScore, BookTrendingState
 from app.models.review import Review, ReviewLike, ReviewLikeCount
-from app.models.comment import Comment, CommentLike
+from app.models.comment import Comment, CommentLike, CommentLikeCount
 from app.models.favorite import Favorite
 from app.models.cart import Cart
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.coupon import Coupon, UserCoupon, CouponIssuance, CouponUsageHistory, CouponType
 from app.core.security import hash_password
+from app.domains.books.rating_stats import rebuild_rating_stats
 
 
 def clear_all_data(db: Session):
@@ -32,11 +33,16 @@ def clear_all_data(db: Session):
 
     # 순서 중요 (외래키 제약조건 고려)
     db.query(CommentLike).delete()
+    db.query(CommentLikeCount).delete()
     db.query(ReviewLike).delete()
     db.query(ReviewLikeCount).delete()
     db.query(Comment).delete()
     db.query(Review).delete()
     db.query(BookView).delete()
+    db.query(BookViewCount).delete()
+    db.query(BookRatingStats).delete()
+    db.query(BookTrendingScore).delete()
+    db.query(BookTrendingState).delete()
     db.query(Favorite).delete()
     db.query(Cart).delete()
     db.query(OrderItem).delete()
@@ -184,6 +190,10 @@ def create_books(db: Session, sellers: list[User]):
         books.append(book)
 
     db.add_all(books)
+    db.flush()
+
+    # 조회수 집계 행 생성
+    db.add_all([BookViewCount(book_id=book.id, view_count=0, rolled_up_count=0) for book in books])
     db.commit()
 
     print(f"✅ Created {len(books)} books")
@@ -411,6 +421,8 @@ def create_reviews(db: Session, customers: list[User], books: list[Book], orders
         reviews.append(review)
 
     db.add_all(review_counts)
+    # 도서 평점 집계 생성
+    rebuild_rating_stats(db)
     db.commit()
 
     print(f"✅ Created {len(reviews)} reviews")
@@ -488,6 +500,10 @@ def create_comments(db: Session, customers: list[User], reviews: list[Review]):
         comments.append(comment)
 
     db.add_all(comments)
+    db.flush()
+
+    # 댓글 좋아요 카운트 초기화
+    db.add_all([CommentLikeCount(comment_id=comment.id, like_count=0) for comment in comments])
     db.commit()
 
     print(f"✅ Created {len(comments)} comments")
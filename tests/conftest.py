@@ -2,23 +2,31 @@
 Pytest Configuration and Fixtures
 테스트용 데이터베이스 및 클라이언트 설정
 """
+import os
+
+# 백그라운드 작업(조회 기록 버퍼, 좋아요 수 보정, 인기 점수 갱신)은 테스트 DB가 아닌 설정된 DB에 기록하므로
+# 테스트 클라이언트 시작 시 실행되지 않도록 앱 설정 로드 전에 비활성화
+os.environ.setdefault("VIEW_BUFFER_ENABLED", "False")
+os.environ.setdefault("LIKE_RECONCILE_INTERVAL_SECONDS", "0")
+os.environ.setdefault("TRENDING_REFRESH_INTERVAL_SECONDS", "0")
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
 from fastapi.testclient import TestClient
-from app.core.database import Base
+from app.core.database import Base, get_async_database_url
 from app.core.dependencies import get_db
-
-# 테스트용 데이터베이스 경로
-TEST_DATABASE_URL = "sqlite:///:memory:"
+from app.core.database import get_async_db, get_read_db
 
 
 @pytest.fixture(scope="function")
-def test_db():
+def test_db(tmp_path):
     """각 테스트마다 새로운 데이터베이스 생성"""
-    # 테스트 엔진 생성
+    # 테스트 엔진 생성 (테스트 클라이언트의 비동기 세션이 같은 DB를 사용하도록 임시 파일 DB 사용)
     engine = create_engine(
-        TEST_DATABASE_URL,
+        f"sqlite:///{tmp_path / 'test.db'}",
         connect_args={"check_same_thread": False}
     )
 
@@ -36,11 +44,71 @@ def test_db():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+async def async_db():
+    """비동기 세션용 테스트 데이터베이스 (aiosqlite)"""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    TestingAsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def query_counter(test_db):
+    """테스트 세션에서 실행된 SQL 문 수 측정"""
+    class QueryCounter:
+        def __init__(self):
+            self.count = 0
+
+        def reset(self):
+            self.count = 0
+
+    counter = QueryCounter()
+    engine = test_db.get_bind()
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        counter.count += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+
+@pytest.fixture
+def tamper_cursor():
+    """커서의 정렬 키 값을 디코딩할 수 없는 값으로 바꾸는 함수 (클라이언트의 커서 변조)"""
+    import base64
+    import json
+
+    def _tamper(cursor: str) -> str:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        payload["v"] = ["datetime", "not-a-date"]
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    return _tamper
+
 
 @pytest.fixture(scope="function")
 def client(test_db):
     """FastAPI 테스트 클라이언트"""
     from app.main import app
+    from app.core.auth_cache import principal_cache, token_cache, token_version_cache
+    from app.core.response_cache import response_cache
+
+    # 테스트마다 DB가 새로 생성되어 사용자/도서 ID가 재사용되므로 인증 캐시 및 응답 캐시 초기화
+    principal_cache.clear()
+    token_cache.clear()
+    token_version_cache.clear()
+    response_cache.clear()
 
     def override_get_db():
         try:
@@ -48,7 +116,20 @@ def client(test_db):
         finally:
             pass
 
+    # async def 엔드포인트용 비동기 세션도 같은 테스트 DB에 연결 (요청마다 연결을 닫도록 NullPool 사용)
+    async_engine = create_async_engine(
+        get_async_database_url(test_db.get_bind().url.render_as_string(hide_password=False)),
+        poolclass=NullPool
+    )
+    TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
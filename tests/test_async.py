@@ -0,0 +1,197 @@
+"""
+Async Session Tests
+비동기 세션(AsyncSession) 조회 서비스 테스트
+"""
+import pytest
+from datetime import date
+from decimal import Decimal
+
+
+async def _seed(db):
+    from app.models import Book, Gender, User
+    from app.models.review import Review, ReviewLike, ReviewLikeCount
+    from app.models.comment import Comment, CommentLikeCount
+
+    user = User(
+        email="async@test.com",
+        password="hashed",
+        name="Async User",
+        birth_date=date(1990, 1, 1),
+        gender=Gender.MALE
+    )
+    db.add(user)
+    await db.flush()
+
+    books = [
+        Book(
+            seller_id=user.id,
+            title=f"Async Book {i}",
+            author="Async Author",
+            publisher="Async Publisher",
+            isbn=f"97800000003{i:02d}",
+            price=Decimal("15000"),
+            publication_date=date(2024, 1, 1)
+        )
+        for i in range(3)
+    ]
+    db.add_all(books)
+    await db.flush()
+
+    review = Review(user_id=user.id, book_id=books[0].id, order_id=1, rating=4, comment="Async review")
+    db.add(review)
+    await db.flush()
+    db.add_all([ReviewLike(review_id=review.id, user_id=user.id), ReviewLikeCount(review_id=review.id, like_count=1)])
+
+    parent = Comment(review_id=review.id, user_id=user.id, content="parent")
+    db.add(parent)
+    await db.flush()
+    child = Comment(review_id=review.id, user_id=user.id, parent_comment_id=parent.id, content="child")
+    db.add(child)
+    await db.flush()
+    db.add_all([CommentLikeCount(comment_id=parent.id, like_count=0), CommentLikeCount(comment_id=child.id, like_count=0)])
+
+    await db.commit()
+    return user.id, [book.id for book in books], review.id, parent.id
+
+
+class TestAsyncServices:
+    """비동기 조회 서비스 테스트"""
+
+    async def test_books(self, async_db):
+        """도서 목록/상세 비동기 조회 테스트"""
+        from app.domains.books import schemas, service
+        from app.core.exceptions import BookNotFoundException
+
+        user_id, book_ids, _, _ = await _seed(async_db)
+
+        result = await service.list_books_async(async_db, schemas.BookSearchParams(size=2, sort="title", order="asc"))
+        assert result.total_elements == 3
+        assert [book.title for book in result.content] == ["Async Book 0", "Async Book 1"]
+        assert result.has_next is True
+
+        book = await service.get_book_async(async_db, book_ids[0], user_id)
+        assert book.title == "Async Book 0"
+        assert book.view_count == 1
+
+        with pytest.raises(BookNotFoundException):
+            await service.get_book_async(async_db, 99999)
+
+    async def test_reviews_and_comments(self, async_db):
+        """리뷰/댓글 비동기 조회 결과가 동기 조회와 같은 형태인지 테스트"""
+        from app.domains.reviews.service import ReviewService
+        from app.domains.comments.service import CommentService
+
+        user_id, book_ids, review_id, parent_id = await _seed(async_db)
+
+        reviews, total, next_cursor = await ReviewService.get_reviews_async(
+            async_db, current_user_id=user_id, book_id=book_ids[0]
+        )
+        assert total == 1 and next_cursor is None
+        assert reviews[0].user_name == "Async User"
+        assert reviews[0].like_count == 1 and reviews[0].is_liked is True
+
+        review = await ReviewService.get_review_async(async_db, review_id, None)
+        assert review.is_liked is False
+
+        comments, total, _ = await CommentService.get_comments_async(async_db, user_id, review_id=review_id)
+        assert total == 2
+
+        roots, total = await CommentService.get_comment_tree_async(async_db, review_id, user_id)
+        assert total == 2
+        assert [root.id for root in roots] == [parent_id]
+        assert [child.content for child in roots[0].children] == ["child"]
+
+        comment = await CommentService.get_comment_async(async_db, parent_id, user_id)
+        assert comment.content == "parent"
+
+    async def test_library(self, async_db):
+        """보유 도서 비동기 조회 테스트 (구매 내역 없음)"""
+        from app.domains.library.service import LibraryService
+
+        user_id, _, _, _ = await _seed(async_db)
+
+        books, total, next_cursor = await LibraryService.get_purchased_books_async(async_db, user_id)
+        assert books == [] and total == 0 and next_cursor is None
+
+
+class TestAsyncRoutes:
+    """비동기 조회 엔드포인트 테스트 (테스트 클라이언트의 비동기 세션이 테스트 DB를 사용하는지 확인)"""
+
+    @staticmethod
+    def _seed(test_db):
+        from app.models import Book, Gender, User
+        from app.models.review import Review, ReviewLikeCount
+        from app.models.comment import Comment, CommentLikeCount
+
+        user = User(
+            email="async-route@test.com",
+            password="hashed",
+            name="Async Route User",
+            birth_date=date(1990, 1, 1),
+            gender=Gender.MALE
+        )
+        test_db.add(user)
+        test_db.flush()
+
+        books = [
+            Book(
+                seller_id=user.id,
+                title=f"Async Route Book {i}",
+                author="Async Author",
+                publisher="Async Publisher",
+                isbn=f"97800000004{i:02d}",
+                price=Decimal("15000"),
+                publication_date=date(2024, 1, 1)
+            )
+            for i in range(3)
+        ]
+        test_db.add_all(books)
+        test_db.flush()
+
+        review = Review(user_id=user.id, book_id=books[0].id, order_id=1, rating=4, comment="Async route review")
+        test_db.add(review)
+        test_db.flush()
+        test_db.add(ReviewLikeCount(review_id=review.id, like_count=0))
+
+        comment = Comment(review_id=review.id, user_id=user.id, content="route comment")
+        test_db.add(comment)
+        test_db.flush()
+        test_db.add(CommentLikeCount(comment_id=comment.id, like_count=0))
+
+        test_db.commit()
+        return [book.id for book in books], review.id
+
+    def test_books(self, client, test_db):
+        book_ids, _ = self._seed(test_db)
+
+        response = client.get("/api/books", params={"size": 2, "sort": "title,asc"})
+        assert response.status_code == 200
+        payload = response.json()["payload"]
+        assert [book["title"] for book in payload["content"]] == ["Async Route Book 0", "Async Route Book 1"]
+        assert payload["hasNext"] is True
+
+        response = client.get(f"/api/books/{book_ids[2]}")
+        assert response.status_code == 200
+        assert response.json()["payload"]["title"] == "Async Route Book 2"
+
+        assert client.get("/api/books/99999").status_code == 404
+
+    def test_reviews_and_comments(self, client, test_db):
+        book_ids, review_id = self._seed(test_db)
+
+        response = client.get("/api/reviews", params={"book_id": book_ids[0]})
+        assert response.status_code == 200
+        assert [review["id"] for review in response.json()["payload"]["content"]] == [review_id]
+        assert client.get(f"/api/reviews/{review_id}").status_code == 200
+
+        response = client.get("/api/comments", params={"review_id": review_id})
+        assert response.status_code == 200
+        assert [comment["content"] for comment in response.json()["payload"]["content"]] == ["route comment"]
+
+        response = client.get("/api/comments/tree", params={"review_id": review_id})
+        assert response.status_code == 200
+
+    def test_library(self, client, customer_token):
+        response = client.get("/api/library", headers={"Authorization": f"Bearer {customer_token}"})
+        assert response.status_code == 200
+        assert response.json()["payload"]["content"] == []
@@ -243,3 +243,299 @@ class TestLogout:
         })
 
         assert response.status_code == 401
+
+
+class TestPasswordHashing:
+    """비밀번호 해싱 프로세스 풀 및 재해싱 테스트"""
+
+    async def test_login_rehashes_on_cost_change(self, async_db, monkeypatch):
+        """BCRYPT_ROUNDS 변경 후 로그인 시 새 cost로 재해싱"""
+        import bcrypt
+        from app.core.config import settings
+        from app.core.security import needs_rehash
+        from app.domains.auth import schemas, service
+        from app.models import User, UserRole, Gender
+
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+        user = User(
+            email="rehash@test.com",
+            password=bcrypt.hashpw(b"password123!", bcrypt.gensalt(rounds=5)).decode(),
+            name="Rehash User",
+            birth_date=date(1990, 1, 1),
+            gender=Gender.MALE,
+            role=UserRole.CUSTOMER
+        )
+        async_db.add(user)
+        await async_db.commit()
+
+        await service.login(async_db, schemas.LoginRequest(email="rehash@test.com", password="password123!"))
+        await async_db.refresh(user)
+        rehashed = user.password
+        assert rehashed.startswith("$2b$04$")
+        assert bcrypt.checkpw(b"password123!", rehashed.encode())
+        assert needs_rehash(rehashed) is False
+
+    def test_hasher_fails_fast_when_saturated(self):
+        """대기열이 가득 차면 대기하지 않고 503"""
+        from app.core.exceptions import ServiceUnavailableException
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_pending=1, timeout=10.0)
+        try:
+            hashed = hasher.hash(b"password123!", 4)
+            assert hasher.verify(b"password123!", hashed.encode()) is True
+            assert hasher.verify(b"wrong", hashed.encode()) is False
+
+            # 처리 중인 작업이 한도에 도달한 상태
+            hasher._slots.acquire()
+            with pytest.raises(ServiceUnavailableException) as exc:
+                hasher.hash(b"password123!", 4)
+            assert exc.value.status_code == 503
+            assert hasher.rejected_count == 1
+            hasher._slots.release()
+
+            assert hasher.verify(b"password123!", hashed.encode()) is True
+        finally:
+            hasher.shutdown()
+
+
+    def test_hasher_timeout_keeps_slot_until_done(self):
+        """타임아웃 후에도 워커에서 실행 중인 작업은 끝날 때까지 슬롯을 차지"""
+        import time
+        from app.core.exceptions import ServiceUnavailableException
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_pending=1, timeout=0.01)
+        try:
+            with pytest.raises(ServiceUnavailableException) as exc:
+                hasher.hash(b"password123!", 12)
+            assert exc.value.details["reason"] == "password hashing timed out"
+
+            with pytest.raises(ServiceUnavailableException) as exc:
+                hasher.hash(b"password123!", 4)
+            assert exc.value.details["reason"] == "password hashing queue is full"
+
+            # 작업이 끝나면 슬롯 반환
+            deadline = time.monotonic() + 30
+            while not hasher._slots.acquire(blocking=False):
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+            hasher._slots.release()
+        finally:
+            hasher.shutdown()
+
+
+    async def test_hasher_async_timeout_keeps_slot_until_done(self):
+        """async 호출은 이벤트 루프에서 결과를 기다리고, 타임아웃 후에도 작업이 끝날 때까지 슬롯을 차지"""
+        import asyncio
+        import time
+        from app.core.exceptions import ServiceUnavailableException
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_pending=1, timeout=10.0)
+        try:
+            # 워커는 fork가 아닌 방식으로 시작 (다중 스레드 서버 프로세스에서 잠금 상태 상속 방지)
+            assert hasher._get_executor()._mp_context.get_start_method() in ("forkserver", "spawn")
+
+            hashed = await hasher.hash_async(b"password123!", 4)
+            assert await hasher.verify_async(b"password123!", hashed.encode()) is True
+
+            hasher.timeout = 0.01
+            with pytest.raises(ServiceUnavailableException) as exc:
+                await hasher.hash_async(b"password123!", 12)
+            assert exc.value.details["reason"] == "password hashing timed out"
+
+            with pytest.raises(ServiceUnavailableException) as exc:
+                await hasher.verify_async(b"password123!", hashed.encode())
+            assert exc.value.details["reason"] == "password hashing queue is full"
+
+            deadline = time.monotonic() + 30
+            while not hasher._slots.acquire(blocking=False):
+                assert time.monotonic() < deadline
+                await asyncio.sleep(0.05)
+            hasher._slots.release()
+        finally:
+            hasher.shutdown()
+
+
+class TestAuthCache:
+    """토큰/Principal 캐시 테스트"""
+
+    def test_current_user_cached_and_invalidated(self, test_db, query_counter):
+        """반복 인증은 DB 조회 없이 처리되고, 사용자 변경 시 캐시가 무효화되는지 테스트"""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core.auth_cache import principal_cache, token_cache, token_version_cache
+        from app.core.dependencies import get_current_user
+        from app.core.exceptions import UnauthorizedException, UserNotFoundException
+        from app.core.security import create_access_token, create_refresh_token
+        from app.domains.admin.schemas import RoleUpdateRequest
+        from app.domains.admin.service import AdminService
+        from app.domains.users.schemas import UserUpdateRequest
+        from app.domains.users.service import UserService
+        from app.models import User, UserRole, Gender
+
+        principal_cache.clear()
+        token_cache.clear()
+        token_version_cache.clear()
+        user = User(
+            email="cached@test.com",
+            password="hashed",
+            name="Cached User",
+            birth_date=date(1990, 1, 1),
+            gender=Gender.MALE,
+            role=UserRole.CUSTOMER
+        )
+        test_db.add(user)
+        test_db.commit()
+        user_id = user.id
+
+        token = create_access_token({"user_id": user_id, "email": "cached@test.com", "role": "CUSTOMER"})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        query_counter.reset()
+        principal = get_current_user(credentials, test_db)
+        assert query_counter.count == 1
+        assert (principal.id, principal.role, principal.name) == (user_id, UserRole.CUSTOMER, "Cached User")
+
+        query_counter.reset()
+        assert get_current_user(credentials, test_db) is principal
+        assert query_counter.count == 0
+
+        UserService.update_profile(test_db, user_id, UserUpdateRequest(name="Renamed User"))
+        assert get_current_user(credentials, test_db).name == "Renamed User"
+
+        # 역할 변경 시 이전 토큰은 폐기되고, 새 토큰에는 변경된 역할이 반영
+        AdminService.update_user_role(test_db, user_id, RoleUpdateRequest(role=UserRole.SELLER))
+        with pytest.raises(UnauthorizedException) as exc:
+            get_current_user(credentials, test_db)
+        assert exc.value.error_code == "TOKEN_REVOKED"
+
+        token = create_access_token({"user_id": user_id, "email": "cached@test.com", "role": "SELLER", "tv": 1})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        assert get_current_user(credentials, test_db).role == UserRole.SELLER
+
+        # 리프레시 토큰은 캐시 여부와 관계없이 거부
+        refresh = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_refresh_token({"user_id": user_id}))
+        with pytest.raises(UnauthorizedException):
+            get_current_user(refresh, test_db)
+
+        UserService.delete_account(test_db, user_id)
+        with pytest.raises(UserNotFoundException):
+            get_current_user(credentials, test_db)
+
+    def test_claims_principal(self, test_db, query_counter):
+        """claim 기반 Principal: 사용자 행 조회 없이 권한 검사, 토큰 버전으로 폐기"""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core.auth_cache import principal_cache, token_cache, token_version_cache
+        from app.core.dependencies import get_current_principal, require_seller
+        from app.core.exceptions import InsufficientPermissionsException, UnauthorizedException
+        from app.core.security import create_access_token
+        from app.domains.admin.schemas import RoleUpdateRequest
+        from app.domains.admin.service import AdminService
+        from app.domains.auth.service import build_access_claims
+        from app.models import User, UserRole, Gender
+
+        principal_cache.clear()
+        token_cache.clear()
+        token_version_cache.clear()
+        user = User(
+            email="claims@test.com",
+            password="hashed",
+            name="Claims User",
+            birth_date=date(1990, 1, 1),
+            gender=Gender.FEMALE,
+            role=UserRole.CUSTOMER
+        )
+        test_db.add(user)
+        test_db.commit()
+        user_id = user.id
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=create_access_token(build_access_claims(user))
+        )
+
+        query_counter.reset()
+        principal = get_current_principal(credentials, test_db)
+        assert query_counter.count == 1  # 토큰 버전만 조회
+        assert not hasattr(principal, "__dict__")
+        assert (principal.id, principal.role, principal.name, principal.token_version) == (
+            user_id, UserRole.CUSTOMER, "Claims User", 0
+        )
+
+        query_counter.reset()
+        principal = get_current_principal(credentials, test_db)
+        assert query_counter.count == 0
+        with pytest.raises(InsufficientPermissionsException):
+            require_seller(principal)
+
+        AdminService.update_user_role(test_db, user_id, RoleUpdateRequest(role=UserRole.SELLER))
+        with pytest.raises(UnauthorizedException) as exc:
+            get_current_principal(credentials, test_db)
+        assert exc.value.error_code == "TOKEN_REVOKED"
+
+        test_db.refresh(user)
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=create_access_token(build_access_claims(user))
+        )
+        assert require_seller(get_current_principal(credentials, test_db)).role == UserRole.SELLER
+
+    def test_revocation_across_workers(self, test_db, monkeypatch):
+        """다른 워커의 역할 변경: 공유 토큰 버전 캐시는 즉시, 프로세스별 캐시는 TTL 이내에 폐기 반영"""
+        import time
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core import auth_cache
+        from app.core.cache import TTLCache
+        from app.core.dependencies import get_current_principal, get_current_user
+        from app.core.exceptions import UnauthorizedException
+        from app.core.security import create_access_token
+        from app.models import User, UserRole, Gender
+        from tests.test_limiter import FakeRedis
+
+        auth_cache.principal_cache.clear()
+        auth_cache.token_cache.clear()
+        user = User(
+            email="workers@test.com",
+            password="hashed",
+            name="Workers User",
+            birth_date=date(1990, 1, 1),
+            gender=Gender.MALE,
+            role=UserRole.CUSTOMER
+        )
+        test_db.add(user)
+        test_db.commit()
+
+        def credentials(role, tv):
+            token = create_access_token({"user_id": user.id, "email": user.email, "role": role, "name": user.name, "tv": tv})
+            return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        def change_role_on_other_worker(role):
+            # 다른 워커의 AdminService.update_user_role: DB 갱신 후 그 워커의 invalidate_user (공유 캐시만 이 프로세스에 영향)
+            user.role = role
+            user.token_version += 1
+            test_db.commit()
+            if isinstance(auth_cache.token_version_cache, auth_cache.RedisTokenVersionCache):
+                auth_cache.token_version_cache.delete(user.id)
+
+        old = credentials("CUSTOMER", 0)
+
+        # 공유(Redis) 토큰 버전 캐시: 이 프로세스의 Principal 캐시가 남아 있어도 즉시 폐기
+        monkeypatch.setattr(auth_cache, "token_version_cache", auth_cache.RedisTokenVersionCache(ttl=60, client=FakeRedis()))
+        assert get_current_user(old, test_db).role == UserRole.CUSTOMER
+        assert get_current_principal(old, test_db).role == UserRole.CUSTOMER
+
+        change_role_on_other_worker(UserRole.SELLER)
+        for dependency in (get_current_user, get_current_principal):
+            with pytest.raises(UnauthorizedException) as exc:
+                dependency(old, test_db)
+            assert exc.value.error_code == "TOKEN_REVOKED"
+        assert get_current_user(credentials("SELLER", 1), test_db).role == UserRole.SELLER
+
+        # 프로세스별 캐시: AUTH_TOKEN_VERSION_TTL_SECONDS가 지나면 폐기 반영
+        monkeypatch.setattr(auth_cache, "token_version_cache", TTLCache(ttl=0.05))
+        current = credentials("SELLER", 1)
+        assert get_current_principal(current, test_db).role == UserRole.SELLER
+
+        change_role_on_other_worker(UserRole.CUSTOMER)
+        assert get_current_principal(current, test_db).role == UserRole.SELLER
+        time.sleep(0.1)
+        with pytest.raises(UnauthorizedException):
+            get_current_principal(current, test_db)
@@ -73,6 +73,15 @@ class TestBooks:
         assert payload["title"] == "Test Book"
         assert payload["author"] == "Test Author"
 
+    def test_background_jobs_disabled(self, client):
+        """테스트 클라이언트 시작 시 설정된 DB에 기록하는 백그라운드 작업이 실행되지 않는지 테스트"""
+        from app.main import like_reconcile_job, trending_refresh_job
+        from app.domains.books.view_buffer import view_buffer
+
+        assert view_buffer.is_running is False
+        assert like_reconcile_job.is_running is False
+        assert trending_refresh_job.is_running is False
+
     def test_get_book_not_found(self, client):
         """존재하지 않는 도서 조회 실패 테스트"""
         response = client.get("/api/books/99999")
@@ -200,3 +209,570 @@ class TestBooks:
         # 삭제된 도서 조회 시 404
         response = client.get(f"/api/books/{book.id}")
         assert response.status_code == 404
+
+
+class TestBookService:
+    """도서 서비스 테스트"""
+
+    @staticmethod
+    def _create_books(test_db, count, start=0):
+        from app.models import Book, BookViewCount
+        from datetime import date
+
+        books = [
+            Book(
+                seller_id=1,
+                title=f"Service Book {i}",
+                author="Service Author",
+                publisher="Service Publisher",
+                isbn=f"97800000001{start + i:02d}",
+                price=Decimal("10000"),
+                publication_date=date(2024, 1, 1)
+            )
+            for i in range(count)
+        ]
+        test_db.add_all(books)
+        test_db.flush()
+        test_db.add_all([BookViewCount(book_id=book.id, view_count=0, rolled_up_count=0) for book in books])
+        test_db.commit()
+        return books
+
+    def test_list_books_view_counts_single_query(self, test_db, query_counter):
+        """도서 목록 조회수 일괄 조회 테스트 (페이지 크기와 무관한 쿼리 수)"""
+        from app.models import BookView
+        from app.domains.books import service, schemas
+        from app.domains.books.view_counts import increment_view_counts
+
+        books = self._create_books(test_db, 20)
+        view_book_ids = [books[0].id] * 3 + [books[1].id]
+        test_db.add_all([BookView(book_id=book_id) for book_id in view_book_ids])
+        increment_view_counts(test_db, view_book_ids)
+        test_db.commit()
+
+        query_counter.reset()
+        result = service.list_books(
+            test_db, schemas.BookSearchParams(size=20, sort="view_count", order="desc")
+        )
+
+        assert query_counter.count == 2  # count + page(조회수 포함)
+        assert len(result.content) == 20
+        assert result.content[0].id == books[0].id
+        assert result.content[0].view_count == 3
+        assert result.content[1].view_count == 1
+        assert result.content[-1].view_count == 0
+
+    def test_view_count_sort_repaired_counters(self, test_db):
+        """누락된 조회수 집계 행을 ensure_view_counts로 채운 뒤 조회수 정렬 목록/전체 개수/커서 페이지 테스트"""
+        from app.models import BookViewCount
+        from app.domains.books import service, schemas
+        from app.domains.books.view_counts import ensure_view_counts
+
+        books = self._create_books(test_db, 5)
+        test_db.query(BookViewCount).filter(BookViewCount.book_id.in_([books[1].id, books[3].id])).delete()
+        test_db.query(BookViewCount).filter(BookViewCount.book_id == books[4].id).update({"view_count": 2})
+        test_db.commit()
+
+        # 조회수 정렬은 집계 행과 내부 조인 (모든 도서에 집계 행이 있다는 전제)
+        assert service.list_books(
+            test_db, schemas.BookSearchParams(size=10, sort="view_count", order="desc")
+        ).total_elements == 3
+        assert ensure_view_counts(test_db) == 2
+        test_db.commit()
+
+        result = service.list_books(test_db, schemas.BookSearchParams(size=10, sort="view_count", order="desc"))
+        assert result.total_elements == 5
+        assert [b.id for b in result.content] == [books[4].id] + [book.id for book in reversed(books[:4])]
+        assert [b.view_count for b in result.content] == [2, 0, 0, 0, 0]
+
+        for order in ("desc", "asc"):
+            expected = [
+                b.id for b in service.list_books(
+                    test_db, schemas.BookSearchParams(size=10, sort="view_count", order=order)
+                ).content
+            ]
+            seen, cursor = [], None
+            while True:
+                page = service.list_books(
+                    test_db, schemas.BookSearchParams(size=2, cursor=cursor, sort="view_count", order=order)
+                )
+                seen.extend(b.id for b in page.content)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+            assert seen == expected
+
+    def test_get_book_view_count(self, test_db):
+        """도서 상세 조회 시 조회수 증가 테스트"""
+        from app.domains.books import service
+
+        book = self._create_books(test_db, 1)[0]
+
+        assert service.get_book(test_db, book.id).view_count == 1
+        assert service.get_book(test_db, book.id).view_count == 2
+
+    def test_view_buffer_flush_and_drop(self, test_db):
+        """조회 기록 버퍼 일괄 기록 및 용량 초과 테스트"""
+        from sqlalchemy import event, func
+        from sqlalchemy.orm import sessionmaker
+        from app.models import BookView, BookViewCount
+        from app.domains.books.view_buffer import BookViewBuffer
+
+        books = self._create_books(test_db, 2)
+        buffer = BookViewBuffer(sessionmaker(bind=test_db.get_bind()), max_pending=3)
+
+        assert buffer.record(books[0].id) is True
+        assert buffer.record(books[0].id, user_id=None) is True
+        assert buffer.record(books[1].id) is True
+        assert buffer.record(books[1].id) is False
+        assert buffer.pending_count(books[0].id) == 2
+        assert buffer.dropped_count == 1
+
+        assert buffer.flush() == 3
+        assert buffer.pending_count(books[0].id) == 0
+        assert test_db.query(func.count(BookView.id)).scalar() == 3
+
+        # 삭제된 도서의 조회 기록은 버리고 나머지만 기록 (버퍼 세션의 새 연결에 외래 키 검사 적용)
+        engine = test_db.get_bind()
+        event.listen(engine, "connect", lambda conn, _: conn.execute("PRAGMA foreign_keys=ON"))
+        engine.dispose()
+        buffer.record(books[1].id)
+        buffer.record(99999)
+        buffer.stop()
+        assert test_db.query(func.count(BookView.id)).scalar() == 4
+        assert buffer.dropped_count == 2
+
+        # 집계 테이블도 같은 트랜잭션에서 갱신
+        test_db.expire_all()
+        assert test_db.get(BookViewCount, books[0].id).view_count == 2
+        assert test_db.get(BookViewCount, books[1].id).view_count == 2
+
+    def test_rollup_book_views(self, test_db):
+        """오래된 조회 기록 압축 및 집계 재계산 테스트"""
+        from datetime import datetime, timedelta
+        from sqlalchemy import func
+        from app.models import BookView, BookViewCount
+        from app.domains.books import service
+        from app.domains.books.view_counts import rollup_book_views
+
+        books = self._create_books(test_db, 2)
+        old = datetime.utcnow() - timedelta(days=40)
+        test_db.add_all([BookView(book_id=books[0].id, viewed_at=old) for _ in range(3)])
+        test_db.add(BookView(book_id=books[0].id))
+        test_db.add(BookView(book_id=books[1].id, viewed_at=old))
+        test_db.commit()
+
+        # 집계 누락 상태에서 재계산
+        result = rollup_book_views(test_db, older_than_days=30, rebuild=True)
+        assert result["compacted"] == 4
+        assert test_db.query(func.count(BookView.id)).scalar() == 1
+
+        test_db.expire_all()
+        counter = test_db.get(BookViewCount, books[0].id)
+        assert counter.rolled_up_count == 3
+        assert counter.view_count == 4
+        assert service.get_book(test_db, books[1].id).view_count == 2
+
+    def test_keyword_search_relevance(self, test_db):
+        """키워드 검색 관련도 정렬 테스트 (LIKE 대체 검색)"""
+        from app.domains.books import service, schemas
+
+        books = self._create_books(test_db, 3)
+        books[0].title, books[0].author = "자바의 정석", "남궁성"
+        books[1].title, books[1].author = "파이썬 입문", "자바 전문가"
+        books[2].title, books[2].author = "데이터베이스", "홍길동"
+        test_db.commit()
+
+        result = service.list_books(
+            test_db, schemas.BookSearchParams(keyword="자바", sort="relevance", order="desc")
+        )
+
+        assert [book.id for book in result.content] == [books[0].id, books[1].id]
+        assert result.total_elements == 2
+
+    def test_inverted_index_search(self, test_db, monkeypatch):
+        """인메모리 역색인 검색 및 생성/수정/삭제 동기화 테스트"""
+        from app.models import UserRole
+        from app.domains.books import service, schemas
+        from app.domains.books.search import InvertedIndexSearchBackend
+
+        backend = InvertedIndexSearchBackend()
+        monkeypatch.setattr(service, "search_backend", backend)
+
+        books = self._create_books(test_db, 2)
+        books[0].title = "채식주의자"
+        books[1].title = "소년이 온다"
+        test_db.commit()
+
+        def search(keyword):
+            result = service.list_books(
+                test_db, schemas.BookSearchParams(keyword=keyword, sort="relevance", order="desc")
+            )
+            return [book.id for book in result.content]
+
+        assert search("식주") == [books[0].id]
+        assert search("년") == [books[1].id]
+        assert search("SERVICE author") == [books[1].id, books[0].id]
+
+        service.update_book(
+            test_db, books[1].id, schemas.BookUpdateRequest(title="채식 레시피"), 1, UserRole.ADMIN.value
+        )
+        assert search("채식") == [books[1].id, books[0].id]
+
+        service.delete_book(test_db, books[0].id, 1, UserRole.ADMIN.value)
+        assert search("채식") == [books[1].id]
+
+    def test_inverted_index_single_build(self, test_db, monkeypatch):
+        """동시 첫 검색 시 색인은 한 번만 구축하고, 재구축 중에는 기존 색인으로 응답하는지 테스트"""
+        import threading
+        import time
+        from app.domains.books.search import InvertedIndexSearchBackend, SearchBackend
+
+        with pytest.raises(TypeError):
+            SearchBackend()
+
+        books = self._create_books(test_db, 2)
+        backend = InvertedIndexSearchBackend(refresh_interval=300.0)
+        builds = []
+        real_build = backend.build
+
+        def slow_build(db):
+            builds.append(threading.current_thread().name)
+            time.sleep(0.1)
+            real_build(db)
+
+        monkeypatch.setattr(backend, "build", slow_build)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(backend.search(test_db, "service book")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(builds) == 1
+        assert results == [{book.id: 3 for book in books}] * 5
+
+        # 재구축 중인 다른 스레드가 있으면 기다리지 않고 기존 색인 사용
+        backend.refresh_interval = 0
+        backend._build_lock.acquire()
+        try:
+            assert backend.search(test_db, "service book") == {book.id: 3 for book in books}
+        finally:
+            backend._build_lock.release()
+        assert len(builds) == 1
+
+    def test_cursor_pagination(self, test_db):
+        """커서 기반 페이지네이션 테스트 (OFFSET 페이지와 동일한 순서, 동일 정렬 키 처리)"""
+        from app.domains.books import service, schemas
+        from app.core.exceptions import BadRequestException
+
+        books = self._create_books(test_db, 7)
+        for i, book in enumerate(books):
+            book.price = Decimal("10000") + (i // 3) * 1000  # 정렬 키 중복
+        test_db.commit()
+
+        expected = [
+            book.id
+            for page in (1, 2, 3)
+            for book in service.list_books(
+                test_db, schemas.BookSearchParams(page=page, size=3, sort="price", order="desc")
+            ).content
+        ]
+
+        seen, cursor = [], None
+        while True:
+            result = service.list_books(
+                test_db, schemas.BookSearchParams(size=3, cursor=cursor, sort="price", order="desc")
+            )
+            seen.extend(book.id for book in result.content)
+            cursor = result.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert sorted(seen) == sorted(book.id for book in books)
+
+        # 정렬 조건이 다른 커서는 거부
+        first = service.list_books(test_db, schemas.BookSearchParams(size=3, sort="price", order="desc"))
+        with pytest.raises(BadRequestException):
+            service.list_books(
+                test_db, schemas.BookSearchParams(size=3, cursor=first.next_cursor, sort="title", order="desc")
+            )
+        with pytest.raises(BadRequestException):
+            service.list_books(test_db, schemas.BookSearchParams(cursor="not-a-cursor"))
+
+    def test_count_modes(self, test_db, query_counter):
+        """전체 개수 조회 방식(exact/estimate/none) 테스트"""
+        from app.domains.books import service, schemas
+        from app.core.pagination import count_cache
+
+        count_cache.clear()
+        self._create_books(test_db, 5)
+
+        query_counter.reset()
+        result = service.list_books(test_db, schemas.BookSearchParams(size=2, count_mode="none"))
+        assert query_counter.count == 1
+        assert result.total_elements is None
+        assert result.total_pages is None
+        assert result.has_next is True
+        assert result.count_mode == "none"
+
+        assert service.list_books(test_db, schemas.BookSearchParams(size=2, count_mode="estimate")).total_elements == 5
+
+        # 캐시된 개수는 TTL 동안 재사용 (COUNT 쿼리 생략)
+        self._create_books(test_db, 1, start=5)
+        query_counter.reset()
+        estimated = service.list_books(test_db, schemas.BookSearchParams(size=2, count_mode="estimate"))
+        assert query_counter.count == 1
+        assert estimated.total_elements == 5
+
+        exact = service.list_books(test_db, schemas.BookSearchParams(size=10, count_mode="exact"))
+        assert exact.total_elements == 6
+        assert exact.has_next is False
+
+    def test_rating_stats(self, test_db, query_counter):
+        """리뷰 작성/수정/삭제 시 평점 집계 갱신, 평균 평점 정렬, 재계산 테스트"""
+        from app.models import BookRatingStats, Gender, Order, OrderItem, OrderStatus, User
+        from app.domains.books import service, schemas
+        from app.domains.books.rating_stats import rebuild_rating_stats
+        from app.domains.reviews.schemas import ReviewCreateRequest, ReviewUpdateRequest
+        from app.domains.reviews.service import ReviewService
+        from datetime import date
+
+        books = self._create_books(test_db, 3)
+        test_db.add_all([BookRatingStats(book_id=book.id) for book in books])
+        users = [
+            User(email=f"rater{i}@test.com", password="hashed", name=f"Rater {i}", birth_date=date(1990, 1, 1), gender=Gender.MALE)
+            for i in range(3)
+        ]
+        test_db.add_all(users)
+        test_db.flush()
+        for user in users:
+            order = Order(
+                user_id=user.id, status=OrderStatus.DELIVERED, total_price=Decimal("20000"),
+                final_price=Decimal("20000"), shipping_address="서울시 강남구"
+            )
+            test_db.add(order)
+            test_db.flush()
+            test_db.add_all([
+                OrderItem(order_id=order.id, book_id=book.id, quantity=1, price_at_purchase=Decimal("10000"))
+                for book in books[:2]
+            ])
+        test_db.commit()
+
+        reviews = [
+            ReviewService.create_review(test_db, user.id, ReviewCreateRequest(book_id=books[0].id, rating=rating))
+            for user, rating in zip(users, (5, 4, 2))
+        ]
+        ReviewService.create_review(test_db, users[0].id, ReviewCreateRequest(book_id=books[1].id, rating=5))
+
+        book = service.get_book(test_db, books[0].id)
+        assert (book.review_count, book.average_rating) == (3, 3.67)
+        assert book.rating_histogram == {"1": 0, "2": 1, "3": 0, "4": 1, "5": 1}
+
+        ReviewService.update_review(test_db, reviews[2].id, users[2].id, ReviewUpdateRequest(rating=3))
+        ReviewService.delete_review(test_db, reviews[1].id, users[1].id)
+        book = service.get_book(test_db, books[0].id)
+        assert (book.review_count, book.average_rating) == (2, 4.0)
+        assert book.rating_histogram == {"1": 0, "2": 0, "3": 1, "4": 0, "5": 1}
+
+        # 리뷰가 없는 도서는 평균 없음, 평균 평점 정렬은 한 번의 페이지 쿼리로 조회
+        query_counter.reset()
+        result = service.list_books(test_db, schemas.BookSearchParams(sort="avg_rating", order="desc"))
+        assert query_counter.count == 2  # count + page(조회수/평점 집계 포함)
+        assert [b.id for b in result.content] == [books[1].id, books[0].id, books[2].id]
+        assert [b.average_rating for b in result.content] == [5.0, 4.0, None]
+
+        # 집계가 어긋나도 리뷰 테이블 기준으로 재계산
+        test_db.query(BookRatingStats).filter(BookRatingStats.book_id == books[0].id).update({"review_count": 99})
+        test_db.query(BookRatingStats).filter(BookRatingStats.book_id == books[1].id).delete()
+        assert rebuild_rating_stats(test_db) == {"rebuilt": 3}
+        test_db.commit()
+        assert service.get_book(test_db, books[0].id).review_count == 2
+        assert service.get_book(test_db, books[1].id).average_rating == 5.0
+
+    def test_rating_stats_missing_row(self, test_db, monkeypatch):
+        """평점 집계 행이 없을 때 리뷰 테이블 기준 생성, 동시 요청이 먼저 생성한 경우 증감만 적용하는지 테스트"""
+        from app.models import BookRatingStats, Gender, Review, User
+        from app.domains.books import rating_stats
+        from datetime import date
+
+        books = self._create_books(test_db, 1)
+        users = [
+            User(email=f"rater{i}@test.com", password="hashed", name=f"Rater {i}", birth_date=date(1990, 1, 1), gender=Gender.MALE)
+            for i in range(2)
+        ]
+        test_db.add_all(users)
+        test_db.flush()
+        test_db.add_all([
+            Review(user_id=users[0].id, book_id=books[0].id, order_id=1, rating=5),
+            Review(user_id=users[1].id, book_id=books[0].id, order_id=2, rating=2)
+        ])
+        test_db.flush()
+
+        # 집계 행이 없으면 기존 리뷰와 방금 변경분을 모두 포함하여 생성
+        rating_stats.apply_rating_change(test_db, books[0].id, added=2)
+        test_db.commit()
+        stats = test_db.get(BookRatingStats, books[0].id)
+        assert (stats.review_count, stats.rating_sum, float(stats.avg_rating), stats.rating_5) == (2, 7, 3.5, 1)
+
+        # 다른 트랜잭션이 먼저 집계 행을 만든 경우 (그 집계에는 이번 리뷰가 없음): 중복 무시 후 증감 적용
+        test_db.query(BookRatingStats).delete()
+        test_db.commit()
+        real_insert_ignore = rating_stats.insert_ignore
+
+        def concurrent_insert(db, model, values, unique_columns):
+            db.add(BookRatingStats(book_id=books[0].id, review_count=1, rating_sum=5, avg_rating=Decimal("5.00"), rating_5=1))
+            db.flush()
+            return real_insert_ignore(db, model, values, unique_columns)
+
+        monkeypatch.setattr(rating_stats, "insert_ignore", concurrent_insert)
+        rating_stats.apply_rating_change(test_db, books[0].id, added=2)
+        test_db.commit()
+        test_db.expire_all()
+        stats = test_db.get(BookRatingStats, books[0].id)
+        assert (stats.review_count, stats.rating_sum, float(stats.avg_rating), stats.rating_2) == (2, 7, 3.5, 1)
+
+    def test_avg_rating_sort_repaired_stats(self, test_db):
+        """누락된 평점 집계 행을 rebuild_rating_stats로 채운 뒤 평균 평점 정렬 목록/전체 개수/커서 페이지 테스트"""
+        from app.models import BookRatingStats
+        from app.domains.books import service, schemas
+        from app.domains.books.rating_stats import rebuild_rating_stats
+
+        books = self._create_books(test_db, 5)
+        test_db.add_all([
+            BookRatingStats(book_id=books[0].id),
+            BookRatingStats(book_id=books[2].id, review_count=1, avg_rating=Decimal("4.00"), rating_4=1)
+        ])
+        test_db.commit()
+
+        # 평균 평점 정렬은 집계 행과 내부 조인 (모든 도서에 집계 행이 있다는 전제)
+        assert service.list_books(
+            test_db, schemas.BookSearchParams(size=10, sort="avg_rating", order="desc")
+        ).total_elements == 2
+        for book in (books[1], books[3], books[4]):
+            rebuild_rating_stats(test_db, book.id)
+        test_db.commit()
+
+        result = service.list_books(test_db, schemas.BookSearchParams(size=10, sort="avg_rating", order="desc"))
+        assert result.total_elements == 5
+        assert [b.id for b in result.content] == [books[2].id] + [book.id for book in reversed(books) if book is not books[2]]
+        assert [b.average_rating for b in result.content] == [4.0, None, None, None, None]
+
+        for order in ("desc", "asc"):
+            expected = [
+                b.id for b in service.list_books(
+                    test_db, schemas.BookSearchParams(size=10, sort="avg_rating", order=order)
+                ).content
+            ]
+            seen, cursor = [], None
+            while True:
+                page = service.list_books(
+                    test_db, schemas.BookSearchParams(size=2, cursor=cursor, sort="avg_rating", order=order)
+                )
+                seen.extend(b.id for b in page.content)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+            assert seen == expected
+
+    def test_trending_scores(self, test_db):
+        """조회/찜/주문 이벤트의 시간 감쇠 점수 증분 갱신 및 기간별 인기 도서 스냅샷 테스트"""
+        from app.models import BookTrendingScore, BookView, Favorite, Gender, Order, OrderItem, OrderStatus, User
+        from app.domains.books.trending import TrendingRanking, load_trending_snapshot, refresh_trending_scores
+        from datetime import date, datetime, timedelta
+
+        def scores(period):
+            return {book.id: book.score for book in load_trending_snapshot(test_db, 10).books[period]}
+
+        def stored_scores():
+            return {(row.book_id, row.period): row.score for row in test_db.query(BookTrendingScore)}
+
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        books = self._create_books(test_db, 3)
+        user = User(email="trend@test.com", password="hashed", name="Trend", birth_date=date(1990, 1, 1), gender=Gender.MALE)
+        test_db.add(user)
+        test_db.flush()
+        order = Order(
+            user_id=user.id, status=OrderStatus.CANCELLED, total_price=Decimal("20000"),
+            final_price=Decimal("20000"), shipping_address="서울시 강남구", created_at=now
+        )
+        test_db.add(order)
+        test_db.flush()
+        test_db.add_all([
+            BookView(book_id=books[0].id, viewed_at=now - timedelta(hours=2)),
+            BookView(book_id=books[0].id, viewed_at=now - timedelta(hours=2)),
+            BookView(book_id=books[1].id, viewed_at=now),
+            Favorite(user_id=user.id, book_id=books[2].id, created_at=now - timedelta(days=3)),
+            # 취소된 주문은 반영하지 않음
+            OrderItem(order_id=order.id, book_id=books[0].id, quantity=2, price_at_purchase=Decimal("10000"))
+        ])
+        test_db.commit()
+
+        assert refresh_trending_scores(test_db, now)["events"] == 4
+        # 1h 기간의 3일 전 찜 점수는 정리됨
+        assert scores("1h") == {books[0].id: 0.5, books[1].id: 1.0}
+        assert scores("24h") == {books[0].id: 1.89, books[1].id: 1.0, books[2].id: 0.38}
+        assert scores("7d")[books[2].id] == 2.23
+
+        ranking = TrendingRanking(size=2)
+        assert [b.id for b in ranking.top(test_db, "1h", 10).content] == [books[1].id, books[0].id]
+        assert [b.id for b in ranking.top(test_db, "7d", 1).content] == [books[2].id]
+
+        # 다음 갱신은 기존 점수를 감쇠하고 새 이벤트만 반영
+        test_db.add(BookView(book_id=books[1].id, viewed_at=now + timedelta(hours=1)))
+        test_db.commit()
+        assert refresh_trending_scores(test_db, now + timedelta(hours=1))["events"] == 1
+        assert scores("1h") == {books[0].id: 0.25, books[1].id: 1.5}
+        # 스냅샷은 갱신 작업이 교체하기 전까지 그대로 사용
+        assert ranking.top(test_db, "1h", 10).content[0].score == 1.0
+        # 새 이벤트가 없으면 기존 점수 행은 갱신하지 않음 (감쇠는 조회 시 계산)
+        stored = stored_scores()
+        assert refresh_trending_scores(test_db, now + timedelta(hours=1))["events"] == 0
+        assert stored_scores() == stored
+        assert scores("1h") == {books[0].id: 0.25, books[1].id: 1.5}
+
+        # 기준 시각 이동 후에도 같은 점수, 현재 점수가 작아진 행은 정리
+        result = refresh_trending_scores(test_db, now + timedelta(hours=1 + 512))
+        assert result["rebased"] is True and result["pruned"] > 0
+        assert scores("1h") == {}
+        assert scores("7d") == {books[0].id: 0.24, books[1].id: 0.24, books[2].id: 0.27}
+
+    def test_trending_late_commit(self, test_db):
+        """갱신 후 더 작은 ID로 늦게 커밋된 이벤트도 한 번만 반영되는지 테스트"""
+        from app.models import BookTrendingState, BookView
+        from app.domains.books.trending import PENDING_ID_TIMEOUT, load_trending_snapshot, refresh_trending_scores
+        from datetime import datetime, timedelta
+
+        def view_scores():
+            return {b.id: b.score for b in load_trending_snapshot(test_db, 10).books["7d"]}
+
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        books = self._create_books(test_db, 2)
+        # ID 2, 4는 아직 커밋되지 않은 다른 트랜잭션이 할당한 상태
+        test_db.add_all([BookView(id=1, book_id=books[0].id, viewed_at=now), BookView(id=3, book_id=books[0].id, viewed_at=now)])
+        test_db.commit()
+
+        assert refresh_trending_scores(test_db, now)["events"] == 2
+        state = test_db.get(BookTrendingState, 1)
+        assert [event_id for event_id, _ in state.pending_view_ids] == [2]
+
+        test_db.add(BookView(id=2, book_id=books[1].id, viewed_at=now))
+        test_db.commit()
+        assert refresh_trending_scores(test_db, now)["events"] == 1
+        assert view_scores() == {books[0].id: 2.0, books[1].id: 1.0}
+        assert state.pending_view_ids == []
+
+        # 다시 조회해도 중복 반영하지 않음
+        assert refresh_trending_scores(test_db, now)["events"] == 0
+
+        # 재확인 기간이 지난 빈 ID는 롤백된 것으로 보고 제외
+        test_db.add(BookView(id=5, book_id=books[1].id, viewed_at=now))
+        test_db.commit()
+        refresh_trending_scores(test_db, now)
+        assert [event_id for event_id, _ in state.pending_view_ids] == [4]
+        refresh_trending_scores(test_db, now + PENDING_ID_TIMEOUT)
+        assert state.pending_view_ids == []
@@ -0,0 +1,60 @@
+"""
+Cart Domain Tests
+장바구니 관련 서비스 테스트
+"""
+from datetime import date
+from decimal import Decimal
+
+
+class TestCartService:
+    """장바구니 서비스 테스트"""
+
+    def test_get_cart_joined_and_cached(self, test_db, query_counter):
+        """장바구니 조회 단일 쿼리 및 변경 시 캐시 무효화 테스트"""
+        from app.models import Book
+        from app.domains.cart.schemas import CartAddRequest, CartUpdateRequest
+        from app.domains.cart.service import CartService, cart_cache
+
+        cart_cache.clear()
+        books = [
+            Book(
+                seller_id=1,
+                title=f"Cart Book {i}",
+                author="Cart Author",
+                publisher="Cart Publisher",
+                isbn=f"97800000003{i:02d}",
+                price=Decimal("10000") * (i + 1),
+                publication_date=date(2024, 1, 1)
+            )
+            for i in range(10)
+        ]
+        test_db.add_all(books)
+        test_db.commit()
+        for book in books:
+            CartService.add_to_cart(test_db, 1, CartAddRequest(book_id=book.id, quantity=2))
+
+        query_counter.reset()
+        items, total_items, total_quantity, total_price = CartService.get_cart(test_db, 1)
+        assert query_counter.count == 1
+        assert total_items == 10
+        assert total_quantity == 20
+        assert total_price == Decimal("1100000")
+        assert {item["book_title"] for item in items} == {book.title for book in books}
+
+        # 캐시 적중
+        query_counter.reset()
+        assert CartService.get_cart(test_db, 1)[3] == total_price
+        assert query_counter.count == 0
+
+        # 수량 변경 / 삭제 / 추가 시 무효화
+        CartService.update_quantity(test_db, items[0]["id"], 1, CartUpdateRequest(quantity=1))
+        assert CartService.get_cart(test_db, 1)[2] == 19
+
+        CartService.delete_from_cart(test_db, items[0]["id"], 1)
+        assert CartService.get_cart(test_db, 1)[1] == 9
+
+        CartService.add_to_cart(test_db, 1, CartAddRequest(book_id=books[0].id, quantity=1))
+        assert CartService.get_cart(test_db, 1)[2] == 19
+
+        # 다른 사용자 캐시와 분리
+        assert CartService.get_cart(test_db, 2) == ([], 0, 0, 0)
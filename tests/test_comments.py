@@ -0,0 +1,129 @@
+"""
+Comments Domain Tests
+댓글 관련 서비스 테스트
+"""
+import pytest
+from datetime import date
+
+
+class TestCommentService:
+    """댓글 서비스 테스트"""
+
+    def test_comment_like_counts_and_page_loading(self, test_db, query_counter):
+        """댓글 좋아요 수 캐시 갱신 및 페이지 일괄 조회 테스트"""
+        from app.models import User, Gender
+        from app.models.review import Review
+        from app.domains.comments.schemas import CommentCreateRequest
+        from app.domains.comments.service import CommentService
+
+        users = [
+            User(
+                email=f"commenter{i}@test.com",
+                password="hashed",
+                name=f"Commenter {i}",
+                birth_date=date(1990, 1, 1),
+                gender=Gender.MALE
+            )
+            for i in range(3)
+        ]
+        test_db.add_all(users)
+        test_db.flush()
+        review = Review(user_id=users[0].id, book_id=1, order_id=1, rating=4)
+        test_db.add(review)
+        test_db.commit()
+
+        comments = [
+            CommentService.create_comment(
+                test_db, user.id, CommentCreateRequest(review_id=review.id, content=f"Comment {i}")
+            )
+            for i, user in enumerate(users)
+        ]
+        target = comments[0].id
+
+        assert CommentService.toggle_like(test_db, target, users[1].id) == (True, 1)
+        assert CommentService.toggle_like(test_db, target, users[2].id) == (True, 2)
+        assert CommentService.toggle_like(test_db, target, users[2].id) == (False, 1)
+
+        user_id, review_id = users[1].id, review.id
+        test_db.expire_all()
+
+        query_counter.reset()
+        result, total, _ = CommentService.get_comments(test_db, user_id, review_id=review_id, size=10)
+
+        assert query_counter.count == 3  # count + page(좋아요 수/작성자 포함) + 좋아요 여부
+        assert total == 3
+        by_id = {comment.id: comment for comment in result}
+        assert by_id[target].like_count == 1
+        assert by_id[target].is_liked is True
+        assert by_id[target].user_name == "Commenter 0"
+        assert sum(comment.is_liked for comment in result) == 1
+
+        detail = CommentService.get_comment(test_db, target, None)
+        assert detail.like_count == 1
+        assert detail.is_liked is False
+
+    @pytest.mark.parametrize("use_cte", [True, False])
+    def test_comment_tree(self, test_db, query_counter, monkeypatch, use_cte):
+        """댓글 트리 조회 테스트 (WITH RECURSIVE / 메모리 조립 fallback)"""
+        from app.models import User, Gender
+        from app.models.review import Review
+        from app.models.comment import Comment
+        from app.domains.comments.schemas import CommentTreeNode
+        from app.domains.comments.service import CommentService
+
+        monkeypatch.setattr(CommentService, "_supports_recursive_cte", staticmethod(lambda db: use_cte))
+
+        user = User(
+            email="tree@test.com",
+            password="hashed",
+            name="Tree User",
+            birth_date=date(1990, 1, 1),
+            gender=Gender.MALE
+        )
+        test_db.add(user)
+        test_db.flush()
+        review = Review(user_id=user.id, book_id=1, order_id=1, rating=5)
+        other = Review(user_id=user.id, book_id=2, order_id=1, rating=5)
+        test_db.add_all([review, other])
+        test_db.flush()
+
+        def add(content, parent=None, review_id=review.id):
+            comment = Comment(
+                review_id=review_id,
+                user_id=user.id,
+                parent_comment_id=parent.id if parent else None,
+                content=content
+            )
+            test_db.add(comment)
+            test_db.flush()
+            return comment
+
+        root1 = add("root1")
+        reply1 = add("reply1", root1)
+        add("reply2", root1)
+        add("reply3", root1)
+        add("nested", reply1)
+        add("root2")
+        add("other", review_id=other.id)
+        test_db.commit()
+        review_id = review.id
+        test_db.expire_all()
+
+        query_counter.reset()
+        roots, total = CommentService.get_comment_tree(test_db, review_id, None)
+        assert query_counter.count == 1
+        assert total == 6
+        assert [root.content for root in roots] == ["root1", "root2"]
+        assert [reply.content for reply in roots[0].children] == ["reply1", "reply2", "reply3"]
+        assert roots[0].children[0].children[0].content == "nested"
+        assert roots[0].children[0].children[0].depth == 3
+
+        node = CommentTreeNode.model_validate(roots[0])
+        assert node.reply_count == 3
+        assert node.children[0].children[0].children == []
+
+        roots, total = CommentService.get_comment_tree(test_db, review_id, None, max_depth=2, per_level_limit=2)
+        assert total == 5
+        assert len(roots[0].children) == 2
+        assert roots[0].reply_count == 3
+        assert roots[0].children[0].children == []
@@ -0,0 +1,210 @@
+"""
+Conditional Request Tests
+상세 조회 ETag/Last-Modified 생성 및 304 처리 테스트
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from starlette.requests import Request
+
+
+def _request(headers: dict = None) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": raw_headers})
+
+
+def _seed(test_db):
+    from app.models import Book, Gender, User
+    from app.models.order import Order, OrderItem, OrderStatus
+    from app.models.review import Review, ReviewLikeCount
+
+    users = [
+        User(email=f"etag{i}@test.com", password="hashed", name=f"ETag {i}", birth_date=date(1990, 1, 1), gender=Gender.MALE)
+        for i in range(2)
+    ]
+    test_db.add_all(users)
+    test_db.flush()
+
+    book = Book(
+        seller_id=users[0].id, title="ETag Book", author="Author", publisher="Publisher",
+        isbn="9780000000501", price=Decimal("10000"), publication_date=date(2024, 1, 1)
+    )
+    test_db.add(book)
+    test_db.flush()
+
+    review = Review(user_id=users[0].id, book_id=book.id, order_id=1, rating=5, comment="good")
+    order = Order(
+        user_id=users[0].id, status=OrderStatus.PENDING, total_price=Decimal("10000"),
+        final_price=Decimal("10000"), shipping_address="서울시 강남구"
+    )
+    test_db.add_all([review, order])
+    test_db.flush()
+    test_db.add_all([
+        ReviewLikeCount(review_id=review.id, like_count=0),
+        OrderItem(order_id=order.id, book_id=book.id, quantity=1, price_at_purchase=Decimal("10000"))
+    ])
+    test_db.commit()
+    return users, book, review, order
+
+
+class TestConditionalRequests:
+    """조건부 요청 테스트"""
+
+    def test_is_not_modified(self):
+        """If-None-Match(weak 비교) 우선, 없으면 If-Modified-Since로 판단하는지 테스트"""
+        from app.core.conditional import ResourceVersion, is_not_modified
+
+        version = ResourceVersion("book", 1, last_modified=datetime(2025, 1, 1, 12, 0, 0))
+        assert version.etag.startswith('W/"')
+        assert version.last_modified == "Wed, 01 Jan 2025 12:00:00 GMT"
+
+        assert is_not_modified(_request({"If-None-Match": version.etag.removeprefix("W/")}), version.etag)
+        assert is_not_modified(_request({"If-None-Match": '"a", *'}), version.etag)
+        assert not is_not_modified(_request({"If-None-Match": '"a"'}), version.etag)
+
+        assert is_not_modified(
+            _request({"If-Modified-Since": "Wed, 01 Jan 2025 12:00:00 GMT"}), version.etag, version.last_modified
+        )
+        assert not is_not_modified(
+            _request({"If-Modified-Since": "Wed, 01 Jan 2025 11:59:59 GMT"}), version.etag, version.last_modified
+        )
+        # If-None-Match가 있으면 If-Modified-Since는 무시
+        assert not is_not_modified(
+            _request({"If-None-Match": '"a"', "If-Modified-Since": "Wed, 01 Jan 2025 12:00:00 GMT"}),
+            version.etag, version.last_modified
+        )
+
+    def test_versions(self, test_db):
+        """리소스 버전이 수정 시각/카운터/사용자별 상태를 반영하는지 테스트"""
+        from app.domains.books import service as book_service
+        from app.domains.reviews.service import ReviewService
+        from app.domains.orders.service import OrderService
+        from app.domains.users.service import UserService
+        from app.models.order import OrderStatus
+
+        users, book, review, order = _seed(test_db)
+        owner, other = users[0].id, users[1].id
+
+        assert book_service.get_book_version(test_db, 99999) is None
+        assert ReviewService.get_review_version(test_db, 99999, None) is None
+        assert OrderService.get_order_version(test_db, order.id, other) is None
+        assert UserService.get_profile_version(test_db, 99999) is None
+
+        anonymous = ReviewService.get_review_version(test_db, review.id, None)
+        ReviewService.toggle_like(test_db, review.id, other)
+        liked_by_other = ReviewService.get_review_version(test_db, review.id, other)
+        assert liked_by_other.etag != anonymous.etag
+        # 좋아요 수 변경은 좋아요하지 않은 사용자의 버전도 바꿈
+        assert ReviewService.get_review_version(test_db, review.id, owner).etag != anonymous.etag
+        assert ReviewService.get_review_version(test_db, review.id, other).etag == liked_by_other.etag
+
+        order_version = OrderService.get_order_version(test_db, order.id, owner)
+        order.status = OrderStatus.CONFIRMED
+        test_db.commit()
+        confirmed = OrderService.get_order_version(test_db, order.id, owner)
+        assert confirmed.etag != order_version.etag
+
+        # 주문 항목 도서 정보(제목)가 바뀌면 주문 응답도 바뀜
+        book.title = "Renamed"
+        book.updated_at = datetime.utcnow() + timedelta(minutes=1)
+        test_db.commit()
+        renamed = OrderService.get_order_version(test_db, order.id, owner)
+        assert renamed.etag != confirmed.etag
+        assert renamed.last_modified == book_service.get_book_version(test_db, book.id).last_modified
+
+    def test_conditional_endpoint(self, test_db, query_counter):
+        """버전이 일치하면 엔드포인트(서비스 조회) 없이 304를 반환하는지 테스트"""
+        from app.core.conditional import conditional_response
+        from app.core.exceptions import ForbiddenException
+        from app.domains.base import BaseResponse
+        from app.domains.orders.schemas import OrderResponse
+        from app.domains.orders.service import OrderService
+
+        users, _, _, order = _seed(test_db)
+        owner, other, order_id = users[0].id, users[1].id, order.id
+        calls = []
+
+        @conditional_response(lambda db, kwargs: OrderService.get_order_version(db, kwargs["order_id"], kwargs["user_id"]))
+        def endpoint(order_id: int, user_id: int, request: Request, db):
+            calls.append(order_id)
+            return BaseResponse(is_success=True, message="조회", payload=OrderResponse.model_validate(
+                OrderService.get_order(db, order_id, user_id)
+            ))
+
+        response = endpoint(order_id=order_id, user_id=owner, request=_request(), db=test_db)
+        assert response.status_code == 200
+        assert b'"shipping_address":"\xec\x84\x9c\xec\x9a\xb8\xec\x8b\x9c \xea\xb0\x95\xeb\x82\xa8\xea\xb5\xac"' in response.body
+        etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+        test_db.expire_all()
+        query_counter.reset()
+        not_modified = endpoint(order_id=order_id, user_id=owner, request=_request({"If-None-Match": etag}), db=test_db)
+        assert not_modified.status_code == 304 and not_modified.body == b""
+        assert not_modified.headers["etag"] == etag
+        assert query_counter.count == 1  # 버전 조회만 실행 (주문 + 항목 + 도서 + 쿠폰 이름 조회 생략)
+
+        assert endpoint(
+            order_id=order_id, user_id=owner, request=_request({"If-Modified-Since": last_modified}), db=test_db
+        ).status_code == 304
+        assert calls == [order_id]
+
+        # 다른 사용자는 버전 조회 결과가 없으므로 엔드포인트의 권한 오류가 그대로 발생
+        with pytest.raises(ForbiddenException):
+            endpoint(order_id=order_id, user_id=other, request=_request({"If-None-Match": "*"}), db=test_db)
+
+    def test_with_response_cache(self, test_db):
+        """응답 캐시가 엔드포인트의 버전 ETag/Last-Modified를 그대로 저장하는지 테스트"""
+        from app.core.conditional import conditional_response
+        from app.core.response_cache import book_tag, cached_response, response_cache
+        from app.domains.books import service as book_service
+
+        _, book, _, _ = _seed(test_db)
+        response_cache.clear()
+
+        @cached_response(tags=lambda kwargs: [book_tag(kwargs["book_id"])])
+        @conditional_response(lambda db, kwargs: book_service.get_book_version(db, kwargs["book_id"]))
+        def endpoint(book_id: int, request: Request, db):
+            return {"id": book_id}
+
+        version = book_service.get_book_version(test_db, book.id)
+        miss = endpoint(book_id=book.id, request=_request(), db=test_db)
+        hit = endpoint(book_id=book.id, request=_request(), db=test_db)
+        assert (miss.headers["x-cache"], hit.headers["x-cache"]) == ("MISS", "HIT")
+        assert miss.headers["etag"] == hit.headers["etag"] == version.etag
+        assert hit.headers["last-modified"] == version.last_modified
+
+        not_modified = endpoint(book_id=book.id, request=_request({"If-None-Match": version.etag}), db=test_db)
+        assert not_modified.status_code == 304
+        response_cache.clear()
+
+    async def test_async_not_modified_records_view(self, async_db):
+        """비동기 세션에서 304 응답 시에도 도서 조회가 기록되는지 테스트"""
+        from app.core.conditional import conditional_response
+        from app.domains.books import service as book_service
+        from app.models import Book, BookViewCount
+
+        book = Book(
+            seller_id=1, title="Async ETag", author="Author", publisher="Publisher",
+            isbn="9780000000502", price=Decimal("10000"), publication_date=date(2024, 1, 1)
+        )
+        async_db.add(book)
+        await async_db.flush()
+        async_db.add(BookViewCount(book_id=book.id, view_count=0, rolled_up_count=0))
+        await async_db.commit()
+
+        @conditional_response(
+            lambda db, kwargs: book_service.get_book_version(db, kwargs["book_id"]),
+            on_not_modified=lambda db, kwargs: book_service.record_view(db, kwargs["book_id"])
+        )
+        async def endpoint(book_id: int, request: Request, db):
+            return await book_service.get_book_async(db, book_id)
+
+        response = await endpoint(book_id=book.id, request=_request(), db=async_db)
+        assert response.status_code == 200
+        not_modified = await endpoint(book_id=book.id, request=_request({"If-None-Match": response.headers["etag"]}), db=async_db)
+        assert not_modified.status_code == 304
+
+        view_count = await async_db.run_sync(
+            lambda db: db.query(BookViewCount.view_count).filter(BookViewCount.book_id == book.id).scalar()
+        )
+        assert view_count == 2
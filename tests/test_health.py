@@ -0,0 +1,69 @@
+"""
+Health Tests
+DB 헬스체크 및 커넥션 풀 계측 테스트
+"""
+import pytest
+
+
+class TestPoolMetrics:
+    """커넥션 풀 계측 테스트"""
+
+    def test_pool_options(self):
+        """SQLite는 기본 풀, 그 외 DB는 설정된 계측 풀 사용"""
+        from app.core.config import settings
+        from app.core.database import get_pool_options
+        from app.core.pool_metrics import InstrumentedQueuePool
+
+        assert get_pool_options("sqlite:///:memory:", InstrumentedQueuePool) == {}
+
+        options = get_pool_options("mysql+pymysql://user:pw@db:3306/bookstore", InstrumentedQueuePool)
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert options["pool_size"] == settings.DB_POOL_SIZE
+        assert options["pool_recycle"] == settings.DB_POOL_RECYCLE
+        assert options["pool_pre_ping"] is settings.DB_POOL_PRE_PING
+
+    def test_wait_histogram_and_status(self, tmp_path):
+        """체크아웃 대기 시간/타임아웃 집계 및 풀 사용 현황 테스트"""
+        from sqlalchemy import create_engine, exc, text
+        from app.core.pool_metrics import InstrumentedQueuePool, pool_status, wait_histograms
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+            pool_logging_name="test-pool"
+        )
+        wait_histograms.pop("test-pool", None)
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                status = pool_status(engine.pool)
+                assert status["checked_out"] == 1
+                assert status["size"] == 1
+
+                # 풀이 가득 찬 상태에서 추가 체크아웃은 타임아웃
+                with pytest.raises(exc.TimeoutError):
+                    engine.connect()
+
+            status = pool_status(engine.pool)
+            assert status["pool_class"] == "InstrumentedQueuePool"
+            assert status["checked_out"] == 0
+            assert status["wait"]["count"] == 2
+            assert status["wait"]["timeouts"] == 1
+            assert status["wait"]["max_ms"] >= 50
+            assert sum(status["wait"]["buckets"].values()) == 2
+        finally:
+            engine.dispose()
+
+    def test_db_health_check(self):
+        """DB 헬스체크 응답 테스트"""
+        import json
+        from app.domains.health.router import db_health_check
+
+        response = db_health_check()
+        body = json.loads(response.body)
+        assert response.status_code == 200
+        assert body["status"] == "healthy"
+        assert set(body["pools"]) == {"primary", "async"}
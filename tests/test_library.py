@@ -0,0 +1,82 @@
+"""
+Library Domain Tests
+구매한 도서(내 서재) 관련 서비스 테스트
+"""
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+
+
+class TestLibraryService:
+    """내 서재 서비스 테스트"""
+
+    @staticmethod
+    def _create_purchases(test_db):
+        from app.models import Book, Gender, Order, OrderItem, OrderStatus, User
+
+        user = User(email="library@test.com", password="hashed", name="Reader", birth_date=date(1990, 1, 1), gender=Gender.MALE)
+        test_db.add(user)
+        test_db.flush()
+
+        books = [
+            Book(
+                seller_id=user.id, title=f"Library Book {i % 3}", author="Author", publisher="Publisher",
+                isbn=f"97800000003{i:02d}", price=Decimal("10000"), publication_date=date(2024, 1, 1)
+            )
+            for i in range(7)
+        ]
+        test_db.add_all(books)
+        test_db.flush()
+
+        # 주문 하나에 여러 항목 (같은 주문일 = 정렬 키 중복), 배송 완료가 아닌 주문은 제외
+        orders = [
+            Order(
+                user_id=user.id, status=status, total_price=Decimal("10000"), final_price=Decimal("10000"),
+                shipping_address="서울시 강남구", created_at=datetime(2025, 1, day)
+            )
+            for day, status in ((1, OrderStatus.DELIVERED), (2, OrderStatus.DELIVERED), (3, OrderStatus.PENDING))
+        ]
+        test_db.add_all(orders)
+        test_db.flush()
+
+        items = [
+            OrderItem(order_id=orders[i % 3].id, book_id=book.id, quantity=1, price_at_purchase=Decimal("10000"))
+            for i, book in enumerate(books)
+        ]
+        test_db.add_all(items)
+        test_db.commit()
+        delivered = [item.id for item in items if item.order_id != orders[2].id]
+        return user.id, delivered
+
+    @pytest.mark.parametrize("sort_field,sort_order", [("order_date", "desc"), ("title", "asc")])
+    def test_cursor_pagination(self, test_db, tamper_cursor, sort_field, sort_order):
+        """(주문 항목, 주문, 도서) 조인 결과의 커서 페이지가 OFFSET 페이지와 같고 중복/누락이 없는지 테스트"""
+        from app.core.exceptions import BadRequestException
+        from app.domains.library.service import LibraryService
+
+        user_id, delivered = self._create_purchases(test_db)
+
+        def pages(**kwargs):
+            return LibraryService.get_purchased_books(
+                test_db, user_id, size=2, sort_field=sort_field, sort_order=sort_order, **kwargs
+            )
+
+        expected = [(book["order_id"], book["book_id"]) for page in (1, 2, 3) for book in pages(page=page)[0]]
+
+        seen, cursor = [], None
+        while True:
+            books, _, cursor = pages(cursor=cursor)
+            seen.extend((book["order_id"], book["book_id"]) for book in books)
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert len(seen) == len(set(seen)) == len(delivered)
+
+        first_cursor = pages()[2]
+        with pytest.raises(BadRequestException) as exc:
+            pages(cursor=tamper_cursor(first_cursor))
+        assert exc.value.status_code == 400
+        with pytest.raises(BadRequestException) as exc:
+            LibraryService.get_purchased_books(test_db, user_id, size=2, sort_field="author", cursor=first_cursor)
+        assert exc.value.status_code == 400
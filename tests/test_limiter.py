@@ -0,0 +1,128 @@
+"""
+Rate Limiter Tests
+공유 레이트 리밋 저장소 및 로컬 토큰 버킷 테스트
+"""
+import threading
+import time
+
+from limits import RateLimitItemPerMinute
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+
+
+class FakeRedis:
+    """저장소가 사용하는 Redis 명령만 구현한 프로세스 내 클라이언트 (명령 수 기록)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: dict[str, int] = {}
+        self._expires: dict[str, float] = {}
+        self.commands = 0
+
+    def _alive(self, key):
+        if key in self._expires and self._expires[key] <= time.time():
+            self._values.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._values
+
+    def set(self, key, value, ex=None, nx=False):
+        with self._lock:
+            self.commands += 1
+            if nx and self._alive(key):
+                return None
+            self._values[key] = int(value)
+            if ex is not None:
+                self._expires[key] = time.time() + ex
+            return True
+
+    def incrby(self, key, amount):
+        with self._lock:
+            self.commands += 1
+            self._alive(key)
+            self._values[key] = self._values.get(key, 0) + amount
+            return self._values[key]
+
+    def pttl(self, key):
+        with self._lock:
+            self.commands += 1
+            if not self._alive(key):
+                return -2
+            if key not in self._expires:
+                return -1
+            return int((self._expires[key] - time.time()) * 1000)
+
+    def get(self, key):
+        with self._lock:
+            self.commands += 1
+            return self._values.get(key) if self._alive(key) else None
+
+    def delete(self, *keys):
+        with self._lock:
+            self.commands += 1
+            for key in keys:
+                self._values.pop(key, None)
+                self._expires.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in list(self._values) if key.startswith(prefix)]
+
+    def ping(self):
+        return True
+
+
+class TestRateLimitStorage:
+    """레이트 리밋 저장소 테스트"""
+
+    def test_shared_limit_across_workers(self):
+        """여러 워커(저장소 인스턴스)가 하나의 한도를 공유하는지 테스트"""
+        from app.core.rate_limit_storage import SharedRedisStorage
+
+        redis = FakeRedis()
+        workers = [FixedWindowRateLimiter(SharedRedisStorage("shared+redis://fake", client=redis)) for _ in range(3)]
+        limit = RateLimitItemPerMinute(10)
+
+        allowed = sum(workers[i % 3].hit(limit, "ip:1.2.3.4") for i in range(30))
+        assert allowed == 10
+        assert workers[0].hit(limit, "ip:5.6.7.8") is True
+
+        workers[0].storage.clear(limit.key_for("ip:1.2.3.4"))
+        assert workers[1].hit(limit, "ip:1.2.3.4") is True
+
+    def test_batched_prefetch(self):
+        """로컬 예약분으로 판정하여 Redis 명령 수가 줄어드는지 테스트"""
+        from app.core.rate_limit_storage import BatchedRedisStorage
+
+        redis = FakeRedis()
+        storages = [
+            storage_from_string("batched+redis://fake", client=redis, batch_size=5)
+            for _ in range(2)
+        ]
+        assert all(isinstance(storage, BatchedRedisStorage) for storage in storages)
+        workers = [FixedWindowRateLimiter(storage) for storage in storages]
+        limit = RateLimitItemPerMinute(20)
+
+        allowed = sum(workers[i % 2].hit(limit, "user:1") for i in range(40))
+        assert allowed == 20
+        # 예약 1회당 3개 명령 (SET NX, INCRBY, PTTL), 요청마다 호출하면 120개
+        assert redis.commands == (40 // 5) * 3
+
+        # 예약 후 사용하지 않은 순번은 남은 한도 계산에서 제외
+        key = limit.key_for("user:2")
+        storages[0].incr(key, limit.get_expiry())
+        assert storages[0].get(key) == 1
+
+    def test_rate_limit_key(self):
+        """인증된 요청은 사용자 ID, 그 외는 IP로 식별"""
+        from starlette.requests import Request
+        from app.core.limiter import rate_limit_key
+        from app.core.security import create_access_token
+
+        def request(authorization=None):
+            headers = [(b"authorization", authorization.encode())] if authorization else []
+            return Request({"type": "http", "headers": headers, "client": ("10.0.0.1", 1234)})
+
+        token = create_access_token({"user_id": 42, "email": "limit@test.com", "role": "CUSTOMER"})
+        assert rate_limit_key(request(f"Bearer {token}")) == "user:42"
+        assert rate_limit_key(request("Bearer invalid")) == "ip:10.0.0.1"
+        assert rate_limit_key(request()) == "ip:10.0.0.1"
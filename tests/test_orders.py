@@ -0,0 +1,224 @@
+"""
+Orders Domain Tests
+주문 관련 서비스 테스트
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+
+class TestOrderService:
+    """주문 서비스 테스트"""
+
+    @staticmethod
+    def _create_books(test_db, count):
+        from app.models import Book
+
+        books = [
+            Book(
+                seller_id=1,
+                title=f"Order Book {i}",
+                author="Order Author",
+                publisher="Order Publisher",
+                isbn=f"97800000002{i:02d}",
+                price=Decimal("10000"),
+                publication_date=date(2024, 1, 1)
+            )
+            for i in range(count)
+        ]
+        test_db.add_all(books)
+        test_db.commit()
+        return books
+
+    @staticmethod
+    def _create_coupon(test_db, user_id, **kwargs):
+        from app.models import Coupon, CouponIssuance, CouponType
+
+        coupon = Coupon(
+            name="신규회원10",
+            discount_rate=Decimal("10"),
+            coupon_type=kwargs.get("coupon_type", CouponType.PERSONAL),
+            start_at=datetime.utcnow() - timedelta(days=1),
+            end_at=datetime.utcnow() + timedelta(days=1),
+            is_active=True
+        )
+        test_db.add(coupon)
+        test_db.flush()
+        if kwargs.get("issued", True):
+            test_db.add(CouponIssuance(user_id=user_id, coupon_id=coupon.id))
+        test_db.commit()
+        return coupon
+
+    def test_create_order_query_count(self, test_db, query_counter):
+        """주문 생성 쿼리 수가 주문 항목 수와 무관한지 테스트"""
+        from app.models import OrderItem, CouponUsageHistory
+        from app.domains.orders.schemas import OrderCreateRequest
+        from app.domains.orders.service import OrderService
+
+        books = self._create_books(test_db, 30)
+        book_ids = [book.id for book in books]
+        coupon_id = self._create_coupon(test_db, user_id=1).id
+
+        def create(ids, coupon=None):
+            data = OrderCreateRequest(
+                items=[{"book_id": book_id, "quantity": 2} for book_id in ids],
+                coupon_id=coupon,
+                shipping_address="서울시 강남구 테헤란로 123"
+            )
+            query_counter.reset()
+            order = OrderService.create_order(test_db, 1, data)
+            return order, query_counter.count
+
+        _, single_count = create(book_ids[:1])
+        order, bulk_count = create(book_ids, coupon_id)
+
+        # 도서 IN 조회 + 쿠폰 검증 + 주문/주문 항목(다중 행)/쿠폰 사용 INSERT + refresh
+        assert bulk_count <= 6
+        assert bulk_count == single_count + 2  # 쿠폰 검증 + 쿠폰 사용 이력
+        assert order.total_price == Decimal("600000")
+        assert order.discount_amount == Decimal("60000")
+        assert order.final_price == Decimal("540000")
+        assert order.coupon_code == "신규회원10"
+        assert test_db.query(OrderItem).filter(OrderItem.order_id == order.id).count() == 30
+        assert test_db.query(CouponUsageHistory).filter(CouponUsageHistory.order_id == order.id).count() == 1
+
+    def test_create_order_validation(self, test_db):
+        """주문 생성 검증 실패 테스트 (없는 도서, 미발급/사용한 쿠폰)"""
+        from app.core.exceptions import NotFoundException, BadRequestException
+        from app.models import Order
+        from app.domains.orders.schemas import OrderCreateRequest
+        from app.domains.orders.service import OrderService
+
+        book = self._create_books(test_db, 1)[0]
+        not_issued = self._create_coupon(test_db, user_id=1, issued=False)
+        issued = self._create_coupon(test_db, user_id=1)
+
+        def request(book_id, coupon_id=None):
+            return OrderCreateRequest(
+                items=[{"book_id": book_id, "quantity": 1}],
+                coupon_id=coupon_id,
+                shipping_address="서울시 강남구 테헤란로 123"
+            )
+
+        with pytest.raises(NotFoundException):
+            OrderService.create_order(test_db, 1, request(99999))
+        with pytest.raises(BadRequestException) as exc:
+            OrderService.create_order(test_db, 1, request(book.id, not_issued.id))
+        assert exc.value.error_code == "COUPON_NOT_ISSUED"
+
+        OrderService.create_order(test_db, 1, request(book.id, issued.id))
+        with pytest.raises(BadRequestException) as exc:
+            OrderService.create_order(test_db, 1, request(book.id, issued.id))
+        assert exc.value.error_code == "COUPON_ALREADY_USED"
+        assert test_db.query(Order).count() == 1
+
+    def test_checkout_from_cart(self, test_db):
+        """장바구니 주문 테스트 (주문 생성 + 장바구니 비우기, 실패 시 롤백)"""
+        from app.core.exceptions import NotFoundException, BadRequestException
+        from app.models import Cart, Order
+        from app.domains.orders.schemas import OrderCheckoutRequest
+        from app.domains.orders.service import OrderService
+
+        books = self._create_books(test_db, 3)
+        test_db.add_all([Cart(user_id=1, book_id=book.id, quantity=i + 1) for i, book in enumerate(books)])
+        test_db.add(Cart(user_id=2, book_id=books[0].id, quantity=1))
+        test_db.commit()
+        coupon = self._create_coupon(test_db, user_id=1)
+
+        # 쿠폰 검증 실패 시 장바구니는 그대로 유지
+        with pytest.raises(NotFoundException):
+            OrderService.checkout(test_db, 1, OrderCheckoutRequest(coupon_id=99999, shipping_address="서울시 강남구"))
+        assert test_db.query(Cart).filter(Cart.user_id == 1, Cart.deleted_at.is_(None)).count() == 3
+
+        order = OrderService.checkout(
+            test_db, 1, OrderCheckoutRequest(coupon_id=coupon.id, shipping_address="서울시 강남구")
+        )
+        assert order.total_price == Decimal("60000")
+        assert order.final_price == Decimal("54000")
+        assert len(order.items) == 3
+        assert test_db.query(Cart).filter(Cart.user_id == 1, Cart.deleted_at.is_(None)).count() == 0
+        assert test_db.query(Cart).filter(Cart.user_id == 2, Cart.deleted_at.is_(None)).count() == 1
+
+        with pytest.raises(BadRequestException) as exc:
+            OrderService.checkout(test_db, 1, OrderCheckoutRequest(shipping_address="서울시 강남구"))
+        assert exc.value.error_code == "CART_EMPTY"
+        assert test_db.query(Order).count() == 1
+
+    def test_order_reads_query_count(self, test_db, query_counter):
+        """주문 목록/상세 조회 쿼리 수가 주문/항목 수와 무관한지 테스트"""
+        from app.domains.orders.schemas import OrderCreateRequest, OrderResponse
+        from app.domains.orders.service import OrderService
+
+        books = self._create_books(test_db, 5)
+        coupon_id = self._create_coupon(test_db, user_id=1).id
+        for i in range(6):
+            OrderService.create_order(test_db, 1, OrderCreateRequest(
+                items=[{"book_id": book.id, "quantity": 1} for book in books[:i + 1]],
+                coupon_id=coupon_id if i == 0 else None,
+                shipping_address="서울시 강남구 테헤란로 123"
+            ))
+        test_db.expire_all()
+
+        query_counter.reset()
+        orders, total, _ = OrderService.get_orders(test_db, 1, size=10, sort_order="asc")
+        assert query_counter.count == 5  # count + page + 항목 + 도서 + 쿠폰 이름
+        assert total == 6
+        assert [len(order.items) for order in orders] == [1, 2, 3, 4, 5, 5]
+        assert orders[0].coupon_code == "신규회원10"
+        assert all(order.coupon_code is None for order in orders[1:])
+        responses = [OrderResponse.model_validate(order) for order in orders]
+        assert responses[-1].items[0].book_title.startswith("Order Book")
+        assert query_counter.count == 5
+
+        order_id = orders[0].id
+        test_db.expire_all()
+        query_counter.reset()
+        order = OrderService.get_order(test_db, order_id, 1)
+        assert query_counter.count == 4  # 주문 + 항목 + 도서 + 쿠폰 이름
+        assert order.coupon_code == "신규회원10"
+        assert order.items[0].subtotal == Decimal("10000")
+
+    def test_list_orders_count_modes(self, test_db):
+        """주문 목록 응답의 전체 개수 조회 방식(none/estimate) 테스트"""
+        from app.core.auth_cache import Principal
+        from app.core.pagination import count_cache
+        from app.domains.orders.router import get_orders
+        from app.models import Gender, Order, OrderStatus, User, UserRole
+
+        user = User(email="count@test.com", password="hashed", name="Count", birth_date=date(1990, 1, 1), gender=Gender.MALE)
+        test_db.add(user)
+        test_db.commit()
+        principal = Principal(id=user.id, role=UserRole.CUSTOMER, name=user.name)
+
+        def add_orders(count):
+            test_db.add_all([
+                Order(
+                    user_id=user.id, status=OrderStatus.PENDING, total_price=Decimal("10000"),
+                    final_price=Decimal("10000"), shipping_address="서울시 강남구"
+                )
+                for _ in range(count)
+            ])
+            test_db.commit()
+
+        def list_orders(count, page=1, size=2):
+            return get_orders(
+                status=None, page=page, size=size, cursor=None, count=count,
+                db=test_db, current_user=principal, sort_params=None
+            ).payload
+
+        count_cache.clear()
+        add_orders(5)
+
+        first, last = list_orders("none"), list_orders("none", page=3)
+        assert (first.total_elements, first.total_pages, first.has_next) == (None, None, True)
+        assert (last.total_elements, last.total_pages, last.has_next) == (None, None, False)
+        assert len(last.content) == 1 and last.count_mode == "none"
+        assert list_orders("none", size=5).has_next is False
+
+        # estimate는 TTL 동안 캐시된 개수를 사용 (행 수가 바뀌어도 이전 값)
+        assert list_orders("exact").total_elements == 5
+        add_orders(1)
+        estimated = list_orders("estimate")
+        assert (estimated.total_elements, estimated.total_pages) == (5, 3)
+        assert list_orders("exact").total_elements == 6
+        count_cache.clear()
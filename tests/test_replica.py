@@ -0,0 +1,130 @@
+"""
+Read Replica Tests
+읽기 복제본 라우팅 테스트 (primary/replica SQLite 파일 2개 사용)
+"""
+import asyncio
+import contextvars
+import itertools
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, RoutingSession, is_primary_forced, use_primary
+
+
+@pytest.fixture
+def engines(tmp_path):
+    from app.models import Book
+
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine, title in ((primary, "Primary Book"), (replica, "Replica Book")):
+        Base.metadata.create_all(engine)
+        with sessionmaker(bind=engine)() as db:
+            db.add(Book(
+                seller_id=1,
+                title=title,
+                author="Author",
+                publisher="Publisher",
+                isbn="9780000000400",
+                price=Decimal("10000"),
+                publication_date=date(2024, 1, 1)
+            ))
+            db.commit()
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+class TestReplicaRouting:
+    """조회/쓰기 세션 라우팅 테스트"""
+
+    def test_reads_go_to_replica_until_write(self, engines):
+        """조회는 replica, 쓰기 이후 같은 세션의 조회는 primary 사용"""
+        from app.models import Book
+
+        primary, replica = engines
+        factory = sessionmaker(class_=RoutingSession, primary=primary, replicas=itertools.cycle([replica]))
+
+        with factory() as db:
+            assert db.scalar(select(Book.title)) == "Replica Book"
+            assert db.wrote is False
+
+            db.execute(update(Book).values(price=Decimal("12000")))
+            assert db.wrote is True
+            assert db.scalar(select(Book.title)) == "Primary Book"
+            db.commit()
+
+        with factory() as db:
+            db.add(Book(
+                seller_id=1,
+                title="New Book",
+                author="Author",
+                publisher="Publisher",
+                isbn="9780000000401",
+                price=Decimal("10000"),
+                publication_date=date(2024, 1, 1)
+            ))
+            db.commit()
+            assert db.query(Book).count() == 2
+
+        with factory() as db:
+            assert db.query(Book.title).order_by(Book.id).with_for_update().first() == ("Primary Book",)
+
+        with sessionmaker(bind=replica)() as db:
+            assert db.query(Book).count() == 1
+            assert db.scalar(select(Book.price)) == Decimal("10000")
+
+    def test_primary_override_and_fallback(self, engines):
+        """use_primary() 컨텍스트 및 replica 미설정 시 primary 사용"""
+        from app.models import Book
+
+        primary, replica = engines
+        factory = sessionmaker(class_=RoutingSession, primary=primary, replicas=itertools.cycle([replica]))
+
+        def read_forced():
+            use_primary()
+            with factory() as db:
+                return db.scalar(select(Book.title))
+
+        assert contextvars.copy_context().run(read_forced) == "Primary Book"
+        assert is_primary_forced() is False
+
+        with sessionmaker(class_=RoutingSession, primary=primary)() as db:
+            assert db.scalar(select(Book.title)) == "Primary Book"
+
+    async def test_middleware_sticks_writes_to_primary(self, monkeypatch):
+        """쓰기 요청과 쓰기 직후 요청은 primary 고정, 쓰기 성공 시 쿠키 발급"""
+        from starlette.requests import Request
+        from starlette.responses import Response
+        from app.middleware import replica as replica_middleware
+
+        monkeypatch.setattr(replica_middleware, "replica_engines", [object()])
+
+        async def dispatch(method, cookie=None):
+            headers = [(b"cookie", f"{replica_middleware.PRIMARY_STICKY_COOKIE}={cookie}".encode())] if cookie else []
+            request = Request({"type": "http", "method": method, "path": "/", "headers": headers, "query_string": b""})
+            seen = {}
+
+            async def call_next(_):
+                seen["primary"] = is_primary_forced()
+                return Response(status_code=200)
+
+            # 요청마다 별도 컨텍스트에서 실행 (서버의 요청 처리와 동일)
+            response = await asyncio.create_task(
+                replica_middleware.replica_routing_middleware(request, call_next),
+                context=contextvars.copy_context()
+            )
+            return seen["primary"], response.headers.get("set-cookie")
+
+        assert await dispatch("GET") == (False, None)
+
+        forced, set_cookie = await dispatch("POST")
+        assert forced is True
+        assert set_cookie.startswith(f"{replica_middleware.PRIMARY_STICKY_COOKIE}=1")
+
+        assert (await dispatch("GET", cookie="1"))[0] is True
+        assert (await dispatch("GET"))[0] is False
@@ -0,0 +1,214 @@
+"""
+Response Cache Tests
+비로그인 조회 응답 캐시, 태그 무효화, ETag 조건부 요청 테스트
+"""
+import pytest
+from datetime import date
+from decimal import Decimal
+from starlette.requests import Request
+
+
+def _request(query: str = "", headers: dict = None) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/books",
+        "query_string": query.encode(),
+        "headers": raw_headers,
+    })
+
+
+class FakeRedis:
+    """응답 캐시 백엔드가 사용하는 Redis 명령만 구현한 프로세스 내 클라이언트"""
+
+    def __init__(self):
+        self._values: dict[str, object] = {}
+
+    def get(self, key):
+        return self._values.get(key)
+
+    def set(self, key, value, ex=None):
+        self._values[key] = value
+
+    def mget(self, keys):
+        return [self._values.get(key) for key in keys]
+
+    def incr(self, key):
+        self._values[key] = int(self._values.get(key, 0)) + 1
+        return self._values[key]
+
+    def delete(self, *keys):
+        for key in keys:
+            self._values.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in list(self._values) if key.startswith(prefix)]
+
+
+@pytest.fixture
+def response_cache():
+    from app.core.response_cache import response_cache
+
+    response_cache.clear()
+    yield response_cache
+    response_cache.clear()
+
+
+class TestResponseCache:
+    """응답 캐시 테스트"""
+
+    def test_key_normalization(self):
+        """쿼리 파라미터 순서와 빈 값에 관계없이 같은 키인지 테스트"""
+        from app.core.response_cache import ResponseCache
+
+        assert ResponseCache.key_for(_request("size=10&page=1&keyword=")) == ResponseCache.key_for(_request("page=1&size=10"))
+        assert ResponseCache.key_for(_request("page=2")) != ResponseCache.key_for(_request("page=1"))
+
+    async def test_cached_endpoint(self, response_cache):
+        """캐시 적중, 304 응답, 인증 요청 우회, 태그 무효화 테스트"""
+        from app.core.response_cache import cached_response, book_tag
+        from app.domains.base import BaseResponse
+
+        calls = []
+
+        @cached_response(tags=lambda kwargs: [book_tag(kwargs["book_id"])])
+        async def endpoint(book_id: int, request: Request):
+            calls.append(book_id)
+            return BaseResponse(is_success=True, message="조회", payload={"id": book_id, "title": "캐시"})
+
+        miss = await endpoint(book_id=1, request=_request())
+        assert miss.headers["x-cache"] == "MISS"
+        etag = miss.headers["etag"]
+
+        hit = await endpoint(book_id=1, request=_request())
+        assert hit.headers["x-cache"] == "HIT"
+        assert hit.body == miss.body
+        assert b'"title":"\xec\xba\x90\xec\x8b\x9c"' in hit.body
+        assert calls == [1]
+
+        not_modified = await endpoint(book_id=1, request=_request(headers={"If-None-Match": f'"other", W/{etag}'}))
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+        assert calls == [1]
+
+        # 로그인 사용자는 사용자별 응답이므로 캐시하지 않음
+        authorized = await endpoint(book_id=1, request=_request(headers={"Authorization": "Bearer token"}))
+        assert isinstance(authorized, BaseResponse)
+        assert calls == [1, 1]
+
+        # 다른 태그 무효화는 영향 없음, 같은 태그 무효화 후에는 다시 조회
+        response_cache.invalidate(book_tag(2))
+        assert (await endpoint(book_id=1, request=_request())).headers["x-cache"] == "HIT"
+        response_cache.invalidate(book_tag(1))
+        assert (await endpoint(book_id=1, request=_request())).headers["x-cache"] == "MISS"
+        assert calls == [1, 1, 1]
+
+    async def test_async_endpoint_off_loop(self, response_cache, monkeypatch):
+        """비동기 엔드포인트가 캐시 백엔드와 on_hit을 이벤트 루프 스레드에서 호출하지 않는지 테스트"""
+        import threading
+        from app.core.response_cache import RedisResponseCacheBackend, book_tag, cached_response
+
+        threads = []
+
+        class RecordingRedis(FakeRedis):
+            def get(self, key):
+                threads.append(threading.get_ident())
+                return super().get(key)
+
+            def set(self, key, value, ex=None):
+                threads.append(threading.get_ident())
+                super().set(key, value, ex)
+
+            def mget(self, keys):
+                threads.append(threading.get_ident())
+                return super().mget(keys)
+
+        monkeypatch.setattr(response_cache, "backend", RedisResponseCacheBackend(ttl=30, client=RecordingRedis()))
+
+        @cached_response(
+            tags=lambda kwargs: [book_tag(kwargs["book_id"])],
+            on_hit=lambda kwargs: threads.append(threading.get_ident())
+        )
+        async def endpoint(book_id: int, request: Request):
+            return {"id": book_id}
+
+        assert (await endpoint(book_id=1, request=_request())).headers["x-cache"] == "MISS"
+        assert (await endpoint(book_id=1, request=_request())).headers["x-cache"] == "HIT"
+        assert threads
+        assert threading.get_ident() not in threads
+
+    def test_sync_endpoint_condition(self, response_cache):
+        """동기 엔드포인트 캐시 및 condition 미충족 시 우회 테스트"""
+        from app.core.response_cache import cached_response
+
+        calls = []
+
+        @cached_response(tags=lambda kwargs: ["reviews"], condition=lambda kwargs: kwargs["book_id"] is not None)
+        def endpoint(request: Request, book_id=None):
+            calls.append(book_id)
+            return {"book_id": book_id}
+
+        endpoint(request=_request("book_id=3"), book_id=3)
+        assert endpoint(request=_request("book_id=3"), book_id=3).headers["x-cache"] == "HIT"
+        assert endpoint(request=_request(), book_id=None) == {"book_id": None}
+        endpoint(request=_request(), book_id=None)
+        assert calls == [3, None, None]
+
+    def test_shared_backend(self):
+        """공유 백엔드에서 한 워커의 무효화가 다른 워커에 반영되는지 테스트"""
+        from app.core.response_cache import RedisResponseCacheBackend, ResponseCache
+
+        redis = FakeRedis()
+        workers = [ResponseCache(RedisResponseCacheBackend(ttl=30, client=redis)) for _ in range(2)]
+        tags = ["books"]
+
+        entry, versions = workers[0].lookup("/api/books?", tags)
+        assert entry is None
+        stored = workers[0].store("/api/books?", versions, '{"title":"공유"}'.encode())
+
+        entry, _ = workers[1].lookup("/api/books?", tags)
+        assert entry.body == stored.body and entry.etag == stored.etag
+
+        workers[1].invalidate("books")
+        assert workers[0].lookup("/api/books?", tags)[0] is None
+
+    def test_service_invalidation(self, test_db, response_cache):
+        """도서/리뷰 변경 서비스가 관련 태그를 무효화하는지 테스트"""
+        from app.models import Book, Gender, User
+        from app.models.review import Review, ReviewLikeCount
+        from app.domains.books import schemas, service
+        from app.domains.reviews.service import ReviewService
+        from app.core.response_cache import BOOK_LIST_TAG, book_reviews_tag, book_tag
+
+        def versions(*tags):
+            return response_cache.backend.tag_versions(list(tags))
+
+        user = User(email="cache@test.com", password="hashed", name="Cache User", birth_date=date(1990, 1, 1), gender=Gender.MALE)
+        test_db.add(user)
+        test_db.commit()
+
+        book = service.create_book(test_db, schemas.BookCreateRequest(
+            title="Cache Book", author="Author", publisher="Publisher", isbn="9780000000401",
+            price=Decimal("10000"), publication_date=date(2024, 1, 1)
+        ), user.id)
+        assert versions(BOOK_LIST_TAG, book_tag(book.id)) == [1, 0]
+
+        service.update_book(test_db, book.id, schemas.BookUpdateRequest(title="Renamed"), user.id, "SELLER")
+        assert versions(BOOK_LIST_TAG, book_tag(book.id)) == [2, 1]
+
+        review = Review(user_id=user.id, book_id=book.id, order_id=1, rating=5, comment="good")
+        test_db.add(review)
+        test_db.flush()
+        test_db.add(ReviewLikeCount(review_id=review.id, like_count=0))
+        test_db.commit()
+
+        ReviewService.toggle_like(test_db, review.id, user.id)
+        assert versions(book_reviews_tag(book.id)) == [1]
+        # 리뷰 삭제는 평점 집계가 바뀌므로 도서 목록/상세도 무효화
+        ReviewService.delete_review(test_db, review.id, user.id)
+        assert versions(BOOK_LIST_TAG, book_tag(book.id), book_reviews_tag(book.id)) == [3, 2, 2]
+
+        service.delete_book(test_db, book.id, user.id, "SELLER")
+        assert versions(BOOK_LIST_TAG, book_tag(book.id), book_reviews_tag(book.id)) == [4, 3, 3]
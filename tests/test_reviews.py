@@ -0,0 +1,152 @@
+"""
+Reviews Domain Tests
+리뷰 관련 서비스 테스트
+"""
+import pytest
+from datetime import date
+
+
+class TestReviewService:
+    """리뷰 서비스 테스트"""
+
+    @staticmethod
+    def _create_reviews(test_db, count):
+        from app.models import User, Gender
+        from app.models.review import Review, ReviewLike, ReviewLikeCount
+
+        users = [
+            User(
+                email=f"reviewer{i}@test.com",
+                password="hashed",
+                name=f"Reviewer {i}",
+                birth_date=date(1990, 1, 1),
+                gender=Gender.FEMALE
+            )
+            for i in range(count)
+        ]
+        test_db.add_all(users)
+        test_db.flush()
+
+        reviews = [
+            Review(user_id=user.id, book_id=1, order_id=1, rating=5, comment=f"Review {i}")
+            for i, user in enumerate(users)
+        ]
+        test_db.add_all(reviews)
+        test_db.flush()
+
+        # 첫 번째 사용자가 짝수 번째 리뷰에 좋아요
+        liked = reviews[::2]
+        test_db.add_all([ReviewLike(review_id=review.id, user_id=users[0].id) for review in liked])
+        test_db.add_all([
+            ReviewLikeCount(review_id=review.id, like_count=1 if review in liked else 0)
+            for review in reviews
+        ])
+        test_db.commit()
+        return users, reviews
+
+    def test_get_reviews_query_count(self, test_db, query_counter):
+        """리뷰 목록 조회 쿼리 수가 페이지 크기와 무관한지 테스트"""
+        from app.domains.reviews.service import ReviewService
+
+        users, reviews = self._create_reviews(test_db, 12)
+        user_id, user_names = users[0].id, {user.name for user in users}
+        test_db.expire_all()
+
+        query_counter.reset()
+        result, total, _ = ReviewService.get_reviews(
+            test_db, current_user_id=user_id, book_id=1, size=10, sort="like_count"
+        )
+
+        assert query_counter.count == 3  # count + page(좋아요 수/작성자 포함) + 좋아요 여부
+        assert total == 12
+        assert len(result) == 10
+        assert all(review.like_count == 1 and review.is_liked for review in result[:6])
+        assert all(review.like_count == 0 and not review.is_liked for review in result[6:])
+        assert {review.user_name for review in result} <= user_names
+
+    def test_get_reviews_cursor_by_created_at(self, test_db, tamper_cursor):
+        """작성일(DateTime, 중복 값 포함) 정렬 커서 페이지에 중복/누락이 없는지 테스트"""
+        from datetime import datetime
+        from app.core.exceptions import BadRequestException
+        from app.domains.reviews.service import ReviewService
+
+        _, reviews = self._create_reviews(test_db, 9)
+        for i, review in enumerate(reviews):
+            review.created_at = datetime(2025, 1, 1 + i // 4, 9, 0, 0)
+        test_db.commit()
+        review_ids = [review.id for review in reviews]
+
+        for order in ("desc", "asc"):
+            seen, cursor = [], None
+            while True:
+                result, _, cursor = ReviewService.get_reviews(
+                    test_db, current_user_id=None, book_id=1, size=4, sort="created_at", order=order, cursor=cursor
+                )
+                seen.extend(review.id for review in result)
+                if cursor is None:
+                    break
+
+            created = {review.id: review.created_at for review in reviews}
+            assert len(seen) == len(set(seen)) == len(review_ids)
+            assert seen == sorted(review_ids, key=lambda id_: (created[id_], id_), reverse=order == "desc")
+
+        _, _, first_cursor = ReviewService.get_reviews(test_db, None, book_id=1, size=4, sort="created_at")
+        for cursor, sort in ((tamper_cursor(first_cursor), "created_at"), (first_cursor, "rating"), ("%%%", "created_at")):
+            with pytest.raises(BadRequestException) as exc:
+                ReviewService.get_reviews(test_db, None, book_id=1, size=4, sort=sort, cursor=cursor)
+            assert exc.value.status_code == 400
+
+    def test_get_review_detail(self, test_db, query_counter):
+        """리뷰 상세 조회가 목록과 같은 로더를 사용하는지 테스트"""
+        from app.domains.reviews.service import ReviewService
+        from app.core.exceptions import NotFoundException
+
+        users, reviews = self._create_reviews(test_db, 2)
+        user_id, user_name, review_ids = users[0].id, users[0].name, [review.id for review in reviews]
+        test_db.expire_all()
+
+        query_counter.reset()
+        review = ReviewService.get_review(test_db, review_ids[0], user_id)
+        assert query_counter.count == 2
+        assert review.user_name == user_name
+        assert review.like_count == 1
+        assert review.is_liked is True
+
+        anonymous = ReviewService.get_review(test_db, review_ids[1], None)
+        assert anonymous.is_liked is False
+        assert anonymous.like_count == 0
+
+        with pytest.raises(NotFoundException):
+            ReviewService.get_review(test_db, 99999, None)
+
+    def test_toggle_like_and_reconcile(self, test_db):
+        """좋아요 토글 집계 갱신 및 집계 보정 테스트"""
+        from app.models.review import ReviewLike, ReviewLikeCount
+        from app.domains.reviews.service import ReviewService
+        from app.core.exceptions import NotFoundException
+
+        users, reviews = self._create_reviews(test_db, 3)
+        review_id = reviews[1].id
+
+        assert ReviewService.toggle_like(test_db, review_id, users[0].id) == (True, 1)
+        assert ReviewService.toggle_like(test_db, review_id, users[1].id) == (True, 2)
+        assert ReviewService.toggle_like(test_db, review_id, users[0].id) == (False, 1)
+
+        with pytest.raises(NotFoundException):
+            ReviewService.toggle_like(test_db, 99999, users[0].id)
+
+        # 집계 행이 없으면 좋아요 테이블 기준으로 생성
+        test_db.query(ReviewLikeCount).filter(ReviewLikeCount.review_id == review_id).delete()
+        test_db.commit()
+        assert ReviewService.toggle_like(test_db, review_id, users[2].id) == (True, 2)
+
+        # 집계 불일치 보정 (reviews[0]: 좋아요 1 → 집계 5, reviews[2]: 집계 행 없음)
+        test_db.query(ReviewLikeCount).filter(ReviewLikeCount.review_id == reviews[0].id).update({"like_count": 5})
+        test_db.query(ReviewLikeCount).filter(ReviewLikeCount.review_id == reviews[2].id).delete()
+        test_db.commit()
+
+        assert ReviewService.reconcile_like_counts(test_db) == {"created": 1, "repaired": 1}
+        counts = dict(test_db.query(ReviewLikeCount.review_id, ReviewLikeCount.like_count).all())
+        likes = {review.id: test_db.query(ReviewLike).filter(ReviewLike.review_id == review.id).count() for review in reviews}
+        assert counts == likes
+        assert ReviewService.reconcile_like_counts(test_db) == {"created": 0, "repaired": 0}
@@ -141,3 +141,39 @@ class TestAdmin:
         )
 
         assert response.status_code == 201
+
+
+class TestAdminService:
+    """관리자 서비스 테스트"""
+
+    def test_get_all_users_cursor_by_role(self, test_db):
+        """역할(enum) 정렬 커서 페이지네이션 테스트"""
+        from app.models import User, UserRole, Gender
+        from app.domains.admin.service import AdminService
+
+        roles = [UserRole.CUSTOMER, UserRole.SELLER, UserRole.ADMIN, UserRole.CUSTOMER, UserRole.SELLER]
+        test_db.add_all([
+            User(
+                email=f"user{i}@test.com",
+                password="hashed",
+                name=f"User {i}",
+                birth_date=date(1990, 1, 1),
+                gender=Gender.MALE,
+                role=role
+            )
+            for i, role in enumerate(roles)
+        ])
+        test_db.commit()
+
+        seen, cursor = [], None
+        while True:
+            users, total, cursor = AdminService.get_all_users(
+                test_db, size=2, sort_field="role", sort_order="asc", cursor=cursor
+            )
+            seen.extend((user.role.name, user.id) for user in users)
+            if cursor is None:
+                break
+
+        assert total == 5
+        assert seen == sorted(seen)
+        assert len(seen) == 5